@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark the L1 HTTP transport modes against a Provena API endpoint.
+
+Fires the same batch of concurrent GET requests through each mode and reports
+wall-clock time and latency percentiles:
+
+  single-use  A fresh httpx client per request (no HttpTransport)
+  http1       Pooled HttpTransport using HTTP/1.1 keep-alive connections
+  http2       Pooled HttpTransport with TransportSettings(http2=True), which
+              multiplexes concurrent requests over one connection per host
+
+By default targets the (unauthenticated) registry API health check for DOMAIN
+(same env vars as integration tests; optional .env via python-dotenv):
+
+  poetry run python scripts/benchmark_http_transport.py --requests 500 --concurrency 100
+
+Or any URL which does not require auth:
+
+  poetry run python scripts/benchmark_http_transport.py --url https://registry-api.example.com/
+
+The http2 mode requires the optional h2 package (``pip install provenaclient[http2]``)
+and is skipped if it is not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from provenaclient.utils.http_client import HttpTransport
+
+# Repo root on sys.path when run as ``python scripts/benchmark_http_transport.py``
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+
+def _default_url() -> str:
+    from dotenv import load_dotenv
+
+    from provenaclient.utils.config import Config
+
+    load_dotenv(_ROOT / ".env")
+    domain = os.getenv("DOMAIN")
+    realm_name = os.getenv("REALM_NAME")
+    if not domain or not realm_name:
+        print("Missing env: DOMAIN/REALM_NAME (or pass --url)", file=sys.stderr)
+        sys.exit(1)
+    return Config(domain=domain, realm_name=realm_name).registry_api_endpoint + "/"
+
+
+async def _run_mode(url: str, total: int, concurrency: int, transport: Optional["HttpTransport"]) -> List[float]:
+    from provenaclient.utils.http_client import HttpClient
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await HttpClient.make_get_request(url=url, transport=transport)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def _report(mode: str, wall: float, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{mode:<12} total {wall:7.2f}s  {len(ordered) / wall:8.1f} req/s  "
+        f"mean {statistics.mean(ordered) * 1000:7.1f}ms  p50 {p50 * 1000:7.1f}ms  p99 {p99 * 1000:7.1f}ms"
+    )
+
+
+async def _benchmark(url: str, total: int, concurrency: int, modes: List[str]) -> None:
+    from provenaclient.utils.config import TransportSettings
+    from provenaclient.utils.http_client import HttpTransport
+
+    print(f"Target: {url}\nRequests: {total}  Concurrency: {concurrency}\n")
+    for mode in modes:
+        transport: Optional[HttpTransport] = None
+        if mode == "http1":
+            transport = HttpTransport(settings=TransportSettings(max_connections=concurrency))
+        elif mode == "http2":
+            try:
+                import h2  # type: ignore # noqa: F401
+            except ImportError:
+                print(f"{mode:<12} skipped - h2 not installed (pip install provenaclient[http2])")
+                continue
+            transport = HttpTransport(settings=TransportSettings(max_connections=concurrency, http2=True))
+
+        start = time.perf_counter()
+        try:
+            latencies = await _run_mode(url=url, total=total, concurrency=concurrency, transport=transport)
+        finally:
+            if transport is not None:
+                await transport.aclose()
+        _report(mode, time.perf_counter() - start, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="URL to GET (defaults to the registry API health check for DOMAIN)")
+    parser.add_argument("--requests", type=int, default=200, help="Total number of requests per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum in-flight requests")
+    parser.add_argument(
+        "--modes", nargs="+", default=["single-use", "http1", "http2"],
+        choices=["single-use", "http1", "http2"],
+    )
+    args = parser.parse_args()
+
+    url = args.url or _default_url()
+    asyncio.run(_benchmark(url=url, total=args.requests, concurrency=args.concurrency, modes=args.modes))
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,8 @@ from typing import Optional, Any
 from datetime import datetime, timezone
 from typing import Generator, Optional, Dict, List
 from httpx import Auth, Request, Response
-from jose import jwt, JWTError # type: ignore
+import httpx
+from jose import jwk, jwt, JWTError # type: ignore
 from jose.constants import ALGORITHMS # type: ignore
 import requests
 import logging
@@ -87,33 +88,87 @@ def check_token_expiry_window(jwt_data: dict[str, Any], logger: logging.Logger,
     return False
 
 def retrieve_keycloak_public_key(keycloak_endpoint: str, logger: logging.Logger) -> str:
-        """Given the keycloak endpoint, retrieves the advertised
-        public key.
-        Based on https://github.com/nurgasemetey/fastapi-keycloak-oidc/blob/main/main.py
-        """
-        error_message = f"Error finding public key from keycloak endpoint {keycloak_endpoint}."
-        try:
-            r = requests.get(url=keycloak_endpoint,
-                             timeout=3)
-            r.raise_for_status()
-            response_json = r.json()
-            return f"-----BEGIN PUBLIC KEY-----\r\n{response_json['public_key']}\r\n-----END PUBLIC KEY-----"
-        except requests.exceptions.HTTPError as errh:
-            logger.info(error_message)
-            logger.info("Http Error:" + str(errh))
-            raise errh
-        except requests.exceptions.ConnectionError as errc:
-            logger.info(error_message)
-            logger.info("Error Connecting:" + str(errc))
-            raise errc
-        except requests.exceptions.Timeout as errt:
-            logger.info(error_message)
-            logger.info("Timeout Error:" + str(errt))
-            raise errt
-        except requests.exceptions.RequestException as err:
-            logger.info(error_message)
-            logger.info("An unknown error occured: " + str(err))
-            raise err
+    """Given the keycloak endpoint, retrieves a current token signing key
+    (from the realm's JWKS, see retrieve_keycloak_jwks).
+
+    Parameters
+    ----------
+    keycloak_endpoint : str
+        The keycloak realm endpoint.
+    logger : logging.Logger
+        The auth logger.
+
+    Returns
+    -------
+    str
+        The public key in PEM format.
+
+    Raises
+    ------
+    Exception
+        If the realm advertises no RS256 signing key.
+    """
+    keys = retrieve_keycloak_jwks(keycloak_endpoint=keycloak_endpoint, logger=logger)
+    if not keys:
+        raise Exception(f"No signing key found from keycloak endpoint {keycloak_endpoint}.")
+    return next(iter(keys.values()))
+
+def retrieve_keycloak_jwks(keycloak_endpoint: str, logger: logging.Logger) -> Dict[str, str]:
+    """Given the keycloak endpoint, retrieves the realm's advertised token
+    signing keys (JWKS) from the certs endpoint.
+
+    Parameters
+    ----------
+    keycloak_endpoint : str
+        The keycloak realm endpoint.
+    logger : logging.Logger
+        The auth logger.
+
+    Returns
+    -------
+    Dict[str, str]
+        The RS256 signing keys in PEM format, keyed by key id (kid).
+    """
+    certs_endpoint = f"{keycloak_endpoint}/protocol/openid-connect/certs"
+    try:
+        r = requests.get(url=certs_endpoint, timeout=3)
+        r.raise_for_status()
+        response_json = r.json()
+    except requests.exceptions.RequestException as err:
+        logger.info(f"Error finding signing keys from keycloak endpoint {certs_endpoint}.")
+        logger.info(f"{type(err).__name__}: {err}")
+        raise err
+
+    keys: Dict[str, str] = {}
+    for key in response_json.get("keys", []):
+        # skip encryption keys and keys of other algorithms
+        if key.get("kty") != "RSA" or key.get("use", "sig") != "sig" or key.get("alg", ALGORITHMS.RS256) != ALGORITHMS.RS256:
+            continue
+        if "kid" not in key:
+            continue
+        keys[key["kid"]] = jwk.construct(key, ALGORITHMS.RS256).to_pem().decode()
+    return keys
+
+
+def token_key_id(access_token: str) -> Optional[str]:
+    """Reads the (unverified) key id of the key which signed the token.
+
+    Parameters
+    ----------
+    access_token : str
+        The access token.
+
+    Returns
+    -------
+    Optional[str]
+        The kid header, or None if absent or the token is malformed.
+    """
+    try:
+        kid = jwt.get_unverified_header(access_token).get("kid")
+    except JWTError:
+        return None
+    return str(kid) if kid else None
+
 
 def keycloak_refresh_token_request(token_endpoint: str, client_id: str, scopes: List[str], refresh_token:str, logger: logging.Logger) -> Dict[str, Any]:
     """Performs the token refresh by making an HTTP post request to the token endpoint
@@ -165,24 +220,81 @@ def keycloak_refresh_token_request(token_endpoint: str, client_id: str, scopes:
     return response.json()
 
 
-def validate_access_token(public_key: str, access_token: str, logger: logging.Logger) -> bool:
-    """Uses the python-jose library to validate current creds.
+async def async_keycloak_refresh_token_request(token_endpoint: str, client_id: str, scopes: List[str], refresh_token: str, logger: logging.Logger) -> Dict[str, Any]:
+    """Performs the token refresh by making an async HTTP post request to the
+    token endpoint to obtain new access and refresh tokens, without blocking
+    the event loop.
 
-    In this context, it is basically just checking signature
-    and expiry. The tokens are enforced at the API side 
-    as well.
+    Parameters
+    ----------
+    token_endpoint : str
+        The keycloak token endpoint.
+    client_id : str
+        The client id for the keycloak authorisation.
+    scopes : List[str]
+        The scopes to request.
+    refresh_token : str
+        The refresh (or offline) token.
+    logger : logging.Logger
+        The auth logger.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary containing the new access and refresh tokens if the refresh is successful.
+
+    Raises
+    ------
+    Exception
+        If the HTTP request fails a message is displayed with the HTTP status code. Can occur 
+        if the refresh token has expired.
+    """
+
+    # Required openid connect fields
+    data = {
+        "grant_type": "refresh_token",
+        "client_id": client_id,
+        "refresh_token": refresh_token,
+        "scope": " ".join(scopes)
+    }
+
+    logger.info("Attempting to refresh token.")
+
+    async with httpx.AsyncClient() as client:
+        response = await client.post(token_endpoint, data=data)
+
+    if (not response.status_code == 200):
+        err_msg = f"The token used for refresh is invalid or has potentially expired. Something went wrong during token refresh. Status code: {response.status_code}."
+        logger.error(err_msg)
+        raise Exception(err_msg)
+
+    refreshed: Dict[str, Any] = response.json()
+    return refreshed
+
+
+def verify_access_token(public_key: str, access_token: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
+    """Uses the python-jose library to fully verify the token (RS256
+    signature and expiry), returning its claims.
 
     Parameters
     ----------
-    tokens : Optional[Tokens], optional
-        The tokens object to validate, by default None
+    public_key : str
+        The keycloak public key to verify the signature with.
+    access_token : str
+        The access token to verify.
+    logger : logging.Logger
+        The auth logger.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The verified claims, or None if the token is invalid or expired.
     """
 
     logger.info("Attempting to validate tokens.")
 
     try:
-
-        jwt_response = jwt.decode(
+        jwt_response: Dict[str, Any] = jwt.decode(
             access_token,
             public_key,
             algorithms=[ALGORITHMS.RS256],
@@ -192,17 +304,38 @@ def validate_access_token(public_key: str, access_token: str, logger: logging.Lo
                 "exp": True
             }
         )
+        return jwt_response
 
-        token_is_fresh = check_token_expiry_window(jwt_data=jwt_response, logger=logger)
+    except JWTError as e:
+        logger.info(f"Token Validation Error {e}")
+        return None
 
-        if not token_is_fresh:
-            logger.info(
-                "Token is expiring soon and need to be refreshed.")
-        else:
-            logger.info("Token validation successful.")
 
-        return token_is_fresh
+def validate_access_token(public_key: str, access_token: str, logger: logging.Logger) -> bool:
+    """Uses the python-jose library to validate current creds.
 
-    except JWTError as e:
-        logger.info(f"Token Validation Error {e}")
+    In this context, it is basically just checking signature
+    and expiry. The tokens are enforced at the API side 
+    as well.
+
+    Parameters
+    ----------
+    tokens : Optional[Tokens], optional
+        The tokens object to validate, by default None
+    """
+
+    jwt_response = verify_access_token(
+        public_key=public_key, access_token=access_token, logger=logger)
+
+    if jwt_response is None:
         return False
+
+    token_is_fresh = check_token_expiry_window(jwt_data=jwt_response, logger=logger)
+
+    if not token_is_fresh:
+        logger.info(
+            "Token is expiring soon and need to be refreshed.")
+    else:
+        logger.info("Token validation successful.")
+
+    return token_is_fresh
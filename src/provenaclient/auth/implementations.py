@@ -14,11 +14,15 @@ Date      	By	Comments
 
 from typing import Any, Dict, Optional
 from provenaclient.auth.manager import AuthManager, LogType
+import asyncio
+import hashlib
 import requests
 import webbrowser
 import time
 import os
-from provenaclient.auth.helpers import AccessToken, Tokens, keycloak_refresh_token_request, validate_access_token, retrieve_keycloak_public_key
+from provenaclient.auth.helpers import AccessToken, Tokens, async_keycloak_refresh_token_request, keycloak_refresh_token_request
+from provenaclient.auth.key_cache import PublicKeyCache
+from provenaclient.auth.token_store import DEFAULT_TOKEN_FILE, FileTokenStore, TokenStore
 import json
 from provenaclient.auth.manager import DEFAULT_LOG_LEVEL
 from provenaclient.utils.config import Config
@@ -30,8 +34,12 @@ class DeviceFlow(AuthManager):
     scopes: list
     device_endpoint: str
     token_endpoint: str
+    # the device flow always stores its tokens (by default in .tokens.json)
+    token_store: TokenStore
+    # the flows always cache the keycloak signing keys
+    key_cache: PublicKeyCache
 
-    def __init__(self, config: Config, client_id: str, log_level: Optional[LogType] = None) -> None:
+    def __init__(self, config: Config, client_id: str, log_level: Optional[LogType] = None, renewal_margin: Optional[float] = None, token_store: Optional[TokenStore] = None, lazy: bool = False) -> None:
         f""" Create and generate a DeviceFlow object. The tokens are automatically refreshed when
         accessed through the get_auth() function.
 
@@ -46,41 +54,76 @@ class DeviceFlow(AuthManager):
             The client id for the keycloak authorisation.
         log_level: Optional[LogType]
             The logging level to use - defaults to {DEFAULT_LOG_LEVEL} 
+        renewal_margin: Optional[float]
+            If set, opts in to renewing the access token in the background this many
+            seconds before it expires, while used by a ProvenaClient context (or after
+            start_background_renewal()). Defaults to None (renew lazily on request).
+        token_store: Optional[TokenStore]
+            Where the tokens are stored and shared - processes using the same store
+            share one set of tokens and refresh them one at a time. Defaults to a
+            FileTokenStore of .tokens.json in the working directory.
+        lazy: bool
+            If True, construction makes no network calls - the public key and tokens
+            are obtained on the first token request instead. Defaults to False.
         """
 
         # construct parent class and include log level
         super().__init__(log_level=log_level)
 
+        self.renewal_margin = renewal_margin
         self.keycloak_endpoint = config.keycloak_endpoint
         self.client_id = client_id
         self.scopes: list = []
-        self.file_name = ".tokens.json"
+        self.file_name = DEFAULT_TOKEN_FILE
+        self.token_store = token_store if token_store is not None else FileTokenStore(self.file_name)
+        self.token_store_key = f"{self.keycloak_endpoint}#{self.client_id}"
         self.device_endpoint = f'{self.keycloak_endpoint}/protocol/openid-connect/auth/device'
         self.token_endpoint = f'{self.keycloak_endpoint}/protocol/openid-connect/token'
 
+        # signing keys are cached (and persisted) so that a cold start needs no network call
+        self.key_cache = PublicKeyCache(
+            keycloak_endpoint=self.keycloak_endpoint,
+            settings=config.key_cache_settings,
+            logger=self.logger,
+        )
+
+        # the public key and tokens are obtained now, or on the first token request if lazy
+        if lazy:
+            self._initialised = False
+        else:
+            self.initialise()
+
+    def initialise(self) -> None:
+        """
+        IMPLEMENTS BASE METHOD
+
+        Obtains the keycloak public key, then valid tokens - from the token
+        store if possible, otherwise by refreshing or running the device flow.
+        """
+
         try:
             # First thing to do here is obtain the keycloak public key.
-            self.public_key = retrieve_keycloak_public_key(
-                logger=self.logger,
-                keycloak_endpoint=self.keycloak_endpoint,
-            )
+            public_key = self.key_cache.public_key_for()
+            if public_key is None:
+                raise Exception("The realm advertises no RS256 signing keys.")
+            self.public_key = public_key
 
         except Exception as e:
             raise Exception(
                 "Failed to retrieve the Keycloak public key, authentication cannot proceed.") from e
 
-        # Second thing will be to check if the tokens.json file is already present or not.
-        # If it's present validate it, if fails then refresh else not present then fetch new tokens.
-        if os.path.exists(self.file_name):
+        # Second thing will be to check if tokens are already stored or not.
+        # If they are validate them, if that fails then refresh, else fetch new tokens.
+        # The store is locked throughout so that processes starting together refresh once.
+        with self.token_store_lock():
             self.tokens = self.load_tokens()
             if not self.tokens:
                 self.logger.info(
-                    "No tokens found or failed to load tokens.")
+                    "No tokens found or failed to load tokens, starting device flow.")
                 self.start_device_flow()
             else:
                 # Attempt to validate tokens
-                if validate_access_token(
-                    logger=self.logger,
+                if self.validate_token(
                     access_token=self.tokens.access_token,
                     public_key=self.public_key
                 ):
@@ -92,9 +135,6 @@ class DeviceFlow(AuthManager):
                         self.logger.info(
                             f"Refresh token has expired or is invalid {e}")
                         self.start_device_flow()
-        else:
-            self.logger.info("No token file found, starting device flow.")
-            self.start_device_flow()
 
     def get_token(self) -> str:
         """
@@ -120,38 +160,127 @@ class DeviceFlow(AuthManager):
             If the token validation still fails after re-conducting the device flow.
         """
 
+        # lazy managers obtain the public key and tokens on the first request
+        self.ensure_initialised()
+
         if self.tokens is None or self.public_key is None:
             raise Exception(
                 "Cannot generate token without access token or public key.")
 
-        try:
-            # Attempt to validate the current token.
-            if validate_access_token(public_key=self.public_key, access_token=self.tokens.access_token, logger=self.logger):
-                return self.tokens.access_token
+        # fast path - validating the current (already verified) token needs no lock
+        if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+            return self.tokens.access_token
+
+        # only one thread (or process sharing the token store) refreshes at a time - the
+        # others wait, then find the refreshed token valid
+        with self.sync_refresh_guard(), self.token_store_lock():
+            try:
+                # Attempt to validate the current token, or one another process has since stored.
+                self.adopt_stored_tokens()
+                if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
             
-            # didnt return, refresh and try again. 
-            self.logger.info("Token was invalid. Attempting Refresh")
-            self.refresh_tokens()
-            if validate_access_token(public_key=self.public_key, access_token=self.tokens.access_token, logger=self.logger):
-                return self.tokens.access_token
+                # didnt return, refresh and try again. 
+                self.logger.info("Token was invalid. Attempting Refresh")
+                self.refresh_tokens()
+                if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
             
-            # still no good, restart flow
-            self.logger.info("Token was invalid after refresh. Re-iniating Device Flow")
-            self.start_device_flow()
-            if validate_access_token(public_key=self.public_key, access_token=self.tokens.access_token, logger=self.logger):
-                return self.tokens.access_token
+                # still no good, restart flow
+                self.logger.info("Token was invalid after refresh. Re-iniating Device Flow")
+                self.start_device_flow()
+                if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
 
-        except Exception as e:
-            self.logger.info("Something went wrong during get_token operation. Starting device flow.")
-            self.start_device_flow()
-            if validate_access_token(public_key=self.public_key, access_token=self.tokens.access_token, logger=self.logger):
-                return self.tokens.access_token
+            except Exception as e:
+                self.logger.info("Something went wrong during get_token operation. Starting device flow.")
+                self.start_device_flow()
+                if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
         
+            # no error, but also no valid token. Something is wrong.
+            err_msg = "Failed to obtain a valid token after refreshing and initiating a new device flow."
+            self.logger.error(err_msg)
+            raise Exception(err_msg)
+
+    async def async_get_token(self) -> str:
+        """
+        IMPLEMENTS BASE METHOD
+
+        The async equivalent of get_token - the token refresh is made with an
+        async http client so that it does not block the event loop. The
+        interactive device flow (if needed) runs in a worker thread.
+
+        Returns
+        -------
+        str
+            The access token
+
+        Raises
+        ------
+        Exception
+            Raises exception if tokens/public_key are not setup - make sure
+            that the object is instantiated properly before calling this function.
+        Exception
+            If the token validation still fails after re-conducting the device flow.
+        """
+
+        # lazy managers obtain the public key and tokens on the first request
+        await self.async_ensure_initialised()
+
+        if self.tokens is None or self.public_key is None:
+            raise Exception(
+                "Cannot generate token without access token or public key.")
+
+        # fast path - validating the current (already verified) token needs no lock
+        if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+            return self.tokens.access_token
+
+        # coalesce concurrent refreshes into a single request
+        return await self.single_flight_refresh(self.async_refresh_access_token)
+
+    async def async_refresh_access_token(self) -> str:
+        """Obtains a valid access token (refreshing if required) - called
+        via single_flight_refresh so that only one runs at a time.
+
+        Returns
+        -------
+        str
+            The access token
+        """
+
+        assert self.tokens is not None and self.public_key is not None
+
+        async with self.async_token_store_lock():
+            try:
+                # Attempt to validate the current token, or one another process has since stored.
+                self.adopt_stored_tokens()
+                if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
+
+                # didnt return, refresh and try again.
+                self.logger.info("Token was invalid. Attempting Refresh")
+                await self.async_refresh_tokens()
+                if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
+
+                # still no good, restart flow
+                self.logger.info("Token was invalid after refresh. Re-iniating Device Flow")
+                await asyncio.to_thread(self.start_device_flow)
+                if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
+
+            except Exception as e:
+                self.logger.info("Something went wrong during get_token operation. Starting device flow.")
+                await asyncio.to_thread(self.start_device_flow)
+                if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                    return self.tokens.access_token
+
         # no error, but also no valid token. Something is wrong.
         err_msg = "Failed to obtain a valid token after refreshing and initiating a new device flow."
         self.logger.error(err_msg)
         raise Exception(err_msg)
-            
+
 
     def force_refresh(self) -> None:
         """
@@ -160,8 +289,10 @@ class DeviceFlow(AuthManager):
         """
 
         # Force refresh everything hear, so reset the tokens file and re-generate the device flow.
-        self.clear_token_storage()
-        self.start_device_flow()
+        self.ensure_initialised()
+        with self.token_store_lock():
+            self.clear_token_storage()
+            self.start_device_flow()
 
     def refresh_tokens(self) -> None:
         """Attempts to refresh the authentication tokens using a stored refresh token. This method
@@ -183,6 +314,70 @@ class DeviceFlow(AuthManager):
         self.logger.info("Refreshing using refresh token")
 
         refreshed: Dict[str, Any] = self.make_token_refresh_request()
+        self.store_refreshed_tokens(refreshed)
+
+    async def async_refresh_tokens(self) -> None:
+        """The async equivalent of refresh_tokens, which does not block the event loop.
+
+        Raises
+        ------
+        ValueError
+            If no initial tokens are set, indicating that there is nothing to refresh. 
+        ValueError
+            If the refresh operation fails due to missing access or refresh tokens in the response,
+            suggesting a failure in the refresh process.
+        """
+
+        if self.tokens is None:
+            raise ValueError(
+                "Token refresh attempted with no initial tokens set. ")
+
+        self.logger.info("Refreshing using refresh token")
+
+        refreshed: Dict[str, Any] = await async_keycloak_refresh_token_request(
+            logger=self.logger,
+            client_id=self.client_id,
+            refresh_token=self.refresh_token_for(),
+            scopes=self.scopes,
+            token_endpoint=self.token_endpoint
+        )
+        self.store_refreshed_tokens(refreshed)
+
+    async def async_renew_access_token(self) -> str:
+        """
+        IMPLEMENTS BASE METHOD
+
+        Renews the access token using the refresh token (never the interactive
+        device flow), for background renewal. If another process sharing the
+        token store has already renewed it, its tokens are used instead.
+
+        Returns
+        -------
+        str
+            The new access token
+        """
+        async with self.async_token_store_lock():
+            current = self.tokens.access_token if self.tokens else None
+            self.adopt_stored_tokens()
+            assert self.tokens is not None
+            if self.tokens.access_token != current and await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+                return self.tokens.access_token
+            await self.async_refresh_tokens()
+            return self.tokens.access_token
+
+    def store_refreshed_tokens(self, refreshed: Dict[str, Any]) -> None:
+        """Validates the refresh response and stores (and saves) the new tokens.
+
+        Parameters
+        ----------
+        refreshed : Dict[str, Any]
+            The token endpoint response.
+
+        Raises
+        ------
+        ValueError
+            If the response is missing the access or refresh token.
+        """
 
         access_token = refreshed.get('access_token')
         refresh_token = refreshed.get('refresh_token')
@@ -198,8 +393,17 @@ class DeviceFlow(AuthManager):
             )
             self.save_tokens(self.tokens)
 
+    def adopt_stored_tokens(self) -> None:
+        """Replaces the current tokens with the stored tokens (if any), which
+        may have been refreshed by another process sharing the token store.
+        Should be called while holding the token store lock.
+        """
+        stored = self.load_tokens()
+        if stored is not None:
+            self.tokens = stored
+
     def save_tokens(self, tokens: Tokens) -> None:
-        """Saves authentication tokens to a local file in JSON format.
+        """Saves authentication tokens to the token store (by default a local file in JSON format).
 
         Parameters
         ----------
@@ -217,25 +421,23 @@ class DeviceFlow(AuthManager):
 
         try:
 
-            with open(self.file_name, 'w') as file:
-                json.dump(tokens.dict(), file)
-                self.logger.info("Tokens saved to file successfully.")
+            self.token_store.save(self.token_store_key, tokens)
+            self.logger.info("Tokens saved to file successfully.")
 
         except Exception as e:
             print(f"Failed to save tokens: {e}")
 
     def clear_token_storage(self) -> None:
-        """Checks if the tokens.json file exists and accordingly removes it and resets
+        """Removes any stored tokens from the token store and accordingly resets
         token object saved to class variable.
         """
-        if os.path.exists("tokens.json"):
-            os.remove("tokens.json")
-            self.logger.info("Stored tokens have been clear.")
+        self.token_store.clear(self.token_store_key)
+        self.logger.info("Stored tokens have been clear.")
 
         self.tokens = None
 
     def load_tokens(self) -> Optional[Tokens]:
-        """Loads authentication tokens from a local JSON file and returns them as a Tokens object.
+        """Loads authentication tokens from the token store and returns them as a Tokens object.
 
         Returns
         -------
@@ -253,9 +455,7 @@ class DeviceFlow(AuthManager):
         self.logger.info("Looking for existing tokens in local storage.")
 
         try:
-            with open(self.file_name, 'r') as file:
-                token_data = json.load(file)
-                return Tokens(**token_data)
+            return self.token_store.load(self.token_store_key)
         except Exception as e:
             print(f"Failed to load tokens: {e}")
             return None
@@ -286,6 +486,34 @@ class DeviceFlow(AuthManager):
             if the refresh token has expired.
         """
 
+        return keycloak_refresh_token_request(
+            logger=self.logger,
+            client_id=self.client_id,
+            refresh_token=self.refresh_token_for(tokens),
+            scopes=self.scopes,
+            token_endpoint=self.token_endpoint
+        )
+
+    def refresh_token_for(self, tokens: Optional[Tokens] = None) -> str:
+        """Selects the refresh token to use - from the provided tokens, or
+        otherwise the class variable stored tokens.
+
+        Parameters
+        ----------
+        tokens : Optional[Tokens], optional
+            An optional Tokens object containing the refresh token, by default None.
+
+        Returns
+        -------
+        str
+            The refresh token.
+
+        Raises
+        ------
+        ValueError
+            If no refresh token is provided or found in the class token variable. 
+        """
+
         # make sure we have tokens to use
         desired_tokens: Optional[Tokens]
         if tokens:
@@ -296,13 +524,7 @@ class DeviceFlow(AuthManager):
         if not desired_tokens or not desired_tokens.refresh_token:
             raise ValueError("Refresh token is required but was not provided.")
 
-        return keycloak_refresh_token_request(
-            logger=self.logger,
-            client_id=self.client_id,
-            refresh_token=desired_tokens.refresh_token,
-            scopes=self.scopes,
-            token_endpoint=self.token_endpoint
-        )
+        return desired_tokens.refresh_token
 
     def start_device_flow(self) -> None:
         """Initiates the device authorisation flow by requesting a device code from server and prompts
@@ -443,7 +665,9 @@ class OfflineFlow(AuthManager):
 
     public_key: str
 
-    def __init__(self, config: Config, client_id: str, offline_token: Optional[str] = None, offline_token_file: Optional[str] = None, log_level: Optional[LogType] = None) -> None:
+    key_cache: PublicKeyCache
+
+    def __init__(self, config: Config, client_id: str, offline_token: Optional[str] = None, offline_token_file: Optional[str] = None, log_level: Optional[LogType] = None, renewal_margin: Optional[float] = None, token_store: Optional[TokenStore] = None, lazy: bool = False) -> None:
         f"""Create and generate an OfflineFlow object. Instatiate from provided offline token, or attempt to read
         one from file and generate the access token. Can provide the offline token directly, a file for it stored as plain text.
 
@@ -457,6 +681,19 @@ class OfflineFlow(AuthManager):
             The offline token to use for generating access tokens from. If not provided, defaults to None and init will try use offline_token_file to read an offline_token.
         offline_token_file : Optional[str], optional
             The file name to read the offline token from, where it is stored as plain text. Be sure to add this file to your .gitignore if using this parameter.
+        renewal_margin : Optional[float], optional
+            If set, opts in to renewing the access token in the background this many
+            seconds before it expires, while used by a ProvenaClient context (or after
+            start_background_renewal()). Defaults to None (renew lazily on request).
+        token_store : Optional[TokenStore], optional
+            If set, the access token is shared through this store (e.g. a FileTokenStore) with
+            every process using the same offline token, so that only one of them exchanges the
+            offline token at a time. The offline token itself is never stored. Defaults to None
+            (each process exchanges the offline token independently).
+        lazy : bool, optional
+            If True, construction makes no network calls - the public key is retrieved and the
+            offline token exchanged on the first token request instead (which then raises any
+            failure). Defaults to False.
 
         Raises
         ------
@@ -470,21 +707,19 @@ class OfflineFlow(AuthManager):
         # construct parent class and include log level
         super().__init__(log_level=log_level)
 
+        self.renewal_margin = renewal_margin
         self.keycloak_endpoint = config.keycloak_endpoint
         self.client_id = client_id
         self.scopes: list = []
 
         self.token_endpoint = f'{self.keycloak_endpoint}/protocol/openid-connect/token'
 
-        try:
-            # First thing to do here is obtain the keycloak public key.
-            self.public_key = retrieve_keycloak_public_key(
-                logger=self.logger,
-                keycloak_endpoint=self.keycloak_endpoint,
-            )
-        except Exception as e:
-            raise Exception(
-                "Failed to retrieve the Keycloak public key, authentication cannot proceed.") from e
+        # signing keys are cached (and persisted) so that a cold start needs no network call
+        self.key_cache = PublicKeyCache(
+            keycloak_endpoint=self.keycloak_endpoint,
+            settings=config.key_cache_settings,
+            logger=self.logger,
+        )
 
         if not offline_token and not offline_token_file:
             err_msg = "Please provide a value or offline_token or offline_token_file."
@@ -504,9 +739,48 @@ class OfflineFlow(AuthManager):
             self.logger.error(err_msg)
             raise ValueError(err_msg)
 
-        # Ok, got an offline token, now generate an temporary access token from it
+        # keyed by a hash so the offline token is never written to the store
+        self.token_store = token_store
+        self.token_store_key = hashlib.sha256(
+            f"{self.keycloak_endpoint}#{self.client_id}#{self.offline_token}".encode()).hexdigest()
+
+        # the public key and access token are obtained now, or on the first token request if lazy
+        if lazy:
+            self._initialised = False
+        else:
+            self.initialise()
+
+    def initialise(self) -> None:
+        """
+        IMPLEMENTS BASE METHOD
+
+        Obtains the keycloak public key, then an access token - from the token
+        store if possible, otherwise by exchanging the offline token.
+
+        Raises
+        ------
+        Exception
+            Fails to retrive public key from keycloak endpoint.
+        Exception
+            Fails to generate a valid access token from the offline token.
+        """
+
         try:
-            self.get_access_token_from_offline_token()
+            # First thing to do here is obtain the keycloak public key.
+            public_key = self.key_cache.public_key_for()
+            if public_key is None:
+                raise Exception("The realm advertises no RS256 signing keys.")
+            self.public_key = public_key
+        except Exception as e:
+            raise Exception(
+                "Failed to retrieve the Keycloak public key, authentication cannot proceed.") from e
+
+        # Ok, got an offline token, now generate an temporary access token from it (unless
+        # another process sharing the token store already has)
+        try:
+            with self.token_store_lock():
+                if not self.adopt_stored_access_token():
+                    self.get_access_token_from_offline_token()
         except Exception as e:
             err_msg = "Failed to validate new tokens generated from offline token file."
             self.logger.error(err_msg)
@@ -536,33 +810,109 @@ class OfflineFlow(AuthManager):
             If the token validation still fails after re-conducting the device flow.
         """
 
+        # lazy managers obtain the public key and tokens on the first request
+        self.ensure_initialised()
+
         if self.tokens is None or self.public_key is None:
             raise Exception(
                 "Cannot generate token without access token or public key.")
 
-        try:
-            # Attempt to validate the current token.
-            if validate_access_token(
-                    logger=self.logger,
-                access_token=self.tokens.access_token,
-                public_key=self.public_key
-            ):
-                return self.tokens.access_token
-            else:
-                self.logger.info("Token was invalid. Attempting Refresh")
-                # refresh with refresh token and attempt re validation
-                self.get_access_token_from_offline_token()
-                if validate_access_token(
-                    logger=self.logger,
+        # fast path - validating the current (already verified) token needs no lock
+        if self.validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+            return self.tokens.access_token
+
+        # only one thread (or process sharing the token store) refreshes at a time - the
+        # others wait, then find the refreshed token valid
+        with self.sync_refresh_guard(), self.token_store_lock():
+            try:
+                # Attempt to validate the current token, or one another process has since stored.
+                if self.validate_token(
                     access_token=self.tokens.access_token,
                     public_key=self.public_key
-                ):
+                ) or self.adopt_stored_access_token():
                     return self.tokens.access_token
-                # still here, error
-                err_msg = "Failed to produce a valid access token from the offline token."
+                else:
+                    self.logger.info("Token was invalid. Attempting Refresh")
+                    # refresh with refresh token and attempt re validation
+                    self.get_access_token_from_offline_token()
+                    if self.validate_token(
+                        access_token=self.tokens.access_token,
+                        public_key=self.public_key
+                    ):
+                        return self.tokens.access_token
+                    # still here, error
+                    err_msg = "Failed to produce a valid access token from the offline token."
+                    self.logger.error(err_msg)
+                    raise Exception(
+                        err_msg)
+            except Exception as e:
+                err_msg = "Failed to refresh token."
                 self.logger.error(err_msg)
-                raise Exception(
-                    err_msg)
+                raise Exception(err_msg) from e
+
+    async def async_get_token(self) -> str:
+        """
+        IMPLEMENTS BASE METHOD
+
+        The async equivalent of get_token - the token refresh is made with an
+        async http client so that it does not block the event loop.
+
+        Returns
+        -------
+        str
+            The access token
+
+        Raises
+        ------
+        Exception
+            Raises exception if tokens/public_key are not setup - make sure 
+            that the object is instantiated properly before calling this function.
+        Exception
+            If the token is invalid and cannot be refreshed.
+        """
+
+        # lazy managers obtain the public key and tokens on the first request
+        await self.async_ensure_initialised()
+
+        if self.tokens is None or self.public_key is None:
+            raise Exception(
+                "Cannot generate token without access token or public key.")
+
+        # fast path - validating the current (already verified) token needs no lock
+        if await self.async_validate_token(public_key=self.public_key, access_token=self.tokens.access_token):
+            return self.tokens.access_token
+
+        # coalesce concurrent refreshes into a single request
+        return await self.single_flight_refresh(self.async_refresh_access_token)
+
+    async def async_refresh_access_token(self) -> str:
+        """Obtains a valid access token (refreshing if required) - called
+        via single_flight_refresh so that only one runs at a time.
+
+        Returns
+        -------
+        str
+            The access token
+        """
+
+        assert self.tokens is not None and self.public_key is not None
+
+        try:
+            async with self.async_token_store_lock():
+                # Attempt to validate the current token, or one another process has since stored.
+                if await self.async_validate_token(access_token=self.tokens.access_token, public_key=self.public_key) or await self.async_adopt_stored_access_token():
+                    return self.tokens.access_token
+
+                self.logger.info("Token was invalid. Attempting Refresh")
+                # refresh with refresh token and attempt re validation
+                await self.async_get_access_token_from_offline_token()
+                if await self.async_validate_token(access_token=self.tokens.access_token, public_key=self.public_key):
+                    return self.tokens.access_token
+            # still here, error
+            err_msg = "Failed to produce a valid access token from the offline token."
+            self.logger.error(err_msg)
+            raise Exception(
+                err_msg)
         except Exception as e:
             err_msg = "Failed to refresh token."
             self.logger.error(err_msg)
@@ -578,7 +928,9 @@ class OfflineFlow(AuthManager):
         token request to be made.
         """
 
-        self.get_access_token_from_offline_token()
+        self.ensure_initialised()
+        with self.token_store_lock():
+            self.get_access_token_from_offline_token()
 
     def get_access_token_from_offline_token(self) -> None:
         tokens = keycloak_refresh_token_request(
@@ -588,7 +940,88 @@ class OfflineFlow(AuthManager):
             scopes=self.scopes,
             refresh_token=self.offline_token
         )
+        self.store_access_token(tokens)
+
+    async def async_get_access_token_from_offline_token(self) -> None:
+        """The async equivalent of get_access_token_from_offline_token, which
+        does not block the event loop."""
+        tokens = await async_keycloak_refresh_token_request(
+            logger=self.logger,
+            client_id=self.client_id,
+            token_endpoint=self.token_endpoint,
+            scopes=self.scopes,
+            refresh_token=self.offline_token
+        )
+        self.store_access_token(tokens)
+
+    async def async_renew_access_token(self) -> str:
+        """
+        IMPLEMENTS BASE METHOD
+
+        Renews the access token from the offline token, for background renewal.
+        If another process sharing the token store has already renewed it, its
+        token is used instead.
+
+        Returns
+        -------
+        str
+            The new access token
+        """
+        async with self.async_token_store_lock():
+            current = self.tokens.access_token
+            if await self.async_adopt_stored_access_token() and self.tokens.access_token != current:
+                return self.tokens.access_token
+            await self.async_get_access_token_from_offline_token()
+            return self.tokens.access_token
+
+    def adopt_stored_access_token(self) -> bool:
+        """Uses the access token in the token store (if any), which may have been
+        exchanged by another process sharing the store, if it is still valid.
+        Should be called while holding the token store lock.
 
+        Returns
+        -------
+        bool
+            True if a valid stored access token is now in use.
+        """
+        if self.token_store is None:
+            return False
+        stored = self.token_store.load(self.token_store_key)
+        if stored is None or not self.validate_token(access_token=stored.access_token, public_key=self.public_key):
+            return False
+        self.tokens = AccessToken(access_token=stored.access_token)
+        return True
+
+    async def async_adopt_stored_access_token(self) -> bool:
+        """The async equivalent of adopt_stored_access_token, which does not
+        block the event loop should the signing keys need refetching.
+
+        Returns
+        -------
+        bool
+            True if a valid stored access token is now in use.
+        """
+        if self.token_store is None:
+            return False
+        stored = self.token_store.load(self.token_store_key)
+        if stored is None or not await self.async_validate_token(access_token=stored.access_token, public_key=self.public_key):
+            return False
+        self.tokens = AccessToken(access_token=stored.access_token)
+        return True
+
+    def store_access_token(self, tokens: Dict[str, Any]) -> None:
+        """Stores the access token from a token endpoint response.
+
+        Parameters
+        ----------
+        tokens : Dict[str, Any]
+            The token endpoint response.
+
+        Raises
+        ------
+        ValueError
+            If the response has no access token.
+        """
         access_token = tokens.get('access_token')
         if not access_token:
             err_msg = "Failed to geneate access token. Returned access token is None."
@@ -598,6 +1031,10 @@ class OfflineFlow(AuthManager):
         self.tokens = AccessToken(
             access_token=access_token
         )
+        if self.token_store is not None:
+            # share the access token (but never the offline token) with other processes
+            self.token_store.save(self.token_store_key, Tokens(
+                access_token=access_token, refresh_token=None))
 
     def load_offline_token(self, file_name: str) -> str:
         """Loads the offline token from the provided file.
@@ -0,0 +1,218 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: TTL cache of the keycloak token signing keys (JWKS), persisted to disk so that new processes can verify tokens without a network call.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from pydantic import BaseModel
+from typing import Dict, Optional
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from provenaclient.auth.helpers import retrieve_keycloak_jwks
+from provenaclient.utils.config import KeyCacheSettings
+
+
+class CachedKeySet(BaseModel):
+    # Unix time the keys were fetched from keycloak
+    fetched_at: float
+    # The RS256 signing keys in PEM format keyed by key id (kid)
+    keys: Dict[str, str]
+
+
+class PublicKeyCache:
+    """Caches the signing keys of a keycloak realm, in memory and (optionally)
+    in a file shared by every process, so that verifying a token needs no
+    network call while the cached keys are within their TTL.
+
+    Keys are refetched when the TTL lapses, when a token is signed by a key id
+    which is not cached (key rotation) or when a token fails verification -
+    the latter two at most once per min_refetch_interval, so that a bad token
+    cannot cause a request storm.
+    """
+
+    def __init__(self, keycloak_endpoint: str, settings: KeyCacheSettings, logger: logging.Logger) -> None:
+        """Creates the cache - no keys are loaded until first requested.
+
+        Parameters
+        ----------
+        keycloak_endpoint : str
+            The keycloak realm endpoint, which also keys the realm's entry in the file.
+        settings : KeyCacheSettings
+            The TTL and persistence settings.
+        logger : logging.Logger
+            The auth logger.
+        """
+        self.keycloak_endpoint = keycloak_endpoint
+        self.settings = settings
+        self.logger = logger
+        self._keys: Optional[CachedKeySet] = None
+        # monotonic time of the last fetch made by this process
+        self._last_fetch: Optional[float] = None
+        # guards the cached keys, while the fetch lock is held over the (slow) fetch itself
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    def _fresh(self, keys: CachedKeySet) -> bool:
+        return time.time() - keys.fetched_at < self.settings.ttl
+
+    def _may_refetch(self) -> bool:
+        return self._last_fetch is None or time.monotonic() - self._last_fetch >= self.settings.min_refetch_interval
+
+    def _read_file(self) -> Dict[str, CachedKeySet]:
+        try:
+            with open(self.settings.path, 'r') as file:
+                contents = json.load(file)
+            return {endpoint: CachedKeySet.model_validate(entry) for endpoint, entry in contents.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.info(f"Ignoring unreadable signing key cache {self.settings.path}: {e}")
+            return {}
+
+    def _load(self) -> Optional[CachedKeySet]:
+        if self._keys is None and self.settings.persist:
+            self._keys = self._read_file().get(self.keycloak_endpoint)
+        return self._keys
+
+    def _persist(self, keys: CachedKeySet) -> None:
+        # read-modify-write, replacing the file atomically so concurrent readers never see a partial file
+        contents = self._read_file()
+        contents[self.keycloak_endpoint] = keys
+        temp_path = f"{self.settings.path}.{os.getpid()}.partial"
+        try:
+            os.makedirs(os.path.dirname(self.settings.path) or ".", exist_ok=True)
+            with open(temp_path, 'w') as file:
+                json.dump({endpoint: entry.model_dump() for endpoint, entry in contents.items()}, file)
+            os.replace(temp_path, self.settings.path)
+        except OSError as e:
+            # the cache is an optimisation - carry on with the in memory keys
+            self.logger.info(f"Failed to persist signing keys to {self.settings.path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _fetch(self) -> None:
+        # called holding only the fetch lock, so that readers of the cached keys are not held up by keycloak
+        with self._lock:
+            self._last_fetch = time.monotonic()
+        try:
+            keys = CachedKeySet(fetched_at=time.time(), keys=retrieve_keycloak_jwks(
+                keycloak_endpoint=self.keycloak_endpoint, logger=self.logger))
+        except Exception:
+            with self._lock:
+                if self._keys is not None and self._keys.keys:
+                    # keycloak is unreachable - stale keys are better than none
+                    self.logger.warning("Failed to refetch signing keys, continuing with the cached keys.")
+                    return
+            raise
+        with self._lock:
+            self._keys = keys
+        if self.settings.persist:
+            self._persist(keys)
+
+    def public_key_for(self, kid: Optional[str] = None) -> Optional[str]:
+        """Returns the signing key with the given key id, fetching the realm's
+        keys only if none are cached, the cached keys have expired or the key
+        id is unknown.
+
+        Parameters
+        ----------
+        kid : Optional[str], optional
+            The key id (from the token header), by default None for any current signing key.
+
+        Returns
+        -------
+        Optional[str]
+            The public key in PEM format, or None if the realm has no such key.
+
+        Raises
+        ------
+        Exception
+            If the keys must be fetched and keycloak cannot be reached.
+        """
+        with self._lock:
+            if not self._needs_fetch(kid):
+                return self._lookup(kid)
+
+        with self._fetch_lock:
+            # another thread may have fetched the keys while this one waited
+            with self._lock:
+                needs_fetch = self._needs_fetch(kid)
+                if needs_fetch and self._keys is not None and self._fresh(self._keys):
+                    self.logger.info(f"Token signed by unknown key {kid}, refetching signing keys.")
+            if needs_fetch:
+                self._fetch()
+
+        with self._lock:
+            return self._lookup(kid)
+
+    def _needs_fetch(self, kid: Optional[str]) -> bool:
+        keys = self._load()
+        if keys is None or not self._fresh(keys):
+            return True
+        return kid is not None and kid not in keys.keys and self._may_refetch()
+
+    def _lookup(self, kid: Optional[str]) -> Optional[str]:
+        if self._keys is None:
+            return None
+        if kid is None:
+            return next(iter(self._keys.keys.values()), None)
+        return self._keys.keys.get(kid)
+
+    async def async_public_key_for(self, kid: Optional[str] = None) -> Optional[str]:
+        """The async equivalent of public_key_for - a cached key is returned
+        directly, while a fetch from keycloak runs in a worker thread so that it
+        does not block the event loop.
+
+        Parameters
+        ----------
+        kid : Optional[str], optional
+            The key id (from the token header), by default None for any current signing key.
+
+        Returns
+        -------
+        Optional[str]
+            The public key in PEM format, or None if the realm has no such key.
+        """
+        with self._lock:
+            if not self._needs_fetch(kid):
+                return self._lookup(kid)
+        return await asyncio.to_thread(self.public_key_for, kid)
+
+    def refresh(self) -> bool:
+        """Refetches the signing keys (e.g. after a verification failure), unless
+        they were fetched within the last min_refetch_interval seconds.
+
+        Returns
+        -------
+        bool
+            True if the keys were refetched.
+        """
+        with self._fetch_lock:
+            with self._lock:
+                if not self._may_refetch():
+                    return False
+            self._fetch()
+            return True
+
+    async def async_refresh(self) -> bool:
+        """The async equivalent of refresh, which refetches the keys in a worker
+        thread so that it does not block the event loop.
+
+        Returns
+        -------
+        bool
+            True if the keys were refetched.
+        """
+        return await asyncio.to_thread(self.refresh)
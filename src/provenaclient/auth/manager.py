@@ -13,10 +13,17 @@ Date      	By	Comments
 '''
 
 from abc import ABC, abstractmethod
-from provenaclient.auth.helpers import HttpxBearerAuth
-from typing import Optional, Literal
+from contextlib import asynccontextmanager, contextmanager
+from provenaclient.auth.helpers import HttpxBearerAuth, check_token_expiry_window, token_key_id, verify_access_token
+from provenaclient.auth.key_cache import PublicKeyCache
+from provenaclient.auth.token_store import TokenStore
+from jose import jwt, JWTError  # type: ignore
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Literal, Tuple
 from enum import Enum
+import asyncio
 import logging
+import threading
+import time
 
 
 class Log(Enum):
@@ -30,11 +37,39 @@ LogType = Literal[Log.DEBUG, Log.INFO, Log.WARNING, Log.ERROR]
 
 DEFAULT_LOG_LEVEL = Log.ERROR
 
+# Default number of seconds before expiry that background renewal renews the token
+DEFAULT_RENEWAL_MARGIN = 60.0
+# Minimum seconds between background renewal attempts (guards short lived tokens and failures)
+MIN_RENEWAL_INTERVAL = 5.0
+
 
 class AuthManager(ABC):
     # This must
     logger: logging.Logger
 
+    # The (access token, public key, verified claims) most recently fully
+    # verified - a single attribute so that threads always see a consistent entry
+    _verified: Optional[Tuple[str, str, Dict[str, Any]]] = None
+
+    # The cache of keycloak signing keys - if set, tokens are verified against the key named by their kid
+    key_cache: Optional[PublicKeyCache] = None
+
+    # False until the network dependent setup (public key, initial tokens) has run - lazy
+    # managers defer it to the first token request
+    _initialised: bool = True
+
+    # The store tokens are shared through (if any) and the key of this manager's tokens within it
+    token_store: Optional[TokenStore] = None
+    token_store_key: str = ""
+
+    # The async token refresh currently in flight (if any)
+    _refresh_task: Optional["asyncio.Task[str]"] = None
+
+    # Seconds before expiry to renew the token in the background - None disables background renewal
+    renewal_margin: Optional[float] = None
+    # The background renewal task while running
+    _renewal_task: Optional["asyncio.Task[None]"] = None
+
     def __init__(self, log_level: Optional[LogType] = None) -> None:
         # Create a logger
         self.logger = logging.getLogger('auth-logger')
@@ -65,6 +100,306 @@ class AuthManager(ABC):
         """ Force refresh the current token"""
         pass
 
+    def initialise(self) -> None:
+        """Performs the network dependent setup of the manager (e.g. fetching
+        the public key and initial tokens). Called on construction, or by
+        ensure_initialised on the first token request of a lazy manager.
+        """
+        pass
+
+    def ensure_initialised(self) -> None:
+        """Runs initialise if it has not yet succeeded - exactly once however
+        many threads request a token concurrently."""
+        if self._initialised:
+            return
+        lock: threading.Lock = self.__dict__.setdefault("_initialise_lock", threading.Lock())
+        with lock:
+            if not self._initialised:
+                self.initialise()
+                self._initialised = True
+
+    async def async_ensure_initialised(self) -> None:
+        """The async equivalent of ensure_initialised, which runs the setup in
+        a worker thread so that it does not block the event loop."""
+        if not self._initialised:
+            await asyncio.to_thread(self.ensure_initialised)
+
+    async def async_get_token(self) -> str:
+        """Get token information without blocking the event loop.
+
+        Implementations which need network calls to refresh their token should
+        override this - the default falls back to get_token.
+        """
+        return self.get_token()
+
+    def validate_token(self, public_key: str, access_token: str) -> bool:
+        """Validates the access token, only performing the full RS256 signature
+        verification when the token (or public key) differs from the one last
+        verified. Otherwise the cached, already verified expiry is compared
+        against the clock, which is cheap enough to do on every request.
+
+        With a key_cache, the token is verified against the cached signing key
+        named by its kid header instead of public_key.
+
+        Parameters
+        ----------
+        public_key : str
+            The keycloak public key to verify the signature with.
+        access_token : str
+            The access token to validate.
+
+        Returns
+        -------
+        bool
+            True if the token is valid and will not expire within the expiry window.
+        """
+        if self.key_cache is not None:
+            # a token signed by a rotated key is verified against that key (refetched if unknown)
+            public_key = self.key_cache.public_key_for(token_key_id(access_token)) or public_key
+
+        token_is_fresh = self._verify_token(public_key=public_key, access_token=access_token)
+        if token_is_fresh is None and self._should_refetch_keys(access_token):
+            assert self.key_cache is not None
+            if self.key_cache.refresh():
+                # the signing key may have been replaced under the same kid - retry with the refetched keys
+                public_key = self.key_cache.public_key_for(token_key_id(access_token)) or public_key
+                token_is_fresh = self._verify_token(public_key=public_key, access_token=access_token)
+        return bool(token_is_fresh)
+
+    async def async_validate_token(self, public_key: str, access_token: str) -> bool:
+        """The async equivalent of validate_token - any signing key fetch runs
+        in a worker thread, so only the (CPU bound) verification runs on the
+        event loop.
+
+        Parameters
+        ----------
+        public_key : str
+            The keycloak public key to verify the signature with.
+        access_token : str
+            The access token to validate.
+
+        Returns
+        -------
+        bool
+            True if the token is valid and will not expire within the expiry window.
+        """
+        if self.key_cache is not None:
+            public_key = await self.key_cache.async_public_key_for(token_key_id(access_token)) or public_key
+
+        token_is_fresh = self._verify_token(public_key=public_key, access_token=access_token)
+        if token_is_fresh is None and self._should_refetch_keys(access_token):
+            assert self.key_cache is not None
+            if await self.key_cache.async_refresh():
+                public_key = await self.key_cache.async_public_key_for(token_key_id(access_token)) or public_key
+                token_is_fresh = self._verify_token(public_key=public_key, access_token=access_token)
+        return bool(token_is_fresh)
+
+    def _verify_token(self, public_key: str, access_token: str) -> Optional[bool]:
+        # returns None if verification fails, otherwise whether the token is outside the expiry window
+        verified = self._verified
+        if verified is not None and verified[0] == access_token and verified[1] == public_key:
+            return check_token_expiry_window(jwt_data=verified[2], logger=self.logger)
+
+        claims = verify_access_token(
+            public_key=public_key, access_token=access_token, logger=self.logger)
+        if claims is None:
+            self._verified = None
+            return None
+
+        # only the expiry is needed for subsequent checks
+        self._verified = (access_token, public_key, {"exp": claims.get("exp")})
+
+        token_is_fresh = check_token_expiry_window(jwt_data=claims, logger=self.logger)
+        if not token_is_fresh:
+            self.logger.info(
+                "Token is expiring soon and need to be refreshed.")
+        else:
+            self.logger.info("Token validation successful.")
+        return token_is_fresh
+
+    def _should_refetch_keys(self, access_token: str) -> bool:
+        return self.key_cache is not None and not self._token_expired(access_token)
+
+    def _token_expired(self, access_token: str) -> bool:
+        # expired tokens fail verification regardless of key, so should not trigger a key refetch
+        try:
+            expiry = jwt.get_unverified_claims(access_token).get("exp")
+        except JWTError:
+            return False
+        return expiry is not None and float(expiry) <= time.time()
+
+    @property
+    def refresh_lock(self) -> threading.Lock:
+        """The lock held while refreshing the token, so that only one thread
+        (or event loop) refreshes at a time. A plain lock (rather than
+        re-entrant) so that it can be released from a different thread to the
+        one that acquired it."""
+        lock: threading.Lock = self.__dict__.setdefault("_refresh_lock", threading.Lock())
+        return lock
+
+    @contextmanager
+    def sync_refresh_guard(self) -> Iterator[None]:
+        """Holds the refresh_lock around a synchronous refresh so that only one
+        thread refreshes at a time.
+
+        If called from a thread running an event loop while an async refresh
+        holds the lock, waiting would deadlock that loop - so in that case the
+        refresh proceeds without the lock.
+        """
+        lock = self.refresh_lock
+        try:
+            asyncio.get_running_loop()
+            acquired = lock.acquire(blocking=False)
+        except RuntimeError:
+            acquired = lock.acquire()
+        try:
+            yield
+        finally:
+            if acquired:
+                lock.release()
+
+    @contextmanager
+    def token_store_lock(self) -> Iterator[None]:
+        """Holds the token store lock of this manager's tokens (if there is a
+        store), so that auth managers sharing the store - in this or other
+        processes - refresh one at a time."""
+        if self.token_store is None:
+            yield
+            return
+        with self.token_store.lock(self.token_store_key):
+            yield
+
+    @asynccontextmanager
+    async def async_token_store_lock(self) -> AsyncIterator[None]:
+        """The async equivalent of token_store_lock, which waits for the lock
+        without blocking the event loop."""
+        if self.token_store is None:
+            yield
+            return
+        async with self.token_store.async_lock(self.token_store_key):
+            yield
+
+    async def single_flight_refresh(self, refresh: Callable[[], Awaitable[str]]) -> str:
+        """Coalesces concurrent async token refreshes so that exactly one is in
+        flight - every coroutine which finds the token stale awaits the same
+        refresh and receives the new token. The refresh also holds the
+        refresh_lock so that it never overlaps a synchronous refresh.
+
+        The refresh should re-validate the token first, as another refresh may
+        have completed while waiting for the lock.
+
+        Parameters
+        ----------
+        refresh : Callable[[], Awaitable[str]]
+            Performs the refresh, returning the new access token.
+
+        Returns
+        -------
+        str
+            The access token.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            async def locked_refresh() -> str:
+                lock = self.refresh_lock
+                if not lock.acquire(blocking=False):
+                    # a thread is refreshing - wait without blocking the event loop
+                    acquire = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+                    try:
+                        await asyncio.shield(acquire)
+                    except asyncio.CancelledError:
+                        # the worker thread will still take the lock - hand it straight back
+                        acquire.add_done_callback(lambda _: lock.release())
+                        raise
+                try:
+                    return await refresh()
+                finally:
+                    lock.release()
+
+            task = loop.create_task(locked_refresh())
+            self._refresh_task = task
+
+        # shielded so a cancelled caller does not cancel the refresh for the others
+        return await asyncio.shield(task)
+
+    async def async_renew_access_token(self) -> str:
+        """Unconditionally obtains a new access token (e.g. via the refresh or
+        offline token), without any interactive steps. Used by background
+        renewal - implementations which support it should override this.
+
+        Returns
+        -------
+        str
+            The new access token.
+
+        Raises
+        ------
+        NotImplementedError
+            If the auth manager does not support renewal.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support background token renewal.")
+
+    def start_background_renewal(self, margin: Optional[float] = None) -> None:
+        """Starts a background task (on the running event loop) which renews
+        the access token margin seconds before it expires, so that requests
+        never wait on a token refresh. Renewals share the single flight refresh
+        with the request path. Does nothing if renewal is already running.
+
+        Parameters
+        ----------
+        margin : Optional[float], optional
+            Seconds before expiry to renew, by default renewal_margin (or DEFAULT_RENEWAL_MARGIN if unset).
+
+        Raises
+        ------
+        NotImplementedError
+            If the auth manager does not override async_renew_access_token.
+        """
+        if type(self).async_renew_access_token is AuthManager.async_renew_access_token:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support background token renewal.")
+        if self._renewal_task is not None and not self._renewal_task.done():
+            return
+        margin = margin if margin is not None else (
+            self.renewal_margin if self.renewal_margin is not None else DEFAULT_RENEWAL_MARGIN)
+        self._renewal_task = asyncio.get_running_loop().create_task(self._renewal_loop(margin))
+
+    async def stop_background_renewal(self) -> None:
+        """Stops the background renewal task (if running) and waits for it to finish."""
+        task = self._renewal_task
+        self._renewal_task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _renewal_loop(self, margin: float) -> None:
+        while True:
+            try:
+                # make sure the current token is valid (and its expiry verified)
+                await self.async_get_token()
+                verified = self._verified
+                expiry = verified[2].get("exp") if verified is not None else None
+                delay = float(expiry) - time.time() - margin if expiry else 0.0
+                await asyncio.sleep(max(MIN_RENEWAL_INTERVAL, delay))
+                await self.single_flight_refresh(self.async_renew_access_token)
+                self.logger.info("Access token renewed in the background.")
+            except asyncio.CancelledError:
+                raise
+            except NotImplementedError as e:
+                # renewal is unsupported (e.g. an override deferring to the base method) - retrying cannot help
+                self.logger.warning(f"Background token renewal stopped: {e}")
+                return
+            except Exception as e:
+                # the request path still refreshes lazily - try again shortly
+                self.logger.warning(f"Background token renewal failed: {e}")
+                await asyncio.sleep(MIN_RENEWAL_INTERVAL)
+
     def get_auth(self) -> HttpxBearerAuth:
         """A helper function which produces a BearerAuth object for use
         in the httpx library. For example: 
@@ -91,3 +426,19 @@ class AuthManager(ABC):
 
         token = self.get_token()
         return HttpxBearerAuth(token=token)
+
+    async def async_get_auth(self) -> HttpxBearerAuth:
+        """The async equivalent of get_auth, which refreshes the token (if
+        needed) without blocking the event loop. For example:
+
+        auth = await manager.async_get_auth()
+        await client.post(..., auth=auth)
+
+        Returns
+        -------
+        BearerAuth
+            The httpx auth object.
+        """
+
+        token = await self.async_get_token()
+        return HttpxBearerAuth(token=token)
@@ -0,0 +1,226 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Pluggable storage of auth tokens, so that threads and processes can share one valid access token and refresh it one at a time.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from provenaclient.auth.helpers import Tokens
+import asyncio
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on windows
+    fcntl = None  # type: ignore
+
+# The token file used by the device flow by default
+DEFAULT_TOKEN_FILE = ".tokens.json"
+
+
+class TokenStore(ABC):
+    """Stores tokens under a key (identifying the realm, client and user), and
+    provides an exclusive lock per key which is held while refreshing - so
+    that only one holder refreshes, and the others load the refreshed tokens.
+
+    Tokens should only be saved while holding the lock of their key.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Tokens]:
+        """Loads the stored tokens.
+
+        Parameters
+        ----------
+        key : str
+            The token key.
+
+        Returns
+        -------
+        Optional[Tokens]
+            The stored tokens, or None if there are none.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, key: str, tokens: Tokens) -> None:
+        """Stores the tokens, replacing any stored under the key.
+
+        Parameters
+        ----------
+        key : str
+            The token key.
+        tokens : Tokens
+            The tokens to store.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """Removes any tokens stored under the key.
+
+        Parameters
+        ----------
+        key : str
+            The token key.
+        """
+        pass
+
+    @abstractmethod
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Holds the exclusive lock of the key, blocking until it is available.
+
+        Parameters
+        ----------
+        key : str
+            The token key.
+        """
+        yield
+
+    @asynccontextmanager
+    async def async_lock(self, key: str) -> AsyncIterator[None]:
+        """Holds the exclusive lock of the key, waiting for it in a worker
+        thread so that the event loop is not blocked.
+
+        Parameters
+        ----------
+        key : str
+            The token key.
+        """
+        held = self.lock(key)
+        enter = asyncio.ensure_future(asyncio.to_thread(held.__enter__))
+        try:
+            await asyncio.shield(enter)
+        except asyncio.CancelledError:
+            # the worker thread will still take the lock - hand it straight back
+            def release(entered: "asyncio.Future[Any]") -> None:
+                if not entered.cancelled() and entered.exception() is None:
+                    held.__exit__(None, None, None)
+            enter.add_done_callback(release)
+            raise
+        try:
+            yield
+        finally:
+            held.__exit__(None, None, None)
+
+
+class InMemoryTokenStore(TokenStore):
+    """Stores tokens in memory, shared by every auth manager (and thread) in
+    the process given the same store instance."""
+
+    def __init__(self) -> None:
+        """Creates an empty store."""
+        self._tokens: Dict[str, Tokens] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def load(self, key: str) -> Optional[Tokens]:
+        tokens = self._tokens.get(key)
+        return tokens.model_copy() if tokens is not None else None
+
+    def save(self, key: str, tokens: Tokens) -> None:
+        self._tokens[key] = tokens.model_copy()
+
+    def clear(self, key: str) -> None:
+        self._tokens.pop(key, None)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._guard:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Stores tokens in a JSON file (readable only by the user) shared by every
+    process using the same path.
+
+    Writes replace the file atomically, so readers never see a partial file,
+    and the lock is an advisory lock (flock) on a sibling .lock file, so
+    processes - such as forked workers - refresh one at a time. On platforms
+    without fcntl the lock only excludes threads of the same process.
+    """
+
+    def __init__(self, path: str = DEFAULT_TOKEN_FILE) -> None:
+        """Creates a store backed by the given file.
+
+        Parameters
+        ----------
+        path : str, optional
+            The token file, by default DEFAULT_TOKEN_FILE.
+        """
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as file:
+                contents = json.load(file)
+        except FileNotFoundError:
+            return {}
+        return contents if isinstance(contents, dict) else {}
+
+    def _write(self, contents: Dict[str, Any]) -> None:
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.partial"
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump(contents, file)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def load(self, key: str) -> Optional[Tokens]:
+        contents = self._read()
+        if "access_token" in contents:
+            # a single token set written by earlier versions of the client
+            return Tokens(**contents)
+        entry = contents.get(key)
+        return Tokens(**entry) if isinstance(entry, dict) else None
+
+    def save(self, key: str, tokens: Tokens) -> None:
+        contents = self._read()
+        if "access_token" in contents:
+            contents = {}
+        contents[key] = tokens.model_dump()
+        self._write(contents)
+
+    def clear(self, key: str) -> None:
+        contents = self._read()
+        if "access_token" in contents:
+            contents = {}
+        elif key not in contents:
+            return
+        contents.pop(key, None)
+        self._write(contents)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        # one lock for the whole file, since saving any key rewrites it
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
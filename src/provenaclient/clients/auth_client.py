@@ -79,7 +79,7 @@ class AuthEndpoints(str, Enum):
 
 
 class AuthAdminSubClient(ClientService):
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the AuthClient admin sub client with authentication and configuration.
 
         Parameters
@@ -88,9 +88,12 @@ class AuthAdminSubClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: AuthEndpoints) -> str:
         return self._config.auth_api_endpoint + endpoint.value
@@ -542,7 +545,7 @@ class AuthClient(ClientService):
     # Sub clients
     admin: AuthAdminSubClient
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the AuthClient with authentication and configuration.
 
         Parameters
@@ -551,11 +554,14 @@ class AuthClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
-        self.admin = AuthAdminSubClient(auth=auth, config=config)
+        self.admin = AuthAdminSubClient(auth=auth, config=config, transport=transport)
 
     def _build_endpoint(self, endpoint: AuthEndpoints) -> str:
         return self._config.auth_api_endpoint + endpoint.value
@@ -18,21 +18,152 @@ from abc import ABC
 from provenaclient.auth import AuthManager
 from provenaclient.utils.config import Config
 from provenaclient.utils.helpers import *
-from provenaclient.utils.http_client import HttpClient
-from typing import Dict, Mapping, Optional
+from provenaclient.utils.config import RetrySettings
+from provenaclient.utils.http_client import HttpClient, HttpTransport
+from provenaclient.utils.cache import ResponseCache, principal_identity
+from provenaclient.utils.concurrency import service_key
+from provenaclient.utils.json_stream import JsonArrayFieldParser
+from provenaclient.utils.retry import send_with_retry
+from provenaclient.auth.helpers import HttpxBearerAuth
+from typing import AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional
+import json
 from provenaclient.utils.exceptions import CustomTimeoutException
 
+# Makes a single request attempt with the provided (freshly resolved) auth
+AuthorisedSendFunction = Callable[[HttpxBearerAuth], Awaitable[Response]]
+
 
 class ClientService(ABC):
     """
     This class interface just captures that the client has an instantiated auth
     manager which allows for helper functions abstracted for L2 clients.
+
+    The optional transport is the pooled HTTP transport shared between clients,
+    if None then each request uses a single use connection. The optional cache
+    is the (opt-in) fetch response cache shared between clients.
     """
     _auth: AuthManager
     _config: Config
+    _transport: Optional[HttpTransport] = None
+    _cache: Optional[ResponseCache] = None
+
+
+async def cached_fetch(client: ClientService, endpoint: str, id: str, seed_allowed: Optional[bool], model: Type[BaseModelType], fetch: Callable[[], Awaitable[BaseModelType]]) -> BaseModelType:
+    """
+
+    Serves an item fetch from the client's response cache if enabled, otherwise
+    (or on a miss) performs the fetch.
+
+    Args:
+        client (ClientService): The client being used. Relies on client interface.
+        endpoint (str): The fetch endpoint
+        id (str): The id of the item being fetched
+        seed_allowed (Optional[bool]): The seed_allowed flag of the fetch, if any
+        model (Type[BaseModelType]): Model the response is parsed as
+        fetch (Callable[[], Awaitable[BaseModelType]]): Performs the fetch
+
+    Returns:
+        BaseModelType: The parsed fetch response
+    """
+    if client._cache is None:
+        return await fetch()
+    return await client._cache.get_or_fetch(
+        auth=client._auth, endpoint=endpoint, id=id, seed_allowed=seed_allowed, model=model, fetch=fetch)
 
 
-async def parsed_get_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+def invalidate_cached_item(client: ClientService, id: str) -> None:
+    """
+
+    Drops any cached fetch responses of an item which has been (or may have
+    been) modified.
+
+    Args:
+        client (ClientService): The client being used. Relies on client interface.
+        id (str): The id of the modified item
+    """
+    if client._cache is not None:
+        client._cache.invalidate(id)
+
+
+async def send_request(client: ClientService, method: str, url: str, send: AuthorisedSendFunction, retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> Response:
+    """
+
+    Sends a request through the client's transport
+
+    - each attempt waits for a slot in the adaptive concurrency limiter of the target service
+    - transient failures (429/5xx gateway errors, timeouts) are retried according to the retry settings
+    - the auth is resolved (without blocking the event loop) for each attempt
+
+    Args:
+        client (ClientService): The client being used. Relies on client interface.
+        method (str): The HTTP method, used to decide if the request is safe to retry
+        url (str): The request url, used to find the service's concurrency limiter
+        send (AuthorisedSendFunction): Coroutine function which makes one attempt with the provided auth
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry
+
+    Returns:
+        Response: The final response
+    """
+    async def authorised_send() -> Response:
+        return await send(await client._auth.async_get_auth())
+
+    transport = client._transport
+    if transport is None:
+        return await send_with_retry(send=authorised_send, method=method, settings=retry_settings, idempotent=idempotent)
+
+    limiter = transport.get_limiter(service_key(client._config, url))
+
+    async def limited_send() -> Response:
+        # each attempt (including retries) takes its own limiter slot
+        if limiter is None:
+            return await authorised_send()
+        return await limiter.run(authorised_send)
+
+    return await send_with_retry(
+        send=limited_send,
+        method=method,
+        settings=retry_settings if retry_settings is not None else transport.retry_settings,
+        budget=transport.retry_budget,
+        idempotent=idempotent
+    )
+
+
+async def coalesced_get_request(client: ClientService, url: str, params: Dict[str, ParamTypes], model: Type[BaseModelType], status_checked: bool, send_and_parse: Callable[[], Awaitable[BaseModelType]]) -> BaseModelType:
+    """
+
+    Coalesces identical concurrent GET requests (same url, params, user and
+    response model) into a single network call whose parsed result is shared.
+
+    Only active when the client has a transport with coalesce_requests enabled.
+
+    Args:
+        client (ClientService): The client being used. Relies on client interface.
+        url (str): The url of the GET request
+        params (Dict[str, ParamTypes]): The filtered params of the GET request
+        model (Type[BaseModelType]): Model the response is parsed as
+        status_checked (bool): Whether the response status field is checked when parsing
+        send_and_parse (Callable[[], Awaitable[BaseModelType]]): Makes the request and parses the response
+
+    Returns:
+        BaseModelType: The parsed response
+    """
+    transport = client._transport
+    if transport is None or not transport.settings.coalesce_requests:
+        return await send_and_parse()
+
+    key = (
+        "GET",
+        url,
+        json.dumps(params, sort_keys=True, default=str),
+        await principal_identity(client._auth),
+        model.__module__ + "." + model.__qualname__,
+        status_checked,
+    )
+    return await transport.single_flight.do(key, send_and_parse)
+
+
+async def parsed_get_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -50,6 +181,8 @@ async def parsed_get_request_with_status(client: ClientService, params: Optional
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make GET request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
 
     Raises:
@@ -59,27 +192,29 @@ async def parsed_get_request_with_status(client: ClientService, params: Optional
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
-    try:
-        response = await HttpClient.make_get_request(url=url, params=filtered_params, auth=get_auth())
-        data = handle_response_with_status(
-            response=response,
-            model=model,
-            error_message=error_message
-        )
+    async def send_and_parse() -> BaseModelType:
+        try:
+            response = await send_request(client, "GET", url, lambda auth: HttpClient.make_get_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
+            data = handle_response_with_status(
+                response=response,
+                model=model,
+                error_message=error_message
+            )
 
-    except BaseException as e:
-        raise e
-    except Exception as e:
-        raise Exception(
-            f"{error_message} Exception: {e}") from e
+        except BaseException as e:
+            raise e
+        except Exception as e:
+            raise Exception(
+                f"{error_message} Exception: {e}") from e
 
-    return data
+        return data
+
+    return await coalesced_get_request(client, url, filtered_params, model, True, send_and_parse)
 
 
-async def parsed_get_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_get_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -97,6 +232,8 @@ async def parsed_get_request(client: ClientService, params: Optional[Mapping[str
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make GET request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
 
     Raises:
@@ -106,16 +243,80 @@ async def parsed_get_request(client: ClientService, params: Optional[Mapping[str
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
+    filtered_params = build_params_exclude_none(params if params else {})
+
+    async def send_and_parse() -> BaseModelType:
+        try:
+            response = await send_request(client, "GET", url, lambda auth: HttpClient.make_get_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
+            data = handle_response_non_status(
+                response=response,
+                model=model,
+                error_message=error_message
+            )
+
+        except BaseException as e:
+            raise e
+        except Exception as e:
+            raise Exception(
+                f"{error_message} Exception: {e}") from e
+
+        return data
+
+    return await coalesced_get_request(client, url, filtered_params, model, False, send_and_parse)
+
+
+async def streamed_get_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, array_key: str, model: Type[BaseModelType]) -> AsyncIterator[BaseModelType]:
+    """
+
+    High level helper function which streams a (potentially very large)
+    status response whose bulk is a single array field. It
+
+    - gets the auth
+    - builds the filtered param list
+    - makes get request without reading the body
+    - checks http codes
+    - incrementally parses the body, checking the status and yielding each
+      element of the array field parsed as the model as soon as it arrives
+
+    Only one element is held in memory at a time. The request is not retried
+    as a partially consumed stream cannot be transparently replayed.
+
+    Args:
+        client (ClientService): The client being used. Relies on client interface.
+        params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
+        url (str): The url to make GET request to
+        error_message (str): The error message to embed in other exceptions
+        array_key (str): The top level field containing the array to stream
+        model (Type[BaseModelType]): Model to parse each array element as
+
+    Raises:
+        e: Exception depending on error
+
+    Yields:
+        BaseModelType: Each parsed element
+    """
+    # Prepare and setup the API request.
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_get_request(url=url, params=filtered_params, auth=get_auth())
-        data = handle_response_non_status(
-            response=response,
-            model=model,
-            error_message=error_message
-        )
+        async with HttpClient.make_streamed_get_request(url=url, params=filtered_params, auth=await client._auth.async_get_auth(), transport=client._transport) as response:
+            if response.status_code != 200:
+                await response.aread()
+                handle_err_codes(response=response, error_message=error_message)
+
+            parser = JsonArrayFieldParser(array_key=array_key)
+            status_checked = False
+            async for chunk in response.aiter_text():
+                for key, value, is_element in parser.feed(chunk):
+                    if is_element:
+                        yield handle_model_parsing(json_data=value, model=model)
+                    elif key == "status":
+                        check_status_response(json_data={"status": value})
+                        status_checked = True
+            parser.close()
+
+            if not status_checked:
+                check_status_response(json_data={})
 
     except BaseException as e:
         raise e
@@ -123,10 +324,8 @@ async def parsed_get_request(client: ClientService, params: Optional[Mapping[str
         raise Exception(
             f"{error_message} Exception: {e}") from e
 
-    return data
-
 
-async def parsed_post_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_post_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -144,6 +343,8 @@ async def parsed_post_request(client: ClientService, params: Optional[Mapping[st
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to post if any
 
@@ -154,11 +355,10 @@ async def parsed_post_request(client: ClientService, params: Optional[Mapping[st
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "POST", url, lambda auth: HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_non_status(
             response=response,
             model=model,
@@ -173,7 +373,7 @@ async def parsed_post_request(client: ClientService, params: Optional[Mapping[st
 
     return data
 
-async def parsed_post_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType], files: Optional[HttpxFileUpload] = None) -> BaseModelType:
+async def parsed_post_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType], files: Optional[HttpxFileUpload] = None, retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -191,6 +391,8 @@ async def parsed_post_request_with_status(client: ClientService, params: Optiona
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to post if any
         files: Optional[HttpxFileUpload]: A dictionary representing file(s) to be uploaded with the
@@ -205,11 +407,10 @@ async def parsed_post_request_with_status(client: ClientService, params: Optiona
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, files = files, auth=get_auth())
+        response = await send_request(client, "POST", url, lambda auth: HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, files = files, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_with_status(
             response=response,
             model=model,
@@ -225,7 +426,7 @@ async def parsed_post_request_with_status(client: ClientService, params: Optiona
     return data
 
 
-async def parsed_delete_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_delete_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -243,6 +444,8 @@ async def parsed_delete_request_with_status(client: ClientService, params: Optio
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to post if any
 
@@ -253,11 +456,10 @@ async def parsed_delete_request_with_status(client: ClientService, params: Optio
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_delete_request(url=url, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "DELETE", url, lambda auth: HttpClient.make_delete_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_with_status(
             response=response,
             model=model,
@@ -273,7 +475,7 @@ async def parsed_delete_request_with_status(client: ClientService, params: Optio
     return data
 
 
-async def parsed_delete_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_delete_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -291,6 +493,8 @@ async def parsed_delete_request(client: ClientService, params: Optional[Mapping[
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to post if any
 
@@ -301,11 +505,10 @@ async def parsed_delete_request(client: ClientService, params: Optional[Mapping[
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_delete_request(url=url, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "DELETE", url, lambda auth: HttpClient.make_delete_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_non_status(
             response=response,
             model=model,
@@ -321,7 +524,7 @@ async def parsed_delete_request(client: ClientService, params: Optional[Mapping[
     return data
 
 
-async def parsed_put_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_put_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -339,6 +542,8 @@ async def parsed_put_request(client: ClientService, params: Optional[Mapping[str
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make put request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to put if any
 
@@ -349,11 +554,10 @@ async def parsed_put_request(client: ClientService, params: Optional[Mapping[str
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_put_request(url=url, data=json_body, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "PUT", url, lambda auth: HttpClient.make_put_request(url=url, data=json_body, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_non_status(
             response=response,
             model=model,
@@ -369,7 +573,7 @@ async def parsed_put_request(client: ClientService, params: Optional[Mapping[str
     return data
 
 
-async def parsed_put_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType]) -> BaseModelType:
+async def parsed_put_request_with_status(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, model: Type[BaseModelType], retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> BaseModelType:
     """
 
     High level helper function which 
@@ -387,6 +591,8 @@ async def parsed_put_request_with_status(client: ClientService, params: Optional
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make put request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         model (Type[BaseModelType]): Model to parse for response JSON
         json_body: Optional[JsonData]: JSON data to put if any
 
@@ -397,11 +603,10 @@ async def parsed_put_request_with_status(client: ClientService, params: Optional
         BaseModelType: The specified parsed model
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_put_request(url=url, data=json_body, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "PUT", url, lambda auth: HttpClient.make_put_request(url=url, data=json_body, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         data = handle_response_with_status(
             response=response,
             model=model,
@@ -418,7 +623,7 @@ async def parsed_put_request_with_status(client: ClientService, params: Optional
 
 
 
-async def validated_get_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str) -> Response:
+async def validated_get_request(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> Response:
     """
 
     High level helper function which 
@@ -435,6 +640,8 @@ async def validated_get_request(client: ClientService, params: Optional[Mapping[
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make GET request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
 
     Raises:
         e: Exception depending on error
@@ -443,11 +650,10 @@ async def validated_get_request(client: ClientService, params: Optional[Mapping[
         None
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_get_request(url=url, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "GET", url, lambda auth: HttpClient.make_get_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         
         handle_err_codes(
             response=response,
@@ -468,7 +674,9 @@ async def validated_post_request(
     json_body: Optional[JsonData],
     url: str,
     error_message: str, 
-    headers: Optional[Dict[str,Any]] = None
+    headers: Optional[Dict[str,Any]] = None,
+    retry_settings: Optional[RetrySettings] = None,
+    idempotent: Optional[bool] = None
 ) -> Response: 
     
     """
@@ -482,6 +690,8 @@ async def validated_post_request(
         json_body (Optional[JsonData]): JSON data to send with the request, if any.
         url (str): The URL to make the POST request to.
         error_message (str): The error message to embed in other exceptions.
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         headers: The headers to include in hte POST request, if any.
 
     Raises:
@@ -492,11 +702,10 @@ async def validated_post_request(
     """
 
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=get_auth(), headers = headers)
+        response = await send_request(client, "POST", url, lambda auth: HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=auth, headers = headers, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
 
         handle_err_codes(
             response=response,
@@ -510,7 +719,7 @@ async def validated_post_request(
         raise Exception(
             f"{error_message} Exception: {e}") from e
 
-async def parsed_post_request_none_return(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str) -> None:
+async def parsed_post_request_none_return(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], json_body: Optional[JsonData], url: str, error_message: str, retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> None:
     """
 
     High level helper function which 
@@ -527,6 +736,8 @@ async def parsed_post_request_none_return(client: ClientService, params: Optiona
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
         json_body: Optional[JsonData]: JSON data to post if any
 
     Raises:
@@ -536,11 +747,10 @@ async def parsed_post_request_none_return(client: ClientService, params: Optiona
         None
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "POST", url, lambda auth: HttpClient.make_post_request(url=url, data=json_body, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         
         handle_err_codes(
             response=response,
@@ -554,7 +764,7 @@ async def parsed_post_request_none_return(client: ClientService, params: Optiona
             f"{error_message} Exception: {e}") from e
 
 
-async def parsed_delete_request_non_return(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str) -> None:
+async def parsed_delete_request_non_return(client: ClientService, params: Optional[Mapping[str, Optional[ParamTypes]]], url: str, error_message: str, retry_settings: Optional[RetrySettings] = None, idempotent: Optional[bool] = None) -> None:
     """
 
     High level helper function which 
@@ -571,6 +781,8 @@ async def parsed_delete_request_non_return(client: ClientService, params: Option
         params (Optional[Mapping[str, Optional[ParamTypes]]]): The params if any
         url (str): The url to make POST request to
         error_message (str): The error message to embed in other exceptions
+        retry_settings (Optional[RetrySettings]): Per call override of the transport retry settings
+        idempotent (Optional[bool]): Per call override of whether the request is safe to retry (e.g. read only POST)
 
     Raises:
         e: Exception depending on error
@@ -579,11 +791,10 @@ async def parsed_delete_request_non_return(client: ClientService, params: Option
         None
     """
     # Prepare and setup the API request.
-    get_auth = client._auth.get_auth  # Get bearer auth
     filtered_params = build_params_exclude_none(params if params else {})
 
     try:
-        response = await HttpClient.make_delete_request(url=url, params=filtered_params, auth=get_auth())
+        response = await send_request(client, "DELETE", url, lambda auth: HttpClient.make_delete_request(url=url, params=filtered_params, auth=auth, transport=client._transport), retry_settings=retry_settings, idempotent=idempotent)
         
         handle_err_codes(
             response=response,
@@ -59,7 +59,7 @@ class DatastoreEndpoints(str, Enum):
 
 class DatasetReviewSubClient(ClientService):
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialise the Datastore system reviewer sub client with authentication and configuration.
 
         Parameters
@@ -68,9 +68,12 @@ class DatasetReviewSubClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: DatastoreEndpoints) -> str:
         return self._config.auth_api_endpoint + endpoint.value
@@ -184,7 +187,7 @@ class DatastoreClient(ClientService):
 
     review: DatasetReviewSubClient
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None, cache: Optional[ResponseCache] = None) -> None:
         """Initialise the DatastoreClient with authentication and configuration.
 
         Parameters
@@ -193,11 +196,17 @@ class DatastoreClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
+        cache : Optional[ResponseCache], optional
+            The shared fetch response cache, by default None (no caching).
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
+        self._cache = cache
 
-        self.review = DatasetReviewSubClient(auth = auth, config = config)
+        self.review = DatasetReviewSubClient(auth = auth, config = config, transport=transport)
 
     def _build_endpoint(self, endpoint: DatastoreEndpoints) -> str:
         return self._config.datastore_api_endpoint + endpoint.value
@@ -252,14 +261,18 @@ class DatastoreClient(ClientService):
             The updated metadata response from datastore.
         """
 
-        return await parsed_post_request_with_status(
-            client = self, 
-            url = self._build_endpoint(DatastoreEndpoints.POST_REGISTER_UPDATE_METADATA),
-            error_message="Dataset metadata update failed!", 
-            params = {"handle_id": handle_id, "reason": reason}, 
-            json_body=py_to_dict(metadata_payload), 
-            model = UpdateMetadataResponse
-        )
+        try:
+            return await parsed_post_request_with_status(
+                client = self, 
+                url = self._build_endpoint(DatastoreEndpoints.POST_REGISTER_UPDATE_METADATA),
+                error_message="Dataset metadata update failed!", 
+                params = {"handle_id": handle_id, "reason": reason}, 
+                json_body=py_to_dict(metadata_payload), 
+                model = UpdateMetadataResponse
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, handle_id)
     
     async def revert_metadata(self, metadata_payload:RevertMetadata) -> StatusResponse:
         """Reverts the metadata for a dataset to a previous identified historical version.
@@ -276,14 +289,18 @@ class DatastoreClient(ClientService):
             Response indicating whether your dataset metadata setup is valid and correct.
         """
 
-        return await parsed_put_request_with_status(
-            client = self, 
-            url = self._build_endpoint(DatastoreEndpoints.PUT_REGISTER_REVERT_METADATA),
-            error_message= "Dataset revert metadata failed!",
-            params={},
-            json_body= py_to_dict(metadata_payload),
-            model=StatusResponse
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client = self, 
+                url = self._build_endpoint(DatastoreEndpoints.PUT_REGISTER_REVERT_METADATA),
+                error_message= "Dataset revert metadata failed!",
+                params={},
+                json_body= py_to_dict(metadata_payload),
+                model=StatusResponse
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, metadata_payload.id)
     
     async def version_dataset(self, version_dataset_payload: VersionRequest) -> VersionResponse:
         """Creates a new versioning of an existing dataset within Provena 
@@ -301,14 +318,18 @@ class DatastoreClient(ClientService):
             job session ID.
         """
 
-        return await parsed_post_request(
-            client = self, 
-            url = self._build_endpoint(DatastoreEndpoints.POST_REGISTER_VERSION),
-            error_message= "Dataset versioning failed!",
-            params={},
-            json_body= py_to_dict(version_dataset_payload),
-            model=VersionResponse
-        )
+        try:
+            return await parsed_post_request(
+                client = self, 
+                url = self._build_endpoint(DatastoreEndpoints.POST_REGISTER_VERSION),
+                error_message= "Dataset versioning failed!",
+                params={},
+                json_body= py_to_dict(version_dataset_payload),
+                model=VersionResponse
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, version_dataset_payload.id)
     
     async def list_datasets(self, list_request: NoFilterSubtypeListRequest) -> DatasetListResponse:
         """Gets datasets within the datastore in a paginated fashion.
@@ -332,7 +353,9 @@ class DatastoreClient(ClientService):
             error_message="List fetching failed",
             params = {},
             json_body=py_to_dict(list_request),
-            model = DatasetListResponse
+            model = DatasetListResponse,
+            # read only list - safe to retry
+            idempotent = True
         )
     
 
@@ -431,13 +454,21 @@ class DatastoreClient(ClientService):
         ValueError
             Raised if there is an issue in parsing the response into the expected model.
         """
-        return await parsed_get_request_with_status(
+        endpoint = self._build_endpoint(DatastoreEndpoints.GET_REGISTRY_ITEMS_FETCH_DATASET)
+
+        return await cached_fetch(
             client=self,
-            url=self._build_endpoint(
-                DatastoreEndpoints.GET_REGISTRY_ITEMS_FETCH_DATASET),
-            error_message=f"Failed to fetch dataset with id {id}...",
-            params={"handle_id": id},
-            model=RegistryFetchResponse
+            endpoint=endpoint,
+            id=id,
+            seed_allowed=None,
+            model=RegistryFetchResponse,
+            fetch=lambda: parsed_get_request_with_status(
+                client=self,
+                url=endpoint,
+                error_message=f"Failed to fetch dataset with id {id}...",
+                params={"handle_id": id},
+                model=RegistryFetchResponse
+            )
         )
 
     async def mint_dataset(self, dataset_info: CollectionFormat) -> MintResponse:
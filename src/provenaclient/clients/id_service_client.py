@@ -43,7 +43,7 @@ class IdServiceEndpoints(str, Enum):
 
 
 class IdServiceClient(ClientService):
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the IdServiceClient with authentication and configuration.
 
         Parameters
@@ -52,9 +52,12 @@ class IdServiceClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: IdServiceEndpoints) -> str:
         return self._config.handle_service_api_endpoint + endpoint.value
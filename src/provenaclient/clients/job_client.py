@@ -52,7 +52,7 @@ class JobAPIEndpoints(str, Enum):
 
 
 class JobAPIAdminSubClient(ClientService):
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the JobAPIAdminClient sub client with authentication and configuration.
 
         Parameters
@@ -61,9 +61,12 @@ class JobAPIAdminSubClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: JobAPIAdminEndpoints) -> str:
         return self._config.jobs_service_api_endpoint + endpoint.value
@@ -124,7 +127,9 @@ class JobAPIAdminSubClient(ClientService):
             url=self._build_endpoint(
                 JobAPIAdminEndpoints.POST_JOBS_ADMIN_LIST),
             error_message=f"Failed to list jobs for user (admin).",
-            model=AdminListJobsResponse
+            model=AdminListJobsResponse,
+            # read only list - safe to retry
+            idempotent=True
         )
 
     async def list_jobs_in_batch(self, list_request: AdminListByBatchRequest) -> AdminListByBatchResponse:
@@ -144,14 +149,16 @@ class JobAPIAdminSubClient(ClientService):
             url=self._build_endpoint(
                 JobAPIAdminEndpoints.POST_JOBS_ADMIN_LIST_BATCH),
             error_message=f"Failed to list jobs for specified batch (admin).",
-            model=AdminListByBatchResponse
+            model=AdminListByBatchResponse,
+            # read only list - safe to retry
+            idempotent=True
         )
 
 
 class JobAPIClient(ClientService):
     admin: JobAPIAdminSubClient
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the JobAPIClient with authentication and configuration.
 
         Parameters
@@ -160,11 +167,14 @@ class JobAPIClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
-        self.admin = JobAPIAdminSubClient(auth=auth, config=config)
+        self.admin = JobAPIAdminSubClient(auth=auth, config=config, transport=transport)
 
     def _build_endpoint(self, endpoint: JobAPIEndpoints) -> str:
         return self._config.jobs_service_api_endpoint + endpoint.value
@@ -218,7 +228,9 @@ class JobAPIClient(ClientService):
             params={},
             url=self._build_endpoint(JobAPIEndpoints.POST_JOBS_USER_LIST),
             error_message=f"Failed to list jobs for user.",
-            model=ListJobsResponse
+            model=ListJobsResponse,
+            # read only list - safe to retry
+            idempotent=True
         )
 
     async def list_jobs_in_batch(self, list_request: ListByBatchRequest) -> ListByBatchResponse:
@@ -238,5 +250,7 @@ class JobAPIClient(ClientService):
             url=self._build_endpoint(
                 JobAPIEndpoints.POST_JOBS_USER_LIST_BATCH),
             error_message=f"Failed to list jobs for user by batch.",
-            model=ListByBatchResponse
+            model=ListByBatchResponse,
+            # read only list - safe to retry
+            idempotent=True
         )
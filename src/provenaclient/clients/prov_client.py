@@ -71,9 +71,10 @@ class ProvAPIAdminEndpoints(str, Enum):
 
 class ProvAdminClient(ClientService):
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: ProvAPIAdminEndpoints) -> str:
         return self._config.prov_api_endpoint + endpoint.value
@@ -194,7 +195,7 @@ class ProvClient(ClientService):
 
     admin: ProvAdminClient
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the REPLACEClient with authentication and configuration.
 
         Parameters
@@ -203,11 +204,14 @@ class ProvClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
-        self.admin = ProvAdminClient(auth=auth, config=config)
+        self.admin = ProvAdminClient(auth=auth, config=config, transport=transport)
 
     def _build_endpoint(self, endpoint: ProvAPIEndpoints) -> str:
         return self._config.prov_api_endpoint + endpoint.value
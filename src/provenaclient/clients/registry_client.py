@@ -24,6 +24,7 @@ from provenaclient.clients.client_helpers import *
 from provenaclient.utils.registry_endpoints import *
 from ProvenaInterfaces.RegistryModels import *
 from ProvenaInterfaces.RegistryAPI import *
+from provenaclient.models.registry import RegistryCountPage
 
 
 class GenericRegistryEndpoints(str, Enum):
@@ -45,7 +46,7 @@ class RegistryAdminEndpoints(str, Enum):
     POST_ADMIN_RESTORE_FROM_TABLE = "/admin/restore_from_table"
 
 class RegistryAdminClient(ClientService):
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None, cache: Optional[ResponseCache] = None) -> None:
         """Initialises the RegistryAdminClient with authentication and configuration.
 
         Parameters
@@ -54,9 +55,15 @@ class RegistryAdminClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config: Config
             A config object which contains information related to the Provena instance.
+        transport: Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
+        cache: Optional[ResponseCache], optional
+            The shared fetch response cache, by default None (no caching).
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
+        self._cache = cache
 
     def _build_endpoint(self, endpoint: RegistryAdminEndpoints) -> str:
         return f"{self._config.registry_api_endpoint}{endpoint.value}"
@@ -87,6 +94,27 @@ class RegistryAdminClient(ClientService):
             model=RegistryExportResponse
         )
     
+    def export_items_stream(self) -> AsyncIterator[BundledItem]:
+        """
+        Exports all items from the registry, parsing the response incrementally
+        so that memory use does not grow with the size of the registry.
+
+        Returns
+        -------
+        AsyncIterator[BundledItem]
+            The exported items, yielded as they are received.
+        """
+        endpoint = self._build_endpoint(RegistryAdminEndpoints.GET_ADMIN_EXPORT)
+
+        return streamed_get_request_with_status(
+            client=self,
+            url=endpoint,
+            params=None,
+            error_message="Failed to export all items from the registry!",
+            array_key="items",
+            model=BundledItem
+        )
+
     async def import_items(self, registry_import_request: RegistryImportRequest) -> RegistryImportResponse:
         """
         Imports items into the registry.
@@ -182,17 +210,21 @@ class RegistryAdminClient(ClientService):
             action=RegistryAction.DELETE, item_subtype=item_subtype
         )
 
-        return await parsed_delete_request_with_status(
-            client=self,
-            params={'id': id},
-            error_message=f"Failed to delete item with id {id} and subtype {item_subtype}",
-            model=StatusResponse,
-            url=endpoint
-        )
+        try:
+            return await parsed_delete_request_with_status(
+                client=self,
+                params={'id': id},
+                error_message=f"Failed to delete item with id {id} and subtype {item_subtype}",
+                model=StatusResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, id)
     
 class RegistryGeneralClient(ClientService):
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None, cache: Optional[ResponseCache] = None) -> None:
         """Initialises the RegistryGeneralClient with authentication and configuration.
 
         Parameters
@@ -201,9 +233,15 @@ class RegistryGeneralClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config: Config
             A config object which contains information related to the Provena instance.
+        transport: Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
+        cache: Optional[ResponseCache], optional
+            The shared fetch response cache, by default None (no caching).
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
+        self._cache = cache
 
     def _build_subtype_endpoint(self, action: RegistryAction, item_subtype: ItemSubType) -> str:
         return subtype_action_to_endpoint(
@@ -237,9 +275,57 @@ class RegistryGeneralClient(ClientService):
             params=None,
             json_body=py_to_dict(general_list_request),
             error_message=f"General list fetch failed!",
-            model=PaginatedListResponse
+            model=PaginatedListResponse,
+            # read only list - safe to retry
+            idempotent=True
         )
     
+    async def count_general_registry_items(self, general_list_request: GeneralListRequest) -> RegistryCountPage:
+        """
+        Counts a page of general registry items based on filter criteria,
+        reading the raw response JSON without parsing the items into models.
+
+        Parameters
+        ----------
+        general_list_request : GeneralListRequest
+            The request containing filter and sort criteria.
+
+        Returns
+        -------
+        RegistryCountPage
+            The number of items on the page (in total and of each subtype) and the key of the next page.
+        """
+        endpoint = self._build_general_endpoint(endpoint=GenericRegistryEndpoints.POST_REGISTRY_GENERAL_LIST)
+        error_message = f"General list count failed!"
+
+        response = await validated_post_request(
+            client=self,
+            url=endpoint,
+            params=None,
+            json_body=py_to_dict(general_list_request),
+            error_message=error_message,
+            # read only list - safe to retry
+            idempotent=True
+        )
+
+        try:
+            json_data = response.json()
+        except Exception as e:
+            raise ValidationException(message=f"{error_message} Response was not valid JSON.") from e
+        check_status_response(json_data={"status": json_data.get("status")})
+
+        items = json_data.get("items") or []
+        subtype_counts: Dict[str, int] = {}
+        for item in items:
+            subtype = (item.get("item_subtype") if isinstance(item, dict) else None) or "UNKNOWN"
+            subtype_counts[subtype] = subtype_counts.get(subtype, 0) + 1
+
+        return RegistryCountPage(
+            count=len(items),
+            subtype_counts=subtype_counts,
+            pagination_key=json_data.get("pagination_key")
+        )
+
     async def general_fetch_item(self, id: str) -> UntypedFetchResponse:
         """
         Fetches a general item from the registry.
@@ -256,12 +342,19 @@ class RegistryGeneralClient(ClientService):
         """
         endpoint = self._build_general_endpoint(endpoint=GenericRegistryEndpoints.GET_REGISTRY_GENERAL_FETCH)
 
-        return await parsed_get_request_with_status(
+        return await cached_fetch(
             client=self,
-            url=endpoint,
-            params={"id": id},
-            error_message=f"Failed to fetch item with id {id} from general registry!",
-            model=UntypedFetchResponse
+            endpoint=endpoint,
+            id=id,
+            seed_allowed=None,
+            model=UntypedFetchResponse,
+            fetch=lambda: parsed_get_request_with_status(
+                client=self,
+                url=endpoint,
+                params={"id": id},
+                error_message=f"Failed to fetch item with id {id} from general registry!",
+                model=UntypedFetchResponse
+            )
         )
     
     async def get_current_provena_version(self) -> VersionResponse:
@@ -288,7 +381,7 @@ class RegistryClient(ClientService):
     admin: RegistryAdminClient
     general: RegistryGeneralClient
 
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None, cache: Optional[ResponseCache] = None) -> None:
         """Initialises the RegistryClient with authentication and configuration.
 
         Parameters
@@ -297,13 +390,19 @@ class RegistryClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config: Config
             A config object which contains information related to the Provena instance.
+        transport: Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
+        cache: Optional[ResponseCache], optional
+            The shared fetch response cache, by default None (no caching).
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
+        self._cache = cache
 
         # Sub clients
-        self.admin = RegistryAdminClient(auth=auth, config=config)
-        self.general = RegistryGeneralClient(auth=auth, config=config)
+        self.admin = RegistryAdminClient(auth=auth, config=config, transport=transport, cache=cache)
+        self.general = RegistryGeneralClient(auth=auth, config=config, transport=transport, cache=cache)
 
     # Function to get the endpoint URL
     def _build_subtype_endpoint(self, action: RegistryAction, item_subtype: ItemSubType) -> str:
@@ -357,13 +456,20 @@ class RegistryClient(ClientService):
         endpoint = self._build_subtype_endpoint(
             action=RegistryAction.FETCH, item_subtype=item_subtype)
 
-        # fetch the item from the subtype specific endpoint
-        return await parsed_get_request_with_status(
+        # fetch the item from the subtype specific endpoint (or the cache if enabled)
+        return await cached_fetch(
             client=self,
-            params={'id': id, 'seed_allowed': seed_allowed},
-            error_message=f"Failed to fetch item with id {id} and subtype {item_subtype}.",
+            endpoint=endpoint,
+            id=id,
+            seed_allowed=seed_allowed,
             model=fetch_response_model,
-            url=endpoint,
+            fetch=lambda: parsed_get_request_with_status(
+                client=self,
+                params={'id': id, 'seed_allowed': seed_allowed},
+                error_message=f"Failed to fetch item with id {id} and subtype {item_subtype}.",
+                model=fetch_response_model,
+                url=endpoint,
+            )
         )
 
     async def update_item(self, id: str, reason: Optional[str], item_subtype: ItemSubType, domain_info: DomainInfoBase, update_response_model: Type[BaseModelType]) -> BaseModelType:
@@ -393,14 +499,18 @@ class RegistryClient(ClientService):
             action=RegistryAction.UPDATE, item_subtype=item_subtype)
 
         # fetch the item from the subtype specific endpoint
-        return await parsed_put_request_with_status(
-            client=self,
-            params={'id': id, 'reason': reason},
-            json_body=py_to_dict(domain_info),
-            error_message=f"Failed to update item with id {id} and subtype {item_subtype}.",
-            model=update_response_model,
-            url=endpoint,
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client=self,
+                params={'id': id, 'reason': reason},
+                json_body=py_to_dict(domain_info),
+                error_message=f"Failed to update item with id {id} and subtype {item_subtype}.",
+                model=update_response_model,
+                url=endpoint,
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, id)
 
     async def list_items(self, list_items_payload: GeneralListRequest, item_subtype: ItemSubType, update_model_response: Type[BaseModelType]) -> BaseModelType:
         """
@@ -432,7 +542,9 @@ class RegistryClient(ClientService):
             json_body=py_to_dict(list_items_payload),
             error_message=f"Failed to list items for {item_subtype}",
             model=update_model_response,
-            url=endpoint
+            url=endpoint,
+            # read only list - safe to retry
+            idempotent=True
         )
 
     async def seed_item(self, item_subtype: ItemSubType, seed_model_response: Type[BaseModelType]) -> BaseModelType:
@@ -488,14 +600,18 @@ class RegistryClient(ClientService):
         )
 
         # fetch item from the subtype specific endpoint
-        return await parsed_put_request_with_status(
-            client=self,
-            params=None,
-            json_body=py_to_dict(revert_request),
-            error_message=f"Failed to revert items for {item_subtype}",
-            model=ItemRevertResponse,
-            url=endpoint
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client=self,
+                params=None,
+                json_body=py_to_dict(revert_request),
+                error_message=f"Failed to revert items for {item_subtype}",
+                model=ItemRevertResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, revert_request.id)
 
     async def create_item(self, create_item_request: DomainInfoBase, item_subtype: ItemSubType, create_response_model: Type[BaseModelType]) -> BaseModelType:
         """
@@ -674,14 +790,18 @@ class RegistryClient(ClientService):
         )
 
         # fetch item from the subtype specific endpoint
-        return await parsed_put_request_with_status(
-            client=self,
-            params={"id": id},
-            json_body=py_to_dict(auth_change_request),
-            error_message=f"Failed to modify auth config for {item_subtype}",
-            model=StatusResponse,
-            url=endpoint
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client=self,
+                params={"id": id},
+                json_body=py_to_dict(auth_change_request),
+                error_message=f"Failed to modify auth config for {item_subtype}",
+                model=StatusResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, id)
 
     async def get_auth_roles(self, item_subtype: ItemSubType) -> AuthRolesResponse:
         """
@@ -733,14 +853,18 @@ class RegistryClient(ClientService):
         )
 
         # fetch item from the subtype specific endpoint
-        return await parsed_put_request_with_status(
-            client=self,
-            params=None,
-            json_body=py_to_dict(lock_resource_request),
-            error_message=f"Failed to lock resource for {item_subtype}",
-            model=StatusResponse,
-            url=endpoint
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client=self,
+                params=None,
+                json_body=py_to_dict(lock_resource_request),
+                error_message=f"Failed to lock resource for {item_subtype}",
+                model=StatusResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, lock_resource_request.id)
 
     async def unlock_resource(self, unlock_resource_request: LockChangeRequest, item_subtype: ItemSubType) -> StatusResponse:
         """
@@ -764,14 +888,18 @@ class RegistryClient(ClientService):
         )
 
         # fetch item from the subtype specific endpoint
-        return await parsed_put_request_with_status(
-            client=self,
-            params=None,
-            json_body=py_to_dict(unlock_resource_request),
-            error_message=f"Failed to unlock resource for {item_subtype}",
-            model=StatusResponse,
-            url=endpoint
-        )
+        try:
+            return await parsed_put_request_with_status(
+                client=self,
+                params=None,
+                json_body=py_to_dict(unlock_resource_request),
+                error_message=f"Failed to unlock resource for {item_subtype}",
+                model=StatusResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, unlock_resource_request.id)
 
     async def get_lock_history(self, handle_id: str, item_subtype: ItemSubType) -> LockHistoryResponse:
         """
@@ -855,11 +983,15 @@ class RegistryClient(ClientService):
         )
 
         # fetch item from the subtype specific endpoint
-        return await parsed_post_request(
-            client=self,
-            params=None,
-            json_body=py_to_dict(version_request),
-            error_message=f"Failed to complete versioning for subtype {item_subtype}",
-            model=VersionResponse,
-            url=endpoint
-        )
\ No newline at end of file
+        try:
+            return await parsed_post_request(
+                client=self,
+                params=None,
+                json_body=py_to_dict(version_request),
+                error_message=f"Failed to complete versioning for subtype {item_subtype}",
+                model=VersionResponse,
+                url=endpoint
+            )
+        finally:
+            # the item may have changed - drop any cached fetches
+            invalidate_cached_item(self, version_request.id)
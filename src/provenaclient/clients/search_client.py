@@ -29,7 +29,7 @@ class SearchEndpoints(str, Enum):
 
 # L2 interface.
 class SearchClient(ClientService):
-    def __init__(self, auth: AuthManager, config: Config) -> None:
+    def __init__(self, auth: AuthManager, config: Config, transport: Optional[HttpTransport] = None) -> None:
         """Initialises the SearchClient with authentication and configuration.
 
         Parameters
@@ -38,9 +38,12 @@ class SearchClient(ClientService):
             An abstract interface containing the user's requested auth flow method.
         config : Config
             A config object which contains information related to the Provena instance.
+        transport : Optional[HttpTransport], optional
+            The shared pooled HTTP transport to send requests through, by default None.
         """
         self._auth = auth
         self._config = config
+        self._transport = transport
 
     def _build_endpoint(self, endpoint: SearchEndpoints) -> str:
         return self._config.search_api_endpoint + endpoint.value
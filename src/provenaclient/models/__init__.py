@@ -1,2 +1,3 @@
 from .datastore import *
-from .general import *
\ No newline at end of file
+from .general import *
+from .registry import *
@@ -12,9 +12,10 @@ Date      	By	Comments
 ----------	---	---------------------------------------------------------
 '''
 
+from enum import Enum
 from pydantic import BaseModel
 from ProvenaInterfaces.RegistryModels import ItemDataset
-from typing import List, Union
+from typing import List, Optional, Union
 
 class SearchItem(BaseModel):
     id: str
@@ -29,6 +30,9 @@ class UnauthorisedSearchItem(SearchItem):
 class FailedSearchItem(SearchItem):
     error_info : str
 
+# The outcome of loading a single search result
+LoadedSearchOutcome = Union[LoadedSearchItem, UnauthorisedSearchItem, FailedSearchItem]
+
 class RevertMetadata(BaseModel):
     id: str 
     history_id: int
@@ -38,4 +42,60 @@ class LoadedSearchResponse(BaseModel):
     # The successfully loaded search results
     items: List[LoadedSearchItem]
     auth_errors: List[UnauthorisedSearchItem]
-    misc_errors: List[FailedSearchItem]
\ No newline at end of file
+    misc_errors: List[FailedSearchItem]
+
+class FileTransfer(BaseModel):
+    # The local file
+    local_path: str
+    # The object key within the dataset's bucket
+    key: str
+    # The size of the file in bytes
+    size: int
+    # Unix time to set as the modified time of a downloaded file (the object's), if any
+    mtime: Optional[float] = None
+
+class S3ObjectInfo(BaseModel):
+    # The object key within the dataset's bucket
+    key: str
+    # The size of the object in bytes
+    size: int
+    # The entity tag of the object (the MD5 of its content unless uploaded in parts)
+    etag: str
+    # Unix time the object was last modified
+    last_modified: float
+
+class TransferFailure(BaseModel):
+    # The transfer which failed
+    transfer: FileTransfer
+    # The error of the last attempt
+    error_info: str
+    # The number of attempts made
+    attempts: int
+
+class TransferReport(BaseModel):
+    # The files which were transferred
+    transferred: List[FileTransfer] = []
+    # The files which could not be transferred after every attempt
+    failed: List[TransferFailure] = []
+    # The total size of the transferred files in bytes
+    bytes_transferred: int = 0
+
+class SyncDirection(str, Enum):
+    UP = "UP"
+    DOWN = "DOWN"
+
+class SyncReport(BaseModel):
+    # Local to dataset (UP) or dataset to local (DOWN)
+    direction: SyncDirection
+    # True if nothing was transferred or deleted - the report only lists the plan
+    dry_run: bool
+    # The new or changed files which are (or would be) transferred
+    planned_transfers: List[FileTransfer] = []
+    # The extraneous object keys (UP) or local files (DOWN) which are (or would be) deleted
+    planned_deletions: List[str] = []
+    # The number of files which are already in sync
+    unchanged: int = 0
+    # The outcome of the transfers, None for a dry run
+    transfer: Optional[TransferReport] = None
+    # The object keys or local files which were deleted
+    deleted: List[str] = []
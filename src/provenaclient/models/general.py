@@ -39,6 +39,19 @@ class AsyncAwaitSettings(BaseModel):
 DEFAULT_AWAIT_SETTINGS = AsyncAwaitSettings()
 
 
+class CacheStats(BaseModel):
+    # lookups served from the cache
+    hits: int = 0
+    # lookups which required a request (absent or expired)
+    misses: int = 0
+    # entries dropped to stay within max_entries
+    evictions: int = 0
+    # entries dropped because the item was modified
+    invalidations: int = 0
+    # current number of cached entries
+    size: int = 0
+
+
 class GraphProperty(BaseModel):
     type: str
     source: str
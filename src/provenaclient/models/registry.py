@@ -0,0 +1,129 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Set of Pydantic models used to define client interfaces for bulk registry operations and loaded registry searches.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from enum import Enum
+from pydantic import BaseModel
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from ProvenaInterfaces.RegistryAPI import CreateFetchResponse, DatasetFetchResponse, DatasetTemplateFetchResponse, ModelFetchResponse, ModelRunFetchResponse, ModelRunWorkflowTemplateFetchResponse, OrganisationFetchResponse, PersonFetchResponse, StudyFetchResponse, UntypedFetchResponse, VersionFetchResponse
+from ProvenaInterfaces.RegistryModels import ItemSubType
+from provenaclient.models.datastore import FailedSearchItem, SearchItem, UnauthorisedSearchItem
+
+FetchModelType = TypeVar("FetchModelType", bound=BaseModel)
+
+
+class FetchErrorType(str, Enum):
+    NOT_FOUND = "NOT_FOUND"
+    UNAUTHORISED = "UNAUTHORISED"
+    OTHER = "OTHER"
+
+
+class FetchError(BaseModel):
+    error_type: FetchErrorType
+    error_info: str
+
+
+class FetchManyItem(BaseModel, Generic[FetchModelType]):
+    # The outcome of fetching a single id - exactly one of result/error is set
+    id: str
+    result: Optional[FetchModelType] = None
+    error: Optional[FetchError] = None
+
+
+class FetchManyResponse(BaseModel, Generic[FetchModelType]):
+    # The successfully fetched items keyed by id, in the order requested
+    items: Dict[str, FetchModelType]
+    # The ids which could not be fetched and why
+    errors: Dict[str, FetchError]
+
+
+# Any of the typed fetch responses, or untyped for subtypes without one
+RegistryFetchResponse = Union[
+    OrganisationFetchResponse,
+    PersonFetchResponse,
+    CreateFetchResponse,
+    VersionFetchResponse,
+    ModelRunFetchResponse,
+    ModelFetchResponse,
+    ModelRunWorkflowTemplateFetchResponse,
+    DatasetTemplateFetchResponse,
+    DatasetFetchResponse,
+    StudyFetchResponse,
+    UntypedFetchResponse,
+]
+
+# The typed fetch response model of each subtype which has one
+SUBTYPE_FETCH_RESPONSE_MODELS: Dict[ItemSubType, Type[RegistryFetchResponse]] = {
+    ItemSubType.ORGANISATION: OrganisationFetchResponse,
+    ItemSubType.PERSON: PersonFetchResponse,
+    ItemSubType.CREATE: CreateFetchResponse,
+    ItemSubType.VERSION: VersionFetchResponse,
+    ItemSubType.MODEL_RUN: ModelRunFetchResponse,
+    ItemSubType.MODEL: ModelFetchResponse,
+    ItemSubType.MODEL_RUN_WORKFLOW_TEMPLATE: ModelRunWorkflowTemplateFetchResponse,
+    ItemSubType.DATASET_TEMPLATE: DatasetTemplateFetchResponse,
+    ItemSubType.DATASET: DatasetFetchResponse,
+    ItemSubType.STUDY: StudyFetchResponse,
+}
+
+
+class LoadedRegistrySearchItem(SearchItem):
+    # The subtype of the loaded item (if known)
+    item_subtype: Optional[ItemSubType]
+    # The typed fetch response of the item
+    fetch_response: RegistryFetchResponse
+
+
+class LoadedRegistrySearchResponse(BaseModel):
+    # The successfully loaded search results
+    items: List[LoadedRegistrySearchItem]
+    auth_errors: List[UnauthorisedSearchItem]
+    misc_errors: List[FailedSearchItem]
+
+
+class RegistryCountPage(BaseModel):
+    # The number of items on the page (counted from the raw response)
+    count: int
+    # The number of items on the page of each subtype, items without one counted as UNKNOWN
+    subtype_counts: Dict[str, int] = {}
+    # The key of the next page, or None if this is the last page
+    pagination_key: Optional[Dict[str, Any]] = None
+
+
+class RegistryCountProgress(BaseModel):
+    # The subtype whose count just changed
+    item_subtype: ItemSubType
+    # The items of the subtype counted so far
+    count: int
+    # True once every page of the subtype has been counted
+    complete: bool
+    # The items counted so far across every subtype
+    total: int
+
+
+class RegistryMirrorSubtypeSync(BaseModel):
+    # The subtype which was synced
+    item_subtype: ItemSubType
+    # True if every item was loaded (first sync or forced full sync), False if only changed items were fetched
+    full: bool
+    # The number of items written (inserted or updated) in the mirror
+    written: int
+    # The number of mirrored items removed because they are no longer in the registry (full syncs only)
+    removed: int
+    # The updated timestamp the next incremental sync fetches from, or None if the subtype is empty
+    synced_until: Optional[int] = None
+
+
+class RegistryMirrorSyncResult(BaseModel):
+    # The outcome of each subtype which was synced
+    subtypes: Dict[ItemSubType, RegistryMirrorSubtypeSync]
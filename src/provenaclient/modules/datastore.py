@@ -22,13 +22,17 @@ from provenaclient.utils.config import Config
 from provenaclient.clients import DatastoreClient, SearchClient
 from ProvenaInterfaces.DataStoreAPI import *
 from ProvenaInterfaces.RegistryModels import CollectionFormat, ItemSubType
-from provenaclient.models import HealthCheckResponse, LoadedSearchResponse, LoadedSearchItem, UnauthorisedSearchItem, FailedSearchItem, RevertMetadata
+from provenaclient.models import HealthCheckResponse, SyncReport, TransferReport, LoadedSearchResponse, LoadedSearchItem, LoadedSearchOutcome, UnauthorisedSearchItem, FailedSearchItem, RevertMetadata
 from provenaclient.utils.exceptions import *
 from provenaclient.modules.module_helpers import *
 from ProvenaInterfaces.RegistryAPI import NoFilterSubtypeListRequest, VersionRequest, VersionResponse, SortOptions, DatasetListResponse
 from provenaclient.modules.submodules import IOSubModule
 
-from typing import AsyncGenerator, List
+from ProvenaInterfaces.SearchAPI import QueryResult
+from provenaclient.utils.concurrency import bounded_as_completed
+from provenaclient.utils.pagination import DEFAULT_PREFETCH_DEPTH, collect_paginated, paginate
+
+from typing import AsyncGenerator, List, Tuple
 
 # L3 interface.
 
@@ -36,6 +40,11 @@ DEFAULT_SEARCH_LIMIT = 25
 DATASTORE_DEFAULT_SEARCH_LIMIT = 20
 
 
+def dataset_list_items(response: DatasetListResponse) -> Optional[List[ItemDataset]]:
+    """The datasets of a dataset list page (for pagination)."""
+    return response.items
+
+
 class ReviewSubModule(ModuleService):
     _datastore_client: DatastoreClient
 
@@ -164,38 +173,96 @@ class InteractiveDataset(ModuleService):
 
         return await self._datastore_client.fetch_dataset(id=self.dataset_id)
     
-    async def download_all_files(self, destination_directory: str) -> None: 
+    async def download_all_files(self, destination_directory: str) -> TransferReport: 
         """
         Downloads all files to the destination path for your current dataset.
 
         - Fetches info
         - Fetches creds
-        - Uses s3 cloud path lib to download all files to specified location
+        - Downloads the files in parallel (see IOSubModule.download_all_files)
 
         Parameters:
         ---------
         destination_directory (str): 
             The destination path to save files to - use a directory
+
+        Returns
+        -------
+        TransferReport
+            The downloaded files.
         """
 
         return await self.io.download_all_files(destination_directory=destination_directory, dataset_id=self.dataset_id)
     
-    async def upload_all_files(self, source_directory: str) -> None: 
+    async def upload_all_files(self, source_directory: str) -> TransferReport: 
         """
         Uploads all files in the source path to the current dataset's storage location.
 
         - Fetches info
         - Fetches creds
-        - Uses s3 cloud path lib to upload all files to specified location
+        - Uploads the files in parallel (see IOSubModule.upload_all_files)
 
         Parameters
         ----------
         source_directory (str): 
             The source path to upload files from - use a directory
+
+        Returns
+        -------
+        TransferReport
+            The uploaded files.
         """
 
         return await self.io.upload_all_files(source_directory=source_directory, dataset_id=self.dataset_id)
     
+    async def sync_up(self, source_directory: str, delete: bool = False, dry_run: bool = False, checksum: bool = False) -> SyncReport:
+        """
+        Uploads only the new or changed files of a local directory to the current dataset
+        (see IOSubModule.sync_up).
+
+        Parameters
+        ----------
+        source_directory : str
+            The local directory to upload from.
+        delete : bool, optional
+            Delete objects of the dataset which are not in the local directory, by default False.
+        dry_run : bool, optional
+            Only report the planned uploads and deletions, by default False.
+        checksum : bool, optional
+            Compare file content rather than modified times, by default False.
+
+        Returns
+        -------
+        SyncReport
+            The planned and completed uploads and deletions.
+        """
+
+        return await self.io.sync_up(source_directory=source_directory, dataset_id=self.dataset_id, delete=delete, dry_run=dry_run, checksum=checksum)
+
+    async def sync_down(self, destination_directory: str, delete: bool = False, dry_run: bool = False, checksum: bool = False) -> SyncReport:
+        """
+        Downloads only the new or changed files of the current dataset to a local directory
+        (see IOSubModule.sync_down).
+
+        Parameters
+        ----------
+        destination_directory : str
+            The local directory to download to.
+        delete : bool, optional
+            Delete local files which are not in the dataset, by default False.
+        dry_run : bool, optional
+            Only report the planned downloads and deletions, by default False.
+        checksum : bool, optional
+            Compare file content rather than modified times, by default False.
+
+        Returns
+        -------
+        SyncReport
+            The planned and completed downloads and deletions.
+        """
+
+        return await self.io.sync_down(destination_directory=destination_directory, dataset_id=self.dataset_id, delete=delete, dry_run=dry_run, checksum=checksum)
+
     async def version(self, reason: str) -> VersionResponse:
         """Versioning operation which creates a new version from the current dataset.
 
@@ -285,7 +352,7 @@ class InteractiveDataset(ModuleService):
 
         return await self._datastore_client.generate_write_access_credentials(write_access_credentials=credentials_request)
     
-    async def download_specific_file(self, s3_path: str, destination_directory: str) -> None: 
+    async def download_specific_file(self, s3_path: str, destination_directory: str) -> TransferReport: 
         """
         Downloads a specific file or folder for the current dataset 
         from an S3 bucket to a provided destination path.
@@ -309,10 +376,14 @@ class InteractiveDataset(ModuleService):
         destination_directory : str
             The destination path to save files to - use a directory.
 
+        Returns
+        -------
+        TransferReport
+            The downloaded files.
         """
 
         # Calls the function in IO sub module.
-        await self.io.download_specific_file(dataset_id=self.dataset_id, 
+        return await self.io.download_specific_file(dataset_id=self.dataset_id, 
                                               s3_path=s3_path, 
                                               destination_directory=destination_directory)
 
@@ -477,10 +548,13 @@ class Datastore(ModuleService):
 
         return await self._datastore_client.version_dataset(version_dataset_payload=version_request)
 
-    async def for_all_datasets(self, list_dataset_request: NoFilterSubtypeListRequest, total_limit: Optional[int] = None) -> AsyncGenerator[ItemDataset, None]:
+    async def for_all_datasets(self, list_dataset_request: NoFilterSubtypeListRequest, total_limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[ItemDataset, None]:
         """Fetches all datasets based on the provided datasets in datastore based on 
             the provided sorting criteria, pagination key and page size. 
 
+            Upcoming pages are fetched while the current page is consumed, and the
+            provided request is not modified.
+
         Parameters
         ----------
         list_dataset_request : NoFilterSubtypeListRequest
@@ -490,6 +564,8 @@ class Datastore(ModuleService):
             A maximum number of datasets to fetch. If specified, the generator will 
             stop yielding datasets once this limit is reached. 
             If None, it will fetch datasets until there are no more to fetch.
+        prefetch : int, optional
+            The number of pages to fetch ahead of the consumer, by default DEFAULT_PREFETCH_DEPTH.
 
         Returns
         -------
@@ -504,27 +580,14 @@ class Datastore(ModuleService):
 
         """
 
-        total_fetched = 0
-
-        while True:
-            response = await self._datastore_client.list_datasets(list_request=list_dataset_request)
-
-            # We will keep track of the total numbers of items fetched in the request from the API itself.
-            if response.items:
-                for dataset in response.items:
-                    if total_limit is not None and total_fetched >= total_limit:
-                        return
-                    yield dataset
-                    total_fetched = total_fetched + 1
-            else:
-                # If there are issues with gathering responses, we will increment based on the page size.
-                total_fetched = total_fetched + list_dataset_request.page_size
-
-            if response.pagination_key is None:
-                break
-
-            # Update the pagination key for the next set of requests.
-            list_dataset_request.pagination_key = response.pagination_key
+        async for dataset in paginate(
+            request=list_dataset_request,
+            fetch_page=lambda request: self._datastore_client.list_datasets(list_request=request),
+            get_items=dataset_list_items,
+            prefetch=prefetch,
+            total_limit=total_limit
+        ):
+            yield dataset
 
     async def list_datasets(self, list_dataset_request: NoFilterSubtypeListRequest) -> DatasetListResponse:
         """Takes a specific dataset list request and returns the response.
@@ -546,7 +609,7 @@ class Datastore(ModuleService):
         datasets = await self._datastore_client.list_datasets(list_request=list_dataset_request)
         return datasets
 
-    async def list_all_datasets(self, sort_criteria: Optional[SortOptions] = None) -> List[ItemDataset]:
+    async def list_all_datasets(self, sort_criteria: Optional[SortOptions] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> List[ItemDataset]:
         """Fetches all datasets from the datastore and you may provide your own sort criteria.
         By default uses display name sort criteria. 
 
@@ -555,6 +618,8 @@ class Datastore(ModuleService):
         sort_criteria : Optional[SortOptions]
             An object configured with sorting options that you want 
             when displaying all datasets within the datastore.
+        prefetch : int, optional
+            The number of pages to fetch ahead while collecting, by default DEFAULT_PREFETCH_DEPTH.
 
         Returns
         -------
@@ -568,21 +633,12 @@ class Datastore(ModuleService):
             page_size=DATASTORE_DEFAULT_SEARCH_LIMIT
         )
 
-        combined_dataset_list: List[ItemDataset] = []
-
-        while True:
-            response = await self._datastore_client.list_datasets(list_request=list_dataset_request)
-
-            if response.items:
-                combined_dataset_list.extend(response.items)
-
-            if response.pagination_key is None:
-                break
-
-            # Update the pagination key for the next request
-            list_dataset_request.pagination_key = response.pagination_key
-
-        return combined_dataset_list
+        return await collect_paginated(
+            request=list_dataset_request,
+            fetch_page=lambda request: self._datastore_client.list_datasets(list_request=request),
+            get_items=dataset_list_items,
+            prefetch=prefetch
+        )
 
     async def generate_dataset_presigned_url(self, dataset_presigned_request: PresignedURLRequest) -> PresignedURLResponse:
         """Generates a presigned url for an existing dataset.
@@ -634,65 +690,109 @@ class Datastore(ModuleService):
 
         return await self._datastore_client.generate_write_access_credentials(write_access_credentials=credentials)
 
-    async def search_datasets(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> LoadedSearchResponse:
+    async def _search_dataset_results(self, query: str, limit: int) -> List[QueryResult]:
+        # search with search client - results are ordered by descending score
+        search_results = await self._search_client.search_registry(
+            query=query,
+            limit=limit,
+            subtype_filter=ItemSubType.DATASET
+        )
+        assert search_results.results is not None
+        return search_results.results
+
+    async def _load_search_result(self, item: QueryResult) -> LoadedSearchOutcome:
+        # load item checking 401 for auth errors or misc errors recorded
+        try:
+            loaded_dataset = await self._datastore_client.fetch_dataset(
+                id=item.id
+            )
+            assert loaded_dataset.item
+            return LoadedSearchItem(
+                id=item.id,
+                item=loaded_dataset.item,
+                score=item.score
+            )
+        except AuthException as e:
+            return UnauthorisedSearchItem(
+                id=item.id,
+                score=item.score
+            )
+        except Exception as e:
+            return FailedSearchItem(
+                id=item.id,
+                score=item.score,
+                error_info=f"Failed to fetch item, error: {e}."
+            )
+
+    async def _load_search_results(self, results: List[QueryResult], concurrency: int) -> AsyncGenerator[Tuple[int, LoadedSearchOutcome], None]:
+        # yields (rank, outcome) as each load completes
+        async for index, _, outcome in bounded_as_completed(inputs=results, fn=self._load_search_result, concurrency=concurrency):
+            # _load_search_result captures all errors
+            assert not isinstance(outcome, Exception)
+            yield index, outcome
+
+    async def search_datasets(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> LoadedSearchResponse:
         """
 
         Utilises the L2 search client to search for datasets with the specified
         query.
 
-        Loads all datasets in the result payload from the data store and sorts
-        based on auth, or other exceptions if not successful.
+        Loads all datasets in the result payload from the data store
+        concurrently and sorts based on auth, or other exceptions if not
+        successful. Each list retains the search score ordering.
 
         Args:
-            query (str): The query to make limit (int, optional): The result
-            count limit. Defaults to DEFAULT_SEARCH_LIMIT.
+            query (str): The query to make
+            limit (int, optional): The result count limit. Defaults to DEFAULT_SEARCH_LIMIT.
+            concurrency (int, optional): Maximum concurrent dataset loads. Defaults to DEFAULT_FETCH_MANY_CONCURRENCY.
 
         Returns:
             LoadedSearchResponse: The loaded items incl errors.
         """
-        # search with search client
-        search_results = await self._search_client.search_registry(
-            query=query,
-            limit=limit,
-            subtype_filter=ItemSubType.DATASET
-        )
+        results = await self._search_dataset_results(query=query, limit=limit)
+
+        outcomes: List[Optional[LoadedSearchOutcome]] = [None] * len(results)
+        async for index, outcome in self._load_search_results(results=results, concurrency=concurrency):
+            outcomes[index] = outcome
 
-        # load each result checking 401 for auth errors or misc errors recorded
         success: List[LoadedSearchItem] = []
         auth_err: List[UnauthorisedSearchItem] = []
         misc_err: List[FailedSearchItem] = []
 
-        assert search_results.results is not None
-        for item in search_results.results:
-            # load item
-            try:
-                loaded_dataset = await self._datastore_client.fetch_dataset(
-                    id=item.id
-                )
-                assert loaded_dataset.item
-                success.append(LoadedSearchItem(
-                    id=item.id,
-                    item=loaded_dataset.item,
-                    score=item.score
-                ))
-            except AuthException as e:
-                auth_err.append(UnauthorisedSearchItem(
-                    id=item.id,
-                    score=item.score
-                ))
-            except Exception as e:
-                misc_err.append(FailedSearchItem(
-                    id=item.id,
-                    score=item.score,
-                    error_info=f"Failed to fetch item, error: {e}."
-                ))
+        # partition in rank order
+        for loaded in outcomes:
+            if isinstance(loaded, LoadedSearchItem):
+                success.append(loaded)
+            elif isinstance(loaded, UnauthorisedSearchItem):
+                auth_err.append(loaded)
+            elif isinstance(loaded, FailedSearchItem):
+                misc_err.append(loaded)
 
         return LoadedSearchResponse(
             items=success,
             auth_errors=auth_err,
             misc_errors=misc_err
         )
-    
+
+    async def search_datasets_stream(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> AsyncGenerator[LoadedSearchOutcome, None]:
+        """
+
+        As search_datasets, but yields each result as soon as its dataset has
+        been loaded (in completion order rather than score order), so results
+        can be processed while the remainder are still loading.
+
+        Args:
+            query (str): The query to make
+            limit (int, optional): The result count limit. Defaults to DEFAULT_SEARCH_LIMIT.
+            concurrency (int, optional): Maximum concurrent dataset loads. Defaults to DEFAULT_FETCH_MANY_CONCURRENCY.
+
+        Yields:
+            LoadedSearchOutcome: A LoadedSearchItem, or an UnauthorisedSearchItem/FailedSearchItem if it could not be loaded.
+        """
+        results = await self._search_dataset_results(query=query, limit=limit)
+        async for _, outcome in self._load_search_results(results=results, concurrency=concurrency):
+            yield outcome
+
     async def interactive_dataset(self, dataset_id: str) -> InteractiveDataset:
         """Creates an interactive "session" with a dataset that allows you 
         to perform further operations without re-supplying dataset id and 
@@ -20,7 +20,23 @@ from provenaclient.modules.module_helpers import *
 from provenaclient.models import HealthCheckResponse, AsyncAwaitSettings, DEFAULT_AWAIT_SETTINGS
 from provenaclient.utils.async_job_helpers import wait_for_full_lifecycle, wait_for_full_successful_lifecycle
 from ProvenaInterfaces.AsyncJobAPI import *
-from typing import List, AsyncGenerator
+from provenaclient.utils.pagination import DEFAULT_PREFETCH_DEPTH, collect_paginated, paginate
+from typing import List, AsyncGenerator, Union
+
+JobListResponse = Union[ListJobsResponse, ListByBatchResponse, AdminListJobsResponse, AdminListByBatchResponse]
+
+
+def job_list_items(response: JobListResponse) -> List[JobStatusTable]:
+    """
+    The jobs of a job list page (for pagination).
+
+    Args:
+        response (JobListResponse): The page
+
+    Returns:
+        List[JobStatusTable]: The jobs
+    """
+    return response.jobs
 
 # L3 interface.
 
@@ -82,39 +98,32 @@ class JobAdminSubService(ModuleService):
         """
         return await self._job_api_client.admin.list_jobs(list_jobs_request=list_jobs_request)
     
-    async def list_all_jobs(self, list_jobs_request: AdminListJobsRequest, limit: Optional[int] = None) -> List[JobStatusTable]:
+    async def list_all_jobs(self, list_jobs_request: AdminListJobsRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> List[JobStatusTable]:
         """
         Lists all jobs for the given user.
 
         Will automatically paginate until list is exhausted.
 
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
+
         Args:
             list_jobs_request (AdminListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        all_jobs: List[JobStatusTable] = []
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.admin.list_jobs(list_jobs_request=list_jobs_request)
-            count += len(new_list.jobs)
-            all_jobs.extend(new_list.jobs)
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_jobs_request.pagination_key = new_list.pagination_key
-
-        return all_jobs
+        return await collect_paginated(
+            request=list_jobs_request,
+            fetch_page=lambda request: self._job_api_client.admin.list_jobs(list_jobs_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        )
 
-    async def for_all_jobs(self, list_jobs_request: AdminListJobsRequest, limit: Optional[int] = None) -> AsyncGenerator[JobStatusTable, None]:
+    async def for_all_jobs(self, list_jobs_request: AdminListJobsRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[JobStatusTable, None]:
         """
         Lists all jobs for the given user.
 
@@ -122,30 +131,25 @@ class JobAdminSubService(ModuleService):
 
         Will automatically paginate until list is exhausted.
 
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
+
         Args:
             list_jobs_request (AdminListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.admin.list_jobs(list_jobs_request=list_jobs_request)
-            count += len(new_list.jobs)
-
-            for job in new_list.jobs:
-                yield job
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_jobs_request.pagination_key = new_list.pagination_key
+        async for job in paginate(
+            request=list_jobs_request,
+            fetch_page=lambda request: self._job_api_client.admin.list_jobs(list_jobs_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        ):
+            yield job
     
 
     async def list_job_batch(self, list_request: AdminListByBatchRequest) -> AdminListByBatchResponse:
@@ -160,72 +164,54 @@ class JobAdminSubService(ModuleService):
         """
         return await self._job_api_client.admin.list_jobs_in_batch(list_request=list_request)
 
-    async def list_all_jobs_in_batch(self, list_request: AdminListByBatchRequest, limit: Optional[int] = None) -> List[JobStatusTable]:
+    async def list_all_jobs_in_batch(self, list_request: AdminListByBatchRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> List[JobStatusTable]:
         """
         Lists all jobs for the given user. Will automatically paginate all
         entries to exhaust list 
 
-        NOTE this could return more than limit - but figure it may as well
-        return data fetched for efficiency reasons
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
 
         Args:
             list_jobs_request (AdminListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        all_jobs: List[JobStatusTable] = []
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.admin.list_jobs_in_batch(list_request=list_request)
-            count += len(new_list.jobs)
-            all_jobs.extend(new_list.jobs)
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_request.pagination_key = new_list.pagination_key
-
-        return all_jobs
+        return await collect_paginated(
+            request=list_request,
+            fetch_page=lambda request: self._job_api_client.admin.list_jobs_in_batch(list_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        )
 
-    async def for_all_jobs_in_batch(self, list_request: AdminListByBatchRequest, limit: Optional[int] = None) -> AsyncGenerator[JobStatusTable, None]:
+    async def for_all_jobs_in_batch(self, list_request: AdminListByBatchRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[JobStatusTable, None]:
         """
         Lists all jobs for the given user. Will automatically paginate all
         entries to exhaust list
 
-        NOTE this could return more than limit - but figure it may as well
-        return data fetched for efficiency reasons
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
 
         Args:
             list_jobs_request (AdminListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.admin.list_jobs_in_batch(list_request=list_request)
-            count += len(new_list.jobs)
-
-            for job in new_list.jobs:
-                yield job
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_request.pagination_key = new_list.pagination_key
+        async for job in paginate(
+            request=list_request,
+            fetch_page=lambda request: self._job_api_client.admin.list_jobs_in_batch(list_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        ):
+            yield job
 
 class JobService(ModuleService):
     _job_api_client: JobAPIClient
@@ -290,39 +276,32 @@ class JobService(ModuleService):
         """
         return await self._job_api_client.list_jobs(list_jobs_request=list_jobs_request)
 
-    async def list_all_jobs(self, list_jobs_request: ListJobsRequest, limit: Optional[int] = None) -> List[JobStatusTable]:
+    async def list_all_jobs(self, list_jobs_request: ListJobsRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> List[JobStatusTable]:
         """
         Lists all jobs for the given user.
 
         Will automatically paginate until list is exhausted.
 
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
+
         Args:
             list_jobs_request (ListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        all_jobs: List[JobStatusTable] = []
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.list_jobs(list_jobs_request=list_jobs_request)
-            count += len(new_list.jobs)
-            all_jobs.extend(new_list.jobs)
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_jobs_request.pagination_key = new_list.pagination_key
-
-        return all_jobs
+        return await collect_paginated(
+            request=list_jobs_request,
+            fetch_page=lambda request: self._job_api_client.list_jobs(list_jobs_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        )
 
-    async def for_all_jobs(self, list_jobs_request: ListJobsRequest, limit: Optional[int] = None) -> AsyncGenerator[JobStatusTable, None]:
+    async def for_all_jobs(self, list_jobs_request: ListJobsRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[JobStatusTable, None]:
         """
         Lists all jobs for the given user.
 
@@ -330,30 +309,25 @@ class JobService(ModuleService):
 
         Will automatically paginate until list is exhausted.
 
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
+
         Args:
             list_jobs_request (ListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.list_jobs(list_jobs_request=list_jobs_request)
-            count += len(new_list.jobs)
-
-            for job in new_list.jobs:
-                yield job
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_jobs_request.pagination_key = new_list.pagination_key
+        async for job in paginate(
+            request=list_jobs_request,
+            fetch_page=lambda request: self._job_api_client.list_jobs(list_jobs_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        ):
+            yield job
 
     async def list_jobs_in_batch(self, list_request: ListByBatchRequest) -> ListByBatchResponse:
         """
@@ -369,72 +343,54 @@ class JobService(ModuleService):
         """
         return await self._job_api_client.list_jobs_in_batch(list_request=list_request)
 
-    async def list_all_jobs_in_batch(self, list_request: ListByBatchRequest, limit: Optional[int] = None) -> List[JobStatusTable]:
+    async def list_all_jobs_in_batch(self, list_request: ListByBatchRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> List[JobStatusTable]:
         """
         Lists all jobs for the given user. Will automatically paginate all
         entries to exhaust list 
 
-        NOTE this could return more than limit - but figure it may as well
-        return data fetched for efficiency reasons
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
 
         Args:
             list_jobs_request (ListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        all_jobs: List[JobStatusTable] = []
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.list_jobs_in_batch(list_request=list_request)
-            count += len(new_list.jobs)
-            all_jobs.extend(new_list.jobs)
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_request.pagination_key = new_list.pagination_key
-
-        return all_jobs
+        return await collect_paginated(
+            request=list_request,
+            fetch_page=lambda request: self._job_api_client.list_jobs_in_batch(list_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        )
 
-    async def for_all_jobs_in_batch(self, list_request: ListByBatchRequest, limit: Optional[int] = None) -> AsyncGenerator[JobStatusTable, None]:
+    async def for_all_jobs_in_batch(self, list_request: ListByBatchRequest, limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[JobStatusTable, None]:
         """
         Lists all jobs for the given user. Will automatically paginate all
         entries to exhaust list
 
-        NOTE this could return more than limit - but figure it may as well
-        return data fetched for efficiency reasons
+        Upcoming pages are fetched while the current page is consumed, and the
+        request is not modified.
 
         Args:
             list_jobs_request (ListJobsRequest): The request including details
             limit (Optional[int]): Total record limit to enforce, if any
+            prefetch (int): Number of pages to fetch ahead while paginating. Defaults to DEFAULT_PREFETCH_DEPTH.
 
         Returns:
             ListJobsResponse: The list of jobs
         """
-        count = 0
-
-        # paginate until limit hit
-        while True:
-            new_list = await self._job_api_client.list_jobs_in_batch(list_request=list_request)
-            count += len(new_list.jobs)
-
-            for job in new_list.jobs:
-                yield job
-
-            if limit is not None and count >= limit:
-                break
-
-            if new_list.pagination_key is None:
-                break
-
-            list_request.pagination_key = new_list.pagination_key
+        async for job in paginate(
+            request=list_request,
+            fetch_page=lambda request: self._job_api_client.list_jobs_in_batch(list_request=request),
+            get_items=job_list_items,
+            prefetch=prefetch,
+            total_limit=limit
+        ):
+            yield job
 
     async def await_job_completion(self, session_id: str, settings: AsyncAwaitSettings = DEFAULT_AWAIT_SETTINGS) -> JobStatusTable:
         """
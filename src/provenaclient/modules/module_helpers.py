@@ -15,8 +15,12 @@ Date      	By	Comments
 '''
 
 from abc import ABC
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable
 from provenaclient.auth import AuthManager
+from provenaclient.models.registry import FetchError, FetchErrorType, FetchManyItem, FetchManyResponse, FetchModelType
+from provenaclient.utils.concurrency import bounded_as_completed
 from provenaclient.utils.config import Config
+from provenaclient.utils.exceptions import AuthException, NotFoundException, ServerException, StatusFailureException
 
 
 class ModuleService(ABC):
@@ -26,3 +30,77 @@ class ModuleService(ABC):
     """
     _auth: AuthManager
     _config: Config
+
+
+DEFAULT_FETCH_MANY_CONCURRENCY = 10
+
+
+def classify_fetch_error(error: Exception) -> FetchError:
+    """
+    Categorises an exception raised while fetching an item. The registry
+    reports a missing item as a 200 OK with a failed status, so a status
+    failure (which the request helpers raise as the cause of their own
+    exception) is categorised as not found.
+
+    Args:
+        error (Exception): The exception raised by the fetch
+
+    Returns:
+        FetchError: The not found/unauthorised/other error
+    """
+    if isinstance(error, (NotFoundException, StatusFailureException)) or isinstance(error.__cause__, StatusFailureException):
+        error_type = FetchErrorType.NOT_FOUND
+    elif isinstance(error, AuthException) or (isinstance(error, ServerException) and error.error_code == 403):
+        error_type = FetchErrorType.UNAUTHORISED
+    else:
+        error_type = FetchErrorType.OTHER
+    return FetchError(error_type=error_type, error_info=f"Failed to fetch item, error: {error}.")
+
+
+async def stream_fetch_many(ids: Iterable[str], fetch: Callable[[str], Awaitable[FetchModelType]], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> AsyncIterator[FetchManyItem[FetchModelType]]:
+    """
+    Fetches many items with bounded concurrency, yielding each result (or
+    categorised error) as soon as it completes. Duplicate ids are fetched once.
+
+    Args:
+        ids (Iterable[str]): The ids to fetch
+        fetch (Callable[[str], Awaitable[FetchModelType]]): Fetches a single id
+        concurrency (int, optional): Maximum concurrent fetches. Defaults to DEFAULT_FETCH_MANY_CONCURRENCY.
+
+    Yields:
+        FetchManyItem[FetchModelType]: The outcome per id, in completion order
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    async for _, id, outcome in bounded_as_completed(inputs=unique_ids, fn=fetch, concurrency=concurrency):
+        if isinstance(outcome, Exception):
+            yield FetchManyItem(id=id, error=classify_fetch_error(outcome))
+        else:
+            yield FetchManyItem(id=id, result=outcome)
+
+
+async def collect_fetch_many(ids: Iterable[str], fetch: Callable[[str], Awaitable[FetchModelType]], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> FetchManyResponse[FetchModelType]:
+    """
+    Fetches many items with bounded concurrency, collecting the results and
+    per id errors.
+
+    Args:
+        ids (Iterable[str]): The ids to fetch
+        fetch (Callable[[str], Awaitable[FetchModelType]]): Fetches a single id
+        concurrency (int, optional): Maximum concurrent fetches. Defaults to DEFAULT_FETCH_MANY_CONCURRENCY.
+
+    Returns:
+        FetchManyResponse[FetchModelType]: The fetched items (in requested order) and errors keyed by id
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    results: Dict[str, FetchModelType] = {}
+    errors: Dict[str, FetchError] = {}
+    async for outcome in stream_fetch_many(ids=unique_ids, fetch=fetch, concurrency=concurrency):
+        if outcome.error is not None:
+            errors[outcome.id] = outcome.error
+        elif outcome.result is not None:
+            results[outcome.id] = outcome.result
+
+    return FetchManyResponse[FetchModelType](
+        items={id: results[id] for id in unique_ids if id in results},
+        errors={id: errors[id] for id in unique_ids if id in errors}
+    )
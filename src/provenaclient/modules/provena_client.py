@@ -16,49 +16,44 @@ Date      	By	Comments
 
 from provenaclient.auth.manager import AuthManager
 from provenaclient.utils.config import Config
+from provenaclient.utils.cache import ResponseCache
+from provenaclient.utils.http_client import HttpTransport
+from provenaclient.models.general import CacheStats
 from provenaclient.clients import *
 from provenaclient.modules import *
 from provenaclient.modules.module_helpers import *
+from functools import cached_property
+from types import TracebackType
+from typing import Optional, Type
 
 # L3 interface.
 
 
 class ProvenaClient(ModuleService):
-    # L2 + L3 combinations
+    # Pooled HTTP transport shared by all L2 clients
+    _transport: HttpTransport
 
-    # Data store
-    _datastore_client: DatastoreClient
-    datastore: Datastore
-
-    # Search
-    _search_client: SearchClient
-    search: Search
-
-    # Auth
-    _auth_client: AuthClient
-    auth_api: Auth
-
-    # Registry
-    _registry_client: RegistryClient
-    registry: Registry
-
-    # Prov
-    _prov_client: ProvClient
-    prov_api: Prov
-
-    # Jobs
-    _job_client: JobAPIClient
-    job_api: JobService
-
-    # ID service
-    _id_client: IdServiceClient
-    id_api: IDService
+    # Opt-in fetch response cache shared by the registry/datastore L2 clients
+    _cache: Optional[ResponseCache]
 
     def __init__(self, auth: AuthManager, config: Config) -> None:
         """
 
         Build an instance of the Provena Client.
 
+        All L2 clients share a single pooled HTTP transport (configured through
+        config.transport_settings) which also applies config.retry_settings to
+        transient failures and bounds in-flight requests to each service with
+        config.concurrency_settings - release it with aclose() or by using the
+        client as an async context manager e.g.
+
+        async with ProvenaClient(auth=auth, config=config) as client:
+            ...
+
+        The L2 clients and L3 modules (datastore, search, auth_api, registry,
+        prov_api, job_api, id_api) are only built when first accessed, so
+        scripts only pay for the APIs they use.
+
         Args:
             auth (AuthManager): The Auth implementation to use. See auth.implementations
             config (Config): The provena config which indicates deployment and other settings
@@ -67,55 +62,146 @@ class ProvenaClient(ModuleService):
         self._auth = auth
         self._config = config
 
-        # (L2 clients)
-        self._datastore_client = DatastoreClient(auth, config)
-        self._search_client = SearchClient(auth, config)
-        self._auth_client = AuthClient(auth, config)
-        self._registry_client = RegistryClient(auth, config)
-        self._prov_client = ProvClient(auth, config)
-        self._job_client = JobAPIClient(auth, config)
-        self._id_client = IdServiceClient(auth, config)
-
-        self.datastore = Datastore(
-            auth=auth,
-            config=config,
+        # Shared connection pool (and retry budget)
+        self._transport = HttpTransport(
+            settings=config.transport_settings, retry_settings=config.retry_settings, concurrency_settings=config.concurrency_settings)
+
+        # Opt-in registry/datastore fetch cache
+        self._cache = ResponseCache(
+            config.cache_settings) if config.cache_settings.enabled else None
+
+    # L2 clients - built on first use and shared between the L3 modules
+
+    @cached_property
+    def _datastore_client(self) -> DatastoreClient:
+        return DatastoreClient(self._auth, self._config, self._transport, self._cache)
+
+    @cached_property
+    def _search_client(self) -> SearchClient:
+        return SearchClient(self._auth, self._config, self._transport)
+
+    @cached_property
+    def _auth_client(self) -> AuthClient:
+        return AuthClient(self._auth, self._config, self._transport)
+
+    @cached_property
+    def _registry_client(self) -> RegistryClient:
+        return RegistryClient(self._auth, self._config, self._transport, self._cache)
+
+    @cached_property
+    def _prov_client(self) -> ProvClient:
+        return ProvClient(self._auth, self._config, self._transport)
+
+    @cached_property
+    def _job_client(self) -> JobAPIClient:
+        return JobAPIClient(self._auth, self._config, self._transport)
+
+    @cached_property
+    def _id_client(self) -> IdServiceClient:
+        return IdServiceClient(self._auth, self._config, self._transport)
+
+    # L3 modules - built on first access
+
+    @cached_property
+    def datastore(self) -> Datastore:
+        return Datastore(
+            auth=self._auth,
+            config=self._config,
             datastore_client=self._datastore_client,
             search_client=self._search_client
         )
 
-        self.search = Search(
-            auth=auth,
-            config=config,
-            search_client=self._search_client
+    @cached_property
+    def search(self) -> Search:
+        return Search(
+            auth=self._auth,
+            config=self._config,
+            search_client=self._search_client,
+            registry_client=self._registry_client
         )
 
-        self.auth_api = Auth(
-            auth=auth,
-            config=config,
+    @cached_property
+    def auth_api(self) -> Auth:
+        return Auth(
+            auth=self._auth,
+            config=self._config,
             auth_client=self._auth_client
         )
 
-        self.registry = Registry(
-            auth=auth,
-            config=config,
+    @cached_property
+    def registry(self) -> Registry:
+        return Registry(
+            auth=self._auth,
+            config=self._config,
             registry_client=self._registry_client
         )
 
-        self.prov_api = Prov(
-            auth=auth,
-            config=config,
+    @cached_property
+    def prov_api(self) -> Prov:
+        return Prov(
+            auth=self._auth,
+            config=self._config,
             prov_client=self._prov_client,
             registry_client=self._registry_client
         )
 
-        self.job_api = JobService(
-            auth=auth,
-            config=config,
+    @cached_property
+    def job_api(self) -> JobService:
+        return JobService(
+            auth=self._auth,
+            config=self._config,
             job_api_client=self._job_client
         )
 
-        self.id_api = IDService(
-            auth=auth,
-            config=config,
+    @cached_property
+    def id_api(self) -> IDService:
+        return IDService(
+            auth=self._auth,
+            config=self._config,
             id_service_client=self._id_client
         )
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """
+        Reports the hit/miss statistics of the fetch response cache.
+
+        Returns:
+            Optional[CacheStats]: The statistics, or None if caching is not enabled (see config.cache_settings)
+        """
+        return self._cache.stats() if self._cache is not None else None
+
+    def clear_cache(self) -> None:
+        """
+        Drops all cached fetch responses (if caching is enabled).
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared HTTP transport, releasing any pooled connections,
+        stops any background token renewal and shuts down the datastore IO
+        thread pool.
+
+        The client can still be used afterwards - a new pool is created on the
+        next request.
+        """
+        await self._auth.stop_background_renewal()
+        await self._transport.aclose()
+        # the datastore module is built on first use - nothing to close otherwise
+        if "datastore" in self.__dict__:
+            self.datastore.io.close()
+
+    async def __aenter__(self) -> "ProvenaClient":
+        # opt-in background token renewal runs for the lifetime of the context
+        if self._auth.renewal_margin is not None:
+            self._auth.start_background_renewal()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
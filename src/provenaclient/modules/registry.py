@@ -26,12 +26,25 @@ from provenaclient.modules.module_helpers import *
 from provenaclient.clients import RegistryClient
 from ProvenaInterfaces.RegistryModels import *
 from ProvenaInterfaces.RegistryAPI import *
-from typing import Optional
+from provenaclient.models.registry import FetchManyItem, FetchManyResponse, FetchModelType, RegistryCountProgress
+from provenaclient.utils.concurrency import bounded_as_completed
+from typing import AsyncGenerator, AsyncIterator, Callable, Generic, List, Optional
+import os
 from provenaclient.utils.helpers import convert_to_item_subtype, write_file_helper, get_and_validate_file_path
 from abc import abstractmethod
+from provenaclient.utils.pagination import DEFAULT_PREFETCH_DEPTH, paginate, paginate_pages
+from provenaclient.modules.submodules.registry_mirror_submodule import DEFAULT_MIRROR_PATH, RegistryMirror
+
+
+def registry_list_items(response: PaginatedListResponse) -> Optional[List[Dict[str, Any]]]:
+    """The (unparsed) items of a registry list page (for pagination)."""
+    return response.items
 
 
 DEFAULT_CONFIG_FILE_NAME = "registry-api.env"
+DEFAULT_EXPORT_FILE_NAME = "registry-export.ndjson"
+# Page size used when counting registry items - large pages as the items are never parsed
+DEFAULT_COUNT_PAGE_SIZE = 200
 
 # L3 interface.
 
@@ -72,6 +85,69 @@ class RegistryAdminClient(ModuleService):
 
         return await self._registry_client.admin.export_items()
     
+    async def export_items_stream(self, file_path: Optional[str] = None, write_to_file: bool = False) -> AsyncGenerator[BundledItem, None]:
+        """Streams the current contents of the registry table, parsing each item as it
+        arrives rather than loading the full export into memory. Optionally writes each item
+        to a newline delimited JSON (NDJSON) file as it is received, which can be read back
+        with BundledItem.model_validate_json per line.
+
+        Parameters
+        ----------
+        file_path: str, optional
+            The path you want to save the NDJSON file at WITH the file name. If you don't specify a path
+            this will be saved in a relative directory.
+        write_to_file: bool, By default False
+            A boolean flag to indicate whether you want to save the items to a file
+            or not.
+
+        Yields
+        -------
+        BundledItem
+            Each exported item, in the order received.
+        """
+
+        file_path = get_and_validate_file_path(file_path=file_path, write_to_file=write_to_file, default_file_name=DEFAULT_EXPORT_FILE_NAME)
+
+        if not write_to_file:
+            async for item in self._registry_client.admin.export_items_stream():
+                yield item
+            return
+
+        if file_path is None:
+            raise ValueError("File path is not set for writing the export.")
+
+        # write to a temporary file so an interrupted export never leaves a partial file in place
+        temporary_path = f"{file_path}.partial"
+        try:
+            with open(temporary_path, 'w') as file:
+                async for item in self._registry_client.admin.export_items_stream():
+                    file.write(item.model_dump_json() + "\n")
+                    yield item
+            os.replace(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    async def export_items_to_file(self, file_path: Optional[str] = None) -> int:
+        """Streams the current contents of the registry table straight into a newline delimited
+        JSON (NDJSON) file, one item per line, so memory use stays flat regardless of registry size.
+
+        Parameters
+        ----------
+        file_path: str, optional
+            The path you want to save the NDJSON file at WITH the file name. If you don't specify a path
+            this will be saved in a relative directory.
+
+        Returns
+        -------
+        int
+            The number of items written.
+        """
+        count = 0
+        async for _ in self.export_items_stream(file_path=file_path, write_to_file=True):
+            count += 1
+        return count
+
     async def import_items(self, registry_import_request: RegistryImportRequest) -> RegistryImportResponse:
         """This admin only endpoint enables rapid restoration of items in into the registry table.
 
@@ -178,7 +254,7 @@ class RegistryAdminClient(ModuleService):
         )
     
     
-class RegistryBaseClass(ModuleService):
+class RegistryBaseClass(ModuleService, Generic[FetchModelType]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient, item_subtype: ItemSubType) -> None:
@@ -199,7 +275,72 @@ class RegistryBaseClass(ModuleService):
         self._registry_client = registry_client
         self.item_subtype = item_subtype
 
-    
+
+    @abstractmethod
+    async def fetch(self, id: str, seed_allowed: Optional[bool] = None) -> FetchModelType:
+        """Fetches an item of this client's subtype from the registry.
+
+        Parameters
+        ----------
+        id : str
+            The ID of the item.
+        seed_allowed : Optional[bool], optional
+            Allow seed items, by default None.
+
+        Returns
+        -------
+        FetchModelType
+            The fetch response of this client's subtype.
+        """
+        pass
+
+    async def fetch_many(self, ids: List[str], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY, seed_allowed: Optional[bool] = None) -> FetchManyResponse[FetchModelType]:
+        """Fetches many items of this client's subtype from the registry concurrently.
+
+        Parameters
+        ----------
+        ids : List[str]
+            The IDs of the items to fetch.
+        concurrency : int, optional
+            Maximum concurrent fetches, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+        seed_allowed : Optional[bool], optional
+            Allow seed items, by default None.
+
+        Returns
+        -------
+        FetchManyResponse[FetchModelType]
+            The fetched items and not found/unauthorised/other errors by ID.
+        """
+        return await collect_fetch_many(
+            ids=ids,
+            fetch=lambda id: self.fetch(id=id, seed_allowed=seed_allowed),
+            concurrency=concurrency
+        )
+
+    def fetch_many_stream(self, ids: List[str], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY, seed_allowed: Optional[bool] = None) -> AsyncIterator[FetchManyItem[FetchModelType]]:
+        """Fetches many items of this client's subtype from the registry
+        concurrently, yielding each as it completes.
+
+        Parameters
+        ----------
+        ids : List[str]
+            The IDs of the items to fetch.
+        concurrency : int, optional
+            Maximum concurrent fetches, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+        seed_allowed : Optional[bool], optional
+            Allow seed items, by default None.
+
+        Returns
+        -------
+        AsyncIterator[FetchManyItem[FetchModelType]]
+            The result or error per ID, in completion order.
+        """
+        return stream_fetch_many(
+            ids=ids,
+            fetch=lambda id: self.fetch(id=id, seed_allowed=seed_allowed),
+            concurrency=concurrency
+        )
+
     async def admin_delete(self, id: str) -> StatusResponse:
         """Admin only endpoint for deleting item from registry. USE CAREFULLY!
 
@@ -400,7 +541,7 @@ class RegistryBaseClass(ModuleService):
             item_subtype=self.item_subtype
         )
     
-class OrganisationClient(RegistryBaseClass):
+class OrganisationClient(RegistryBaseClass[OrganisationFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -524,7 +665,7 @@ class OrganisationClient(RegistryBaseClass):
         )
     
 
-class PersonClient(RegistryBaseClass):
+class PersonClient(RegistryBaseClass[PersonFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -650,7 +791,7 @@ class PersonClient(RegistryBaseClass):
         )
     
 
-class CreateActivityClient(RegistryBaseClass):
+class CreateActivityClient(RegistryBaseClass[CreateFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -728,7 +869,7 @@ class CreateActivityClient(RegistryBaseClass):
 
 
 
-class VersionActivityClient(RegistryBaseClass):
+class VersionActivityClient(RegistryBaseClass[VersionFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -802,7 +943,7 @@ class VersionActivityClient(RegistryBaseClass):
         )
     
 
-class ModelRunActivityClient(RegistryBaseClass):
+class ModelRunActivityClient(RegistryBaseClass[ModelRunFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -877,7 +1018,7 @@ class ModelRunActivityClient(RegistryBaseClass):
     
 
     
-class ModelClient(RegistryBaseClass):
+class ModelClient(RegistryBaseClass[ModelFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -912,7 +1053,7 @@ class ModelClient(RegistryBaseClass):
             fetch_response_model=ModelFetchResponse,
             seed_allowed=seed_allowed
         )
-        
+
     async def update(self, id: str, domain_info: ModelDomainInfo, reason: Optional[str]) -> StatusResponse:
         """
         Updates a model in the registry
@@ -1023,7 +1164,7 @@ class ModelClient(RegistryBaseClass):
             item_subtype=self.item_subtype
         )
     
-class ModelRunWorkFlowClient(RegistryBaseClass):
+class ModelRunWorkFlowClient(RegistryBaseClass[ModelRunWorkflowTemplateFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -1058,7 +1199,7 @@ class ModelRunWorkFlowClient(RegistryBaseClass):
             fetch_response_model=ModelRunWorkflowTemplateFetchResponse,
             seed_allowed=seed_allowed
         )
-        
+
     async def update(self, id: str, domain_info: ModelRunWorkflowTemplateDomainInfo, reason: Optional[str]) -> StatusResponse:
         """
         Updates a model in the registry
@@ -1169,7 +1310,7 @@ class ModelRunWorkFlowClient(RegistryBaseClass):
         )
     
 
-class DatasetTemplateClient(RegistryBaseClass):
+class DatasetTemplateClient(RegistryBaseClass[DatasetTemplateFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -1310,7 +1451,7 @@ class DatasetTemplateClient(RegistryBaseClass):
         )
 
 
-class DatasetClient(RegistryBaseClass):
+class DatasetClient(RegistryBaseClass[DatasetFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -1385,7 +1526,7 @@ class DatasetClient(RegistryBaseClass):
         )
 
 
-class StudyClient(RegistryBaseClass):
+class StudyClient(RegistryBaseClass[StudyFetchResponse]):
     _registry_client: RegistryClient
 
     def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient) -> None:
@@ -1592,6 +1733,23 @@ class Registry(ModuleService):
             HealthCheckResponse: Response
         """
         return await self._registry_client.get_health_check()
+
+    def mirror(self, path: str = DEFAULT_MIRROR_PATH) -> RegistryMirror:
+        """
+        Opens (creating if needed) a local SQLite mirror of the registry items,
+        which is brought up to date by its sync method and queried locally.
+
+        Parameters
+        ----------
+        path : str, optional
+            The SQLite database file, by default DEFAULT_MIRROR_PATH.
+
+        Returns
+        -------
+        RegistryMirror
+            The mirror sub module.
+        """
+        return RegistryMirror(auth=self._auth, config=self._config, registry_client=self._registry_client, path=path)
     
 
     async def list_general_registry_items(self, general_list_request: GeneralListRequest) -> PaginatedListResponse:
@@ -1613,62 +1771,133 @@ class Registry(ModuleService):
             general_list_request=general_list_request
         )
     
-    async def list_registry_items_with_count(self) -> Dict[str, int]:
+    async def for_all_registry_items(self, general_list_request: GeneralListRequest, total_limit: Optional[int] = None, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterates every registry item matching the filter criteria, paginating
+        automatically. Upcoming pages are fetched while the current page is
+        consumed, and the request is not modified.
+
+        Parameters
+        ----------
+        general_list_request : GeneralListRequest
+            The request containing filter and sort criteria, and the page size.
+        total_limit : Optional[int], optional
+            The maximum number of items to yield, by default None (every item).
+        prefetch : int, optional
+            The number of pages to fetch ahead of the consumer, by default DEFAULT_PREFETCH_DEPTH.
+
+        Yields
+        ------
+        Dict[str, Any]
+            Each (unparsed) registry item.
+        """
+        async for item in paginate(
+            request=general_list_request,
+            fetch_page=lambda request: self.list_general_registry_items(general_list_request=request),
+            get_items=registry_list_items,
+            prefetch=prefetch,
+            total_limit=total_limit
+        ):
+            yield item
+
+    async def count_registry_items(self, item_subtypes: Optional[List[ItemSubType]] = None, page_size: int = DEFAULT_COUNT_PAGE_SIZE, concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY, progress: Optional[Callable[[RegistryCountProgress], None]] = None) -> Dict[ItemSubType, int]:
+        """
+        Counts the (complete) items in the registry of each subtype.
+
+        Each subtype is counted by its own pagination stream (filtered by
+        subtype) and the streams run concurrently. Pages are large, and are
+        counted from the raw response JSON without parsing any items.
+
+        A subtype filter cannot match items without a subtype, so these are
+        not counted - list_registry_items_with_count counts them as "UNKNOWN".
+
+        Parameters
+        ----------
+        item_subtypes : Optional[List[ItemSubType]], optional
+            The subtypes to count, by default None (every subtype).
+        page_size : int, optional
+            The number of items requested per page, by default DEFAULT_COUNT_PAGE_SIZE.
+        concurrency : int, optional
+            The maximum number of subtypes counted at once, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+        progress : Optional[Callable[[RegistryCountProgress], None]], optional
+            Called after each page is counted, by default None.
+
+        Returns
+        -------
+        Dict[ItemSubType, int]
+            The number of items of each requested subtype (including zero counts).
+        """
+        subtypes = list(item_subtypes) if item_subtypes is not None else list(ItemSubType)
+        counts: Dict[ItemSubType, int] = {subtype: 0 for subtype in subtypes}
+
+        async def count_subtype(subtype: ItemSubType) -> int:
+            request = GeneralListRequest(
+                filter_by=FilterOptions(
+                    record_type=QueryRecordTypes.COMPLETE_ONLY,
+                    item_subtype=subtype,
+                    release_reviewer=None,
+                    release_status=None
+                ),
+                sort_by=SortOptions(sort_type=None, ascending=False, begins_with=None),
+                pagination_key=None,
+                page_size=page_size
+            )
+            async for page in paginate_pages(
+                request=request,
+                fetch_page=lambda page_request: self._registry_client.general.count_general_registry_items(general_list_request=page_request),
+                count_items=lambda counted: counted.count
+            ):
+                counts[subtype] += page.count
+                if progress is not None:
+                    progress(RegistryCountProgress(item_subtype=subtype, count=counts[subtype], complete=not page.pagination_key, total=sum(counts.values())))
+            return counts[subtype]
+
+        async for _, subtype, outcome in bounded_as_completed(inputs=subtypes, fn=count_subtype, concurrency=concurrency):
+            if isinstance(outcome, Exception):
+                raise outcome
+
+        return counts
+
+    async def list_registry_items_with_count(self, page_size: int = DEFAULT_COUNT_PAGE_SIZE) -> Dict[str, int]:
         """
         Retrieves a count of items in the registry, grouped by their subtypes.
 
-        This method sends requests to list items in the registry and counts the number of items for each subtype.
-        It handles pagination to ensure all items are counted.
+        This method walks the (unfiltered) registry with large pages, counting
+        each page from the raw response JSON without parsing any items. Items
+        without a subtype are counted under "UNKNOWN". To count subtypes
+        concurrently instead (which cannot see items without a subtype), use
+        count_registry_items.
+
+        Parameters
+        ----------
+        page_size : int, optional
+            The number of items requested per page, by default DEFAULT_COUNT_PAGE_SIZE.
 
         Returns
         -------
         Dict[str, int]
             A dictionary where the keys are item subtypes(string) and the values are the count of items for each subtype.
         """
-    
-        item_count: Dict[str, int] = {}
 
+        item_count: Dict[str, int] = {}
         general_list_request = GeneralListRequest(
             filter_by=FilterOptions(
                 record_type=QueryRecordTypes.COMPLETE_ONLY,
-                item_subtype=None, 
+                item_subtype=None,
                 release_reviewer=None,
                 release_status=None
             ),
             sort_by=SortOptions(sort_type=None, ascending=False, begins_with=None),
-            pagination_key=None, 
-            page_size=20
-        )
-
-        while True:
-            list_response = await self.list_general_registry_items(general_list_request=general_list_request)
-
-            assert list_response.items is not None, f"Expected a list of items but none was present."
-
-            for item in list_response.items:
-                subtype: str = item.get("item_subtype")
-
-                if not subtype:
-                    unknown = "UNKNOWN"
-    
-                    if unknown not in item_count:
-                        item_count[unknown] = 1
-                    
-                    else:
-                        item_count[unknown] += 1
-                    
-                    continue  # Skip this current iteration if subtype is missing
-
-                if subtype not in item_count:
-                    item_count[subtype] = 1
-                else:
-                    item_count[subtype] += 1
-
-            if not list_response.pagination_key:
-                break
-
-            general_list_request.pagination_key = list_response.pagination_key
-
+            pagination_key=None,
+            page_size=page_size
+        )
+        async for page in paginate_pages(
+            request=general_list_request,
+            fetch_page=lambda page_request: self._registry_client.general.count_general_registry_items(general_list_request=page_request),
+            count_items=lambda counted: counted.count
+        ):
+            for subtype, count in page.subtype_counts.items():
+                item_count[subtype] = item_count.get(subtype, 0) + count
         return item_count
     
     async def general_fetch_item(self, id: str) -> UntypedFetchResponse:
@@ -1690,6 +1919,51 @@ class Registry(ModuleService):
             id=id
         )
 
+    async def fetch_many(self, ids: List[str], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> FetchManyResponse[UntypedFetchResponse]:
+        """
+        Fetches many general (untyped) items from the registry concurrently.
+
+        Parameters
+        ----------
+        ids : List[str]
+            The IDs of the items to fetch, of any subtype.
+        concurrency : int, optional
+            Maximum concurrent fetches, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+
+        Returns
+        -------
+        FetchManyResponse[UntypedFetchResponse]
+            The fetched items and not found/unauthorised/other errors by ID.
+        """
+        return await collect_fetch_many(
+            ids=ids,
+            fetch=lambda id: self.general_fetch_item(id=id),
+            concurrency=concurrency
+        )
+
+    def fetch_many_stream(self, ids: List[str], concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> AsyncIterator[FetchManyItem[UntypedFetchResponse]]:
+        """
+        Fetches many general (untyped) items from the registry concurrently,
+        yielding each as it completes.
+
+        Parameters
+        ----------
+        ids : List[str]
+            The IDs of the items to fetch, of any subtype.
+        concurrency : int, optional
+            Maximum concurrent fetches, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+
+        Returns
+        -------
+        AsyncIterator[FetchManyItem[UntypedFetchResponse]]
+            The result or error per ID, in completion order.
+        """
+        return stream_fetch_many(
+            ids=ids,
+            fetch=lambda id: self.general_fetch_item(id=id),
+            concurrency=concurrency
+        )
+
     
     async def get_current_provena_version(self) -> VersionResponse:
         """
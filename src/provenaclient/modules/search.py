@@ -14,11 +14,16 @@ Date      	By	Comments
 
 from provenaclient.auth.manager import AuthManager
 from provenaclient.utils.config import Config
-from provenaclient.clients import SearchClient
+from provenaclient.clients import RegistryClient, SearchClient
 from provenaclient.clients.client_helpers import *
+from provenaclient.models import FailedSearchItem, LoadedRegistrySearchItem, LoadedRegistrySearchResponse, RegistryFetchResponse, SUBTYPE_FETCH_RESPONSE_MODELS, UnauthorisedSearchItem
+from provenaclient.models.registry import FetchErrorType
+from provenaclient.modules.module_helpers import DEFAULT_FETCH_MANY_CONCURRENCY, classify_fetch_error
+from provenaclient.utils.concurrency import bounded_as_completed
+from ProvenaInterfaces.RegistryAPI import UntypedFetchResponse
 from ProvenaInterfaces.RegistryModels import ItemSubType
-from ProvenaInterfaces.SearchAPI import QueryResults
-from typing import Optional
+from ProvenaInterfaces.SearchAPI import QueryResult, QueryResults
+from typing import List, Optional, Union
 
 # L3 interface.
 
@@ -27,8 +32,9 @@ DEFAULT_SEARCH_LIMIT = 25
 
 class Search(ClientService):
     _search_client: SearchClient
+    _registry_client: Optional[RegistryClient]
 
-    def __init__(self, auth: AuthManager, config: Config, search_client: SearchClient) -> None:
+    def __init__(self, auth: AuthManager, config: Config, search_client: SearchClient, registry_client: Optional[RegistryClient] = None) -> None:
         """
 
         Initialises a new search object, which sits between the user and the
@@ -44,12 +50,16 @@ class Search(ClientService):
             instance. 
         search_client : SearchClient
             This client interacts with the Search Client's API's.
+        registry_client : Optional[RegistryClient], optional
+            This client interacts with the Registry API's, used to load search
+            results (required by search_and_load), by default None.
         """
         self._auth = auth
         self._config = config
 
         # Clients related to the datastore scoped as private.
         self._search_client = search_client
+        self._registry_client = registry_client
 
     async def search_registry(self, query: str, limit: Optional[int], subtype_filter: Optional[ItemSubType]) -> QueryResults:
         """
@@ -67,3 +77,94 @@ class Search(ClientService):
         return await self._search_client.search_registry(
             limit=limit, query=query, subtype_filter=subtype_filter
         )
+
+    async def _load_search_result(self, registry_client: RegistryClient, item: QueryResult, subtype_filter: Optional[ItemSubType]) -> Union[LoadedRegistrySearchItem, UnauthorisedSearchItem, FailedSearchItem]:
+        try:
+            if subtype_filter is not None and subtype_filter in SUBTYPE_FETCH_RESPONSE_MODELS:
+                # known subtype - fetch from the typed endpoint
+                typed: RegistryFetchResponse = await registry_client.fetch_item(
+                    id=item.id,
+                    item_subtype=subtype_filter,
+                    fetch_response_model=SUBTYPE_FETCH_RESPONSE_MODELS[subtype_filter]
+                )
+                return LoadedRegistrySearchItem(id=item.id, score=item.score, item_subtype=subtype_filter, fetch_response=typed)
+
+            # mixed subtypes - fetch untyped then parse using the item's own subtype
+            untyped = await registry_client.general.general_fetch_item(id=item.id)
+            raw_subtype = (untyped.item or {}).get("item_subtype")
+            item_subtype = ItemSubType(raw_subtype) if raw_subtype else None
+            model = SUBTYPE_FETCH_RESPONSE_MODELS.get(item_subtype) if item_subtype else None
+            if model is None:
+                return LoadedRegistrySearchItem(id=item.id, score=item.score, item_subtype=item_subtype, fetch_response=untyped)
+            typed = model.model_validate({"status": untyped.status, "item": untyped.item})
+            return LoadedRegistrySearchItem(id=item.id, score=item.score, item_subtype=item_subtype, fetch_response=typed)
+        except Exception as e:
+            error = classify_fetch_error(e)
+            if error.error_type == FetchErrorType.UNAUTHORISED:
+                return UnauthorisedSearchItem(id=item.id, score=item.score)
+            return FailedSearchItem(id=item.id, score=item.score, error_info=error.error_info)
+
+    async def search_and_load(self, query: str, subtype_filter: Optional[ItemSubType] = None, limit: Optional[int] = DEFAULT_SEARCH_LIMIT, concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY) -> LoadedRegistrySearchResponse:
+        """
+
+        Searches the registry then loads every result as its typed fetch
+        response (e.g. OrganisationFetchResponse, ModelRunFetchResponse).
+
+        Results are loaded concurrently (sharing the fetch cache if enabled).
+        With a subtype filter each result is fetched from the typed endpoint,
+        otherwise it is fetched untyped and parsed according to its own
+        subtype - either way in a single fetch per result. Results which
+        cannot be loaded are sorted into auth or misc errors, and each list
+        retains the search score ordering.
+
+        Args:
+            query (str): The query to make
+            subtype_filter (Optional[ItemSubType], optional): The subtype to filter by if any. Defaults to None.
+            limit (Optional[int], optional): The query limit. Defaults to DEFAULT_SEARCH_LIMIT.
+            concurrency (int, optional): Maximum concurrent fetches. Defaults to DEFAULT_FETCH_MANY_CONCURRENCY.
+
+        Returns:
+            LoadedRegistrySearchResponse: The loaded items incl errors.
+
+        Raises:
+            ValueError: If the search was constructed without a registry client.
+        """
+        registry_client = self._registry_client
+        if registry_client is None:
+            raise ValueError(
+                "Loading search results requires a registry client - construct Search with registry_client (as ProvenaClient does).")
+
+        search_results = await self._search_client.search_registry(
+            limit=limit, query=query, subtype_filter=subtype_filter
+        )
+        assert search_results.results is not None
+        results = search_results.results
+
+        outcomes: List[Optional[Union[LoadedRegistrySearchItem, UnauthorisedSearchItem, FailedSearchItem]]] = [None] * len(results)
+        async for index, _, outcome in bounded_as_completed(
+            inputs=results,
+            fn=lambda item: self._load_search_result(registry_client=registry_client, item=item, subtype_filter=subtype_filter),
+            concurrency=concurrency
+        ):
+            # _load_search_result captures all errors
+            assert not isinstance(outcome, Exception)
+            outcomes[index] = outcome
+
+        success: List[LoadedRegistrySearchItem] = []
+        auth_err: List[UnauthorisedSearchItem] = []
+        misc_err: List[FailedSearchItem] = []
+
+        # partition in rank order
+        for loaded in outcomes:
+            if isinstance(loaded, LoadedRegistrySearchItem):
+                success.append(loaded)
+            elif isinstance(loaded, UnauthorisedSearchItem):
+                auth_err.append(loaded)
+            elif isinstance(loaded, FailedSearchItem):
+                misc_err.append(loaded)
+
+        return LoadedRegistrySearchResponse(
+            items=success,
+            auth_errors=auth_err,
+            misc_errors=misc_err
+        )
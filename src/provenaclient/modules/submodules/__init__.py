@@ -1 +1,2 @@
-from provenaclient.modules.submodules.datastore_io_submodule import IOSubModule
\ No newline at end of file
+from provenaclient.modules.submodules.datastore_io_submodule import IOSubModule
+from provenaclient.modules.submodules.registry_mirror_submodule import RegistryMirror
@@ -16,6 +16,13 @@ Date      	By	Comments
 
 from multiprocessing import Value
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Set, TypeVar
+import asyncio
+import functools
+import os
+import posixpath
 
 from cloudpathlib import S3Path
 from provenaclient.auth.manager import AuthManager
@@ -23,9 +30,16 @@ from provenaclient.utils.config import Config
 from provenaclient.clients import DatastoreClient
 from ProvenaInterfaces.DataStoreAPI import *
 from provenaclient.modules.module_helpers import *
+from provenaclient.models.datastore import FileTransfer, SyncDirection, SyncReport, TransferReport
+from provenaclient.utils.config import TransferSettings
+from provenaclient.utils.exceptions import TransferException
+from provenaclient.utils.s3_transfer import S3TransferEngine, folder_key_prefix, join_key, local_download_transfers, local_upload_transfers, plan_sync, setup_transfer_client, transfer_pool_size
 import cloudpathlib.s3 as s3  # type: ignore
 
 
+ResultType = TypeVar("ResultType")
+
+
 class AccessEnum(str, Enum):
     READ = "read"
     WRITE = "write"
@@ -68,6 +82,47 @@ def print_file_info(file: s3.S3Path) -> None:
         print(f"File: {file}")
 
 
+class S3Access:
+    """The dataset path and ready to use clients of one access type (read or
+    write) to one dataset, valid until the credentials expire."""
+
+    def __init__(self, path: S3Path, expiry: datetime) -> None:
+        """
+        Args:
+            path (S3Path): The dataset path, with a client holding the credentials
+            expiry (datetime): When the credentials expire
+        """
+        self.path = path
+        self.expiry = expiry if expiry.tzinfo is not None else expiry.replace(tzinfo=timezone.utc)
+        # boto3 transfer clients keyed by connection pool size
+        self._transfer_clients: Dict[int, Any] = {}
+
+    def expires_within(self, margin: float) -> bool:
+        """
+        Args:
+            margin (float): Seconds from now
+
+        Returns:
+            bool: True if the credentials expire within the margin
+        """
+        return (self.expiry - datetime.now(timezone.utc)).total_seconds() <= margin
+
+    def transfer_client(self, settings: TransferSettings) -> Any:
+        """
+        Args:
+            settings (TransferSettings): The transfer settings, which size the connection pool
+
+        Returns:
+            Any: The (cached) boto3 client sharing the credentials (see setup_transfer_client)
+        """
+        pool_size = transfer_pool_size(settings)
+        client = self._transfer_clients.get(pool_size)
+        if client is None:
+            client = setup_transfer_client(s3_client=self.path.client, settings=settings)
+            self._transfer_clients[pool_size] = client
+        return client
+
+
 class IOSubModule(ModuleService):
     _datastore_client: DatastoreClient
 
@@ -92,9 +147,104 @@ class IOSubModule(ModuleService):
         # Clients related to the datastore scoped as private.
         self._datastore_client = datastore_client
 
+        # dataset S3 locations, and S3 access keyed by (dataset, access type)
+        self._s3_locations: Dict[str, str] = {}
+        self._s3_access_cache: Dict[Tuple[str, AccessEnum], S3Access] = {}
+        # asyncio locks are bound to the event loop which uses them, so are recreated on a new loop
+        self._s3_access_locks: Dict[Tuple[str, AccessEnum], asyncio.Lock] = {}
+        self._s3_access_locks_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # runs the blocking S3 work of the async methods, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _run_blocking(self, fn: Callable[..., ResultType], *args: Any, **kwargs: Any) -> ResultType:
+        """Runs blocking (boto3/cloudpathlib/file system) work in the sub module's
+        thread pool, so the event loop keeps serving other coroutines meanwhile.
+
+        If the awaiting coroutine is cancelled the work still runs to completion
+        in its thread.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._config.transfer_settings.io_threads, thread_name_prefix="provena-io")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool running blocking S3 work (once the work in
+        progress completes). A new pool is created if the sub module is used again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _s3_access(self, dataset_id: str, access_type: AccessEnum) -> S3Access:
+        """Returns the cached S3 access of the dataset, fetching the dataset's
+        location (once) and minting credentials if there are none cached or
+        they are within the renewal margin of expiring.
+
+        Parameters
+        ----------
+        dataset_id : str
+            The ID of the dataset - ensure you have the right access.
+        access_type : AccessEnum
+            The access type required (Read or Write)
+
+        Returns
+        -------
+        S3Access
+            The dataset path with a client holding valid credentials.
+        """
+        key = (dataset_id, access_type)
+        margin = self._config.transfer_settings.credential_renewal_margin
+        access = self._s3_access_cache.get(key)
+        if access is not None and not access.expires_within(margin):
+            return access
+
+        # concurrent calls for the same dataset and access mint one set of credentials
+        async with self._s3_access_lock(key):
+            access = self._s3_access_cache.get(key)
+            if access is not None and not access.expires_within(margin):
+                return access
+
+            s3_uri = self._s3_locations.get(dataset_id)
+            if s3_uri is None:
+                # Fetch the dataset information
+                dataset_information = await self._datastore_client.fetch_dataset(
+                    id=dataset_id
+                )
+                # Get the S3 location
+                assert dataset_information.item is not None, f"Expected non None item from dataset fetch, details: {dataset_information.status.details}."
+                s3_uri = dataset_information.item.s3.s3_uri
+                self._s3_locations[dataset_id] = s3_uri
+
+            credentials_request = CredentialsRequest(dataset_id=dataset_id, console_session_required=False)
+
+            if access_type == AccessEnum.READ:
+                creds = await self._datastore_client.generate_read_access_credentials(
+                    read_access_credentials=credentials_request
+                )
+
+            elif access_type == AccessEnum.WRITE:
+                creds = await self._datastore_client.generate_write_access_credentials(
+                    write_access_credentials=credentials_request
+                )
+
+            else: 
+                # This is highlighted as "unreachable code", but this is for safe guarding/future-proofing. 
+                raise NotImplementedError(f"This access type is not implemented {access_type.name}")
+
+            # creating boto3 sessions and clients is slow enough to stall the event loop
+            client = await self._run_blocking(setup_s3_client, creds=creds)
+
+            access = S3Access(path=s3.S3Path(cloud_path=s3_uri, client=client), expiry=creds.credentials.expiry)
+            self._s3_access_cache[key] = access
+            return access
+
     async def _create_s3_path(self, dataset_id: str, access_type: AccessEnum) -> S3Path:
         """This helper function creates an S3 URI in PATH format by ingesting 
-        the dataset id and access type (read, write). 
+        the dataset id and access type (read, write). The dataset location,
+        credentials and client are cached (see _s3_access).
 
         Parameters
         ----------
@@ -109,57 +259,90 @@ class IOSubModule(ModuleService):
             S3Path instance that represent a path in S3 with filesystem path semantics.
         """
 
-        # Fetch the dataset information
-        dataset_information = await self._datastore_client.fetch_dataset(
-            id=dataset_id
-        )
-        # Get the S3 location
-        assert dataset_information.item is not None, f"Expected non None item from dataset fetch, details: {dataset_information.status.details}."
-        s3_location = dataset_information.item.s3
-
-        credentials_request = CredentialsRequest(dataset_id=dataset_id, console_session_required=False)
-
-        if access_type == AccessEnum.READ:
-            creds = await self._datastore_client.generate_read_access_credentials(
-                read_access_credentials=credentials_request
-            )
+        return (await self._s3_access(dataset_id=dataset_id, access_type=access_type)).path
 
-        elif access_type == AccessEnum.WRITE:
-            creds = await self._datastore_client.generate_write_access_credentials(
-                write_access_credentials=credentials_request
-            )
+    def _s3_access_lock(self, key: Tuple[str, AccessEnum]) -> asyncio.Lock:
+        """Returns the lock guarding the S3 access of the key on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._s3_access_locks_loop is not loop:
+            self._s3_access_locks = {}
+            self._s3_access_locks_loop = loop
+        return self._s3_access_locks.setdefault(key, asyncio.Lock())
 
-        else: 
-            # This is highlighted as "unreachable code", but this is for safe guarding/future-proofing. 
-            raise NotImplementedError(f"This access type is not implemented {access_type.name}")
+    def clear_s3_access_cache(self, dataset_id: Optional[str] = None) -> None:
+        """
+        Drops cached dataset locations, credentials and clients, so the next
+        IO call fetches them again (e.g. after the dataset's access changed).
 
-        client = setup_s3_client(creds=creds)
+        Args:
+            dataset_id (Optional[str]): Only drop the entries of this dataset, by default None (every dataset)
+        """
+        if dataset_id is None:
+            self._s3_locations.clear()
+            self._s3_access_cache.clear()
+            self._s3_access_locks.clear()
+            return
+        self._s3_locations.pop(dataset_id, None)
+        for key in [key for key in self._s3_access_cache if key[0] == dataset_id]:
+            del self._s3_access_cache[key]
+        for key in [key for key in self._s3_access_locks if key[0] == dataset_id]:
+            del self._s3_access_locks[key]
+
+    def _transfer_engine(self, access: S3Access, transfer_settings: Optional[TransferSettings]) -> S3TransferEngine:
+        """Creates a transfer engine for the bucket of the dataset, reusing the access's transfer client."""
+        settings = transfer_settings or self._config.transfer_settings
+        return S3TransferEngine(
+            client=access.transfer_client(settings=settings),
+            bucket=access.path.bucket,
+            settings=settings
+        )
 
-        return s3.S3Path(cloud_path=s3_location.s3_uri, client=client)
+    def _check_transfer(self, report: TransferReport, action: str, dataset_id: str) -> TransferReport:
+        """Raises a TransferException if any file of the transfer failed."""
+        if report.failed:
+            raise TransferException(
+                message=f"Failed to {action} {len(report.failed)} of {len(report.failed) + len(report.transferred)} files of dataset {dataset_id}, first error: {report.failed[0].error_info}",
+                report=report
+            )
+        return report
 
     async def download_all_files(
         self,
         destination_directory: str,
-        dataset_id: str
-    ) -> None:
+        dataset_id: str,
+        transfer_settings: Optional[TransferSettings] = None
+    ) -> TransferReport:
         """
         Downloads all files to the destination path for a given dataset id.
 
         - Fetches info
         - Fetches creds
-        - Uses s3 cloud path lib to download all files to specified location
+        - Lists the dataset once, then downloads the files with a pool of
+          workers (ranged GETs for large files), retrying each file which fails
 
         Args:
             destination_directory (str): The destination path to save files to - use a directory
             dataset_id (str): The ID of the dataset to download files for - ensure you have read access
+            transfer_settings (Optional[TransferSettings]): Overrides the worker pool, part size/concurrency
+                and retry settings of the config, by default None
+
+        Returns:
+            TransferReport: The downloaded files
+
+        Raises:
+            TransferException: If any file could not be downloaded after every attempt
         """
 
-        path = await self._create_s3_path(dataset_id=dataset_id, access_type=AccessEnum.READ)
+        access = await self._s3_access(dataset_id=dataset_id, access_type=AccessEnum.READ)
+        path = access.path
+        engine = await self._run_blocking(self._transfer_engine, access=access, transfer_settings=transfer_settings)
 
-        # download to specified path
-        path.download_to(destination_directory)
-        # Release file handles
-        path.__del__
+        def download() -> TransferReport:
+            objects = engine.list_objects(prefix=folder_key_prefix(path.key))
+            return engine.download(local_download_transfers(objects=objects, key_prefix=path.key, destination=destination_directory))
+
+        report = await self._run_blocking(download)
+        return self._check_transfer(report=report, action="download", dataset_id=dataset_id)
 
     async def list_all_files(
         self,
@@ -178,42 +361,56 @@ class IOSubModule(ModuleService):
         """
         path = await self._create_s3_path(dataset_id=dataset_id, access_type=AccessEnum.READ)
 
-        paths = []
-        for path in path.glob("**/*"):
-            paths.append(path)
-
-        if print_list:
-            for p in paths:
-                print_file_info(p)
+        def list_files() -> List[s3.S3Path]:
+            paths = []
+            for file in path.glob("**/*"):
+                paths.append(file)
 
-        # Release file handles
-        path.__del__
+            if print_list:
+                for p in paths:
+                    print_file_info(p)
+            return paths
 
-        return paths
+        return await self._run_blocking(list_files)
 
     async def upload_all_files(
         self,
         source_directory: str,
-        dataset_id: str
-    ) -> None:
+        dataset_id: str,
+        transfer_settings: Optional[TransferSettings] = None
+    ) -> TransferReport:
         """
         Uploads all files in the source path to the specified dataset id's storage location.
 
         - Fetches info
         - Fetches creds
-        - Uses s3 cloud path lib to upload all files to specified location
+        - Uploads the files with a pool of workers, in parts for large files,
+          retrying each file which fails
 
         Args:
             source_directory (str): The source path to upload files from - use a directory
             dataset_id (str): The ID of the dataset to upload files for - ensure you have write access
+            transfer_settings (Optional[TransferSettings]): Overrides the worker pool, part size/concurrency
+                and retry settings of the config, by default None
+
+        Returns:
+            TransferReport: The uploaded files
+
+        Raises:
+            TransferException: If any file could not be uploaded after every attempt (the
+                report of the exception lists the uploaded and failed files)
         """
-        path = await self._create_s3_path(dataset_id=dataset_id, access_type=AccessEnum.WRITE)
-        # upload
-        path.upload_from(source_directory)
-        # Release file handles
-        path.__del__
+        access = await self._s3_access(dataset_id=dataset_id, access_type=AccessEnum.WRITE)
+        path = access.path
+        engine = await self._run_blocking(self._transfer_engine, access=access, transfer_settings=transfer_settings)
 
-    async def download_specific_file(self, dataset_id: str, s3_path: str, destination_directory: str) -> None:
+        def upload() -> TransferReport:
+            return engine.upload(local_upload_transfers(source=source_directory, key_prefix=path.key))
+
+        report = await self._run_blocking(upload)
+        return self._check_transfer(report=report, action="upload", dataset_id=dataset_id)
+
+    async def download_specific_file(self, dataset_id: str, s3_path: str, destination_directory: str, transfer_settings: Optional[TransferSettings] = None) -> TransferReport:
         """
         Downloads a specific file or folder from an S3 bucket to a provided destination path.
 
@@ -224,6 +421,8 @@ class IOSubModule(ModuleService):
         - If `s3_path` is a folder (with a trailing slash), it downloads all contents (including subfolders) within that folder but not the
         folder itself to `destination_directory`.
 
+        The folder is listed once and its files downloaded in parallel (see download_all_files).
+
         Parameters
         ----------
         dataset_id : str
@@ -237,53 +436,183 @@ class IOSubModule(ModuleService):
             that folder but not the folder itself unless subfolders are present.
         destination_directory : str
             The destination path to save files to - use a directory.
+        transfer_settings : Optional[TransferSettings], optional
+            Overrides the worker pool, part size/concurrency and retry settings of the config, by default None.
 
+        Returns
+        -------
+        TransferReport
+            The downloaded files.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no such file or folder in the dataset.
+        TransferException
+            If any file could not be downloaded after every attempt.
         """
 
         # Generate credentials access.
-        path = await self._create_s3_path(dataset_id=dataset_id, access_type=AccessEnum.READ)
-
-        # build path to the object to download from the S3 bucket.
-        object_path = path / s3_path
-
-        # Check if the object exists
-        if not object_path.exists():
-            raise FileNotFoundError(
-                f"The specified object located at '{s3_path}' does not exist in the S3 bucket.")
-        
-        # ok, initiate download
-
-        # Check if the object is a file.
-        if object_path.is_file():
-            # Make the destination dir if it doesn't exist and download into it.
-            Path(destination_directory).mkdir(parents=True, exist_ok=True)
-            object_path.download_to(destination_directory)
-
-        # else, the object is not a file but a directory.
-        elif object_path.is_dir():
-            
-            # Check if the s3_path has a trailing slash.
+        access = await self._s3_access(dataset_id=dataset_id, access_type=AccessEnum.READ)
+        path = access.path
+        engine = await self._run_blocking(self._transfer_engine, access=access, transfer_settings=transfer_settings)
+
+        # build the key of the object (or folder) to download from the S3 bucket.
+        object_key = join_key(path.key, s3_path.strip("/"))
+        folder_prefix = folder_key_prefix(object_key)
+
+        # a single listing finds both the object itself and anything under it as a folder
+        listed = await self._run_blocking(engine.list_objects, prefix=object_key)
+        file_objects = [info for info in listed if info.key == object_key]
+        folder_objects = [info for info in listed if info.key.startswith(folder_prefix)]
+
+        if file_objects and not s3_path.endswith("/"):
+            # the object is a file - download it into the destination directory.
+            transfers = local_download_transfers(objects=file_objects, key_prefix=posixpath.dirname(object_key), destination=destination_directory)
+        elif folder_objects:
             if s3_path.endswith("/"):
-                # path ends in slash. Download all contents within the object but not the folder itself.
-                object_path.download_to(destination_directory)
+                # path ends in slash. Download all contents within the folder but not the folder itself.
+                destination = destination_directory
             else:
-                # path does not end in slash. Download the directory with its contents and 
-                # put directory in destination_directory.
-
-                # just use the last dir in s3_file_path for writing
-                local_file_path = Path(destination_directory)
-                print(local_file_path)
-                # This pattern finds all files and folders in the specified directory in s3 bucket.
-                for item in object_path.glob("**/*"):
-                    # Ensure it's a file and not a "directory"
-                    if item.is_file():
-                        local_file_path = Path(
-                            destination_directory) / s3_path.split("/")[-1]
-                        # Provides permissions to create directory.
-                        local_file_path.parent.mkdir(parents=True, exist_ok=True)
-                        # item.download_to(local_file_path)
-                        object_path.download_to(local_file_path)
+                # path does not end in slash. Download the folder with its contents into destination_directory.
+                destination = os.path.join(destination_directory, posixpath.basename(object_key))
+            transfers = local_download_transfers(objects=folder_objects, key_prefix=folder_prefix, destination=destination)
         else:
             raise FileNotFoundError(
-                f"The specified object located at '{s3_path}' is not a file or directory. Unhandled object type for download operation.")
-                
+                f"The specified object located at '{s3_path}' does not exist in the S3 bucket.")
+
+        report = await self._run_blocking(engine.download, transfers)
+        return self._check_transfer(report=report, action="download", dataset_id=dataset_id)
+
+    async def _sync(self, local_directory: str, dataset_id: str, direction: SyncDirection, delete: bool, dry_run: bool, checksum: bool, transfer_settings: Optional[TransferSettings]) -> SyncReport:
+        """Plans (and unless a dry run, performs) a sync between a local directory and a dataset."""
+        settings = transfer_settings or self._config.transfer_settings
+        access_type = AccessEnum.WRITE if direction == SyncDirection.UP else AccessEnum.READ
+        access = await self._s3_access(dataset_id=dataset_id, access_type=access_type)
+        path = access.path
+        engine = await self._run_blocking(self._transfer_engine, access=access, transfer_settings=settings)
+
+        def plan() -> Tuple[List[FileTransfer], List[FileTransfer], int]:
+            objects = engine.list_objects(prefix=folder_key_prefix(path.key))
+            local_files = local_upload_transfers(source=local_directory, key_prefix=path.key) if os.path.isdir(local_directory) else []
+            return plan_sync(
+                local_files=local_files, objects=objects, key_prefix=path.key, local_root=local_directory,
+                direction=direction, checksum=checksum, settings=settings
+            )
+
+        # listing, walking and (with checksum) hashing every file all block
+        transfers, extraneous, unchanged = await self._run_blocking(plan)
+
+        report = SyncReport(
+            direction=direction,
+            dry_run=dry_run,
+            planned_transfers=transfers,
+            planned_deletions=[file.key if direction == SyncDirection.UP else file.local_path for file in extraneous] if delete else [],
+            unchanged=unchanged
+        )
+        if dry_run:
+            return report
+
+        transfer = await self._run_blocking(engine.upload if direction == SyncDirection.UP else engine.download, transfers)
+        report.transfer = transfer
+        self._check_transfer(report=transfer, action="upload" if direction == SyncDirection.UP else "download", dataset_id=dataset_id)
+
+        # only delete once every new and changed file has been transferred
+        def delete_extraneous() -> Set[str]:
+            if direction == SyncDirection.UP:
+                return set(engine.delete_objects(report.planned_deletions))
+            failed: Set[str] = set()
+            for local_path in report.planned_deletions:
+                try:
+                    os.remove(local_path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    failed.add(local_path)
+            return failed
+
+        failed = await self._run_blocking(delete_extraneous)
+        report.deleted = [deletion for deletion in report.planned_deletions if deletion not in failed]
+        if failed:
+            raise TransferException(
+                message=f"Failed to delete {len(failed)} extraneous files while syncing dataset {dataset_id}, e.g. {sorted(failed)[0]}",
+                report=transfer
+            )
+        return report
+
+    async def sync_up(self, source_directory: str, dataset_id: str, delete: bool = False, dry_run: bool = False, checksum: bool = False, transfer_settings: Optional[TransferSettings] = None) -> SyncReport:
+        """
+        Uploads only the new or changed files of a local directory to a dataset,
+        like rsync.
+
+        The dataset is listed once and each local file compared with its object:
+        a file is uploaded if the object is missing, differs in size or is older
+        than the file. With checksum, the content (MD5/ETag) is compared instead of
+        modified times wherever the ETag allows.
+
+        Parameters
+        ----------
+        source_directory : str
+            The local directory to upload from.
+        dataset_id : str
+            The ID of the dataset to sync to - ensure you have write access.
+        delete : bool, optional
+            Delete objects of the dataset which are not in the local directory, by default False.
+        dry_run : bool, optional
+            Only report the planned uploads and deletions, by default False.
+        checksum : bool, optional
+            Compare file content (reading every file of matching size) rather than modified times, by default False.
+        transfer_settings : Optional[TransferSettings], optional
+            Overrides the worker pool, part size/concurrency and retry settings of the config, by default None.
+
+        Returns
+        -------
+        SyncReport
+            The planned and completed uploads and deletions.
+
+        Raises
+        ------
+        TransferException
+            If any file could not be uploaded or deleted (nothing is deleted unless every upload succeeded).
+        """
+        return await self._sync(local_directory=source_directory, dataset_id=dataset_id, direction=SyncDirection.UP,
+                                delete=delete, dry_run=dry_run, checksum=checksum, transfer_settings=transfer_settings)
+
+    async def sync_down(self, destination_directory: str, dataset_id: str, delete: bool = False, dry_run: bool = False, checksum: bool = False, transfer_settings: Optional[TransferSettings] = None) -> SyncReport:
+        """
+        Downloads only the new or changed files of a dataset to a local directory,
+        like rsync.
+
+        The dataset is listed once and each object compared with its local file:
+        an object is downloaded if the file is missing, differs in size or is
+        older than the object. Downloaded files take the modified time of their
+        object. With checksum, the content (MD5/ETag) is compared instead of
+        modified times wherever the ETag allows.
+
+        Parameters
+        ----------
+        destination_directory : str
+            The local directory to download to (created if missing).
+        dataset_id : str
+            The ID of the dataset to sync from - ensure you have read access.
+        delete : bool, optional
+            Delete local files which are not in the dataset, by default False.
+        dry_run : bool, optional
+            Only report the planned downloads and deletions, by default False.
+        checksum : bool, optional
+            Compare file content (reading every file of matching size) rather than modified times, by default False.
+        transfer_settings : Optional[TransferSettings], optional
+            Overrides the worker pool, part size/concurrency and retry settings of the config, by default None.
+
+        Returns
+        -------
+        SyncReport
+            The planned and completed downloads and deletions.
+
+        Raises
+        ------
+        TransferException
+            If any file could not be downloaded or deleted (nothing is deleted unless every download succeeded).
+        """
+        return await self._sync(local_directory=destination_directory, dataset_id=dataset_id, direction=SyncDirection.DOWN,
+                                delete=delete, dry_run=dry_run, checksum=checksum, transfer_settings=transfer_settings)
@@ -0,0 +1,337 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Registry mirror sub module, keeps a local SQLite copy of the registry items which can be queried without network round trips.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import sqlite3
+import time
+from provenaclient.auth.manager import AuthManager
+from provenaclient.utils.config import Config
+from provenaclient.clients import RegistryClient
+from provenaclient.models.registry import RegistryMirrorSubtypeSync, RegistryMirrorSyncResult
+from provenaclient.utils.pagination import DEFAULT_PREFETCH_DEPTH, paginate_pages
+from ProvenaInterfaces.RegistryAPI import FilterOptions, GeneralListRequest, PaginatedListResponse, QueryRecordTypes, SortOptions, SortType
+from ProvenaInterfaces.RegistryModels import ItemSubType
+from provenaclient.modules.module_helpers import *
+
+# The SQLite database used by default
+DEFAULT_MIRROR_PATH = "registry-mirror.sqlite"
+# The number of items requested per page while syncing
+DEFAULT_MIRROR_PAGE_SIZE = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    item_subtype TEXT NOT NULL,
+    display_name TEXT,
+    created_timestamp INTEGER,
+    updated_timestamp INTEGER,
+    owner_username TEXT,
+    record_type TEXT,
+    -- unix time of the sync which last saw the item
+    seen_at REAL NOT NULL,
+    item_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_subtype ON items (item_subtype, updated_timestamp);
+CREATE INDEX IF NOT EXISTS items_updated ON items (updated_timestamp);
+CREATE INDEX IF NOT EXISTS items_owner ON items (owner_username);
+CREATE INDEX IF NOT EXISTS items_display_name ON items (display_name);
+CREATE TABLE IF NOT EXISTS sync_state (
+    item_subtype TEXT PRIMARY KEY,
+    synced_until INTEGER,
+    synced_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO items (id, item_subtype, display_name, created_timestamp, updated_timestamp, owner_username, record_type, seen_at, item_json)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    item_subtype = excluded.item_subtype,
+    display_name = excluded.display_name,
+    created_timestamp = excluded.created_timestamp,
+    updated_timestamp = excluded.updated_timestamp,
+    owner_username = excluded.owner_username,
+    record_type = excluded.record_type,
+    seen_at = excluded.seen_at,
+    item_json = excluded.item_json
+"""
+
+
+def _item_row(item: Dict[str, Any], item_subtype: ItemSubType, seen_at: float) -> Tuple[Any, ...]:
+    return (
+        item["id"],
+        item.get("item_subtype") or item_subtype.value,
+        item.get("display_name"),
+        item.get("created_timestamp"),
+        item.get("updated_timestamp"),
+        item.get("owner_username"),
+        item.get("record_type"),
+        seen_at,
+        json.dumps(item),
+    )
+
+
+def _count_page_items(page: PaginatedListResponse) -> int:
+    return len(page.items or [])
+
+
+class RegistryMirror(ModuleService):
+    _registry_client: RegistryClient
+
+    def __init__(self, auth: AuthManager, config: Config, registry_client: RegistryClient, path: str = DEFAULT_MIRROR_PATH) -> None:
+        """
+        Registry mirror sub module, which keeps a local SQLite copy of the
+        (complete) registry items - the raw item JSON plus indexed id, subtype,
+        display name, created/updated timestamps and owner columns.
+
+        The first sync of each subtype loads every item, with the subtypes
+        loaded concurrently. Later syncs walk each subtype sorted by updated
+        time (newest first) and stop at the first item older than the previous
+        sync, so only changed items are fetched. Items deleted from the
+        registry are only removed from the mirror by a full sync.
+
+        Parameters
+        ----------
+        auth : AuthManager
+            An abstract interface containing the user's requested auth flow
+            method.
+        config : Config
+            A config object which contains information related to the Provena
+            instance.
+        registry_client : RegistryClient
+            The registry L2 client used to list items.
+        path : str, optional
+            The SQLite database file (created if missing), by default DEFAULT_MIRROR_PATH.
+        """
+        self._auth = auth
+        self._config = config
+        self._registry_client = registry_client
+        self.path = path
+
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
+
+    def synced_until(self) -> Dict[ItemSubType, Optional[int]]:
+        """
+        Reports the subtypes which have been synced, and the updated timestamp
+        their next incremental sync starts from.
+
+        Returns
+        -------
+        Dict[ItemSubType, Optional[int]]
+            The updated timestamp of each synced subtype (None if it was empty).
+        """
+        rows = self.connection.execute("SELECT item_subtype, synced_until FROM sync_state").fetchall()
+        return {ItemSubType(row["item_subtype"]): row["synced_until"] for row in rows}
+
+    async def _sync_subtype(self, item_subtype: ItemSubType, full: bool, page_size: int, prefetch: int) -> RegistryMirrorSubtypeSync:
+        state = self.connection.execute(
+            "SELECT synced_until FROM sync_state WHERE item_subtype = ?", (item_subtype.value,)).fetchone()
+        since: Optional[int] = None if full or state is None else state["synced_until"]
+        full = since is None
+
+        request = GeneralListRequest(
+            filter_by=FilterOptions(
+                record_type=QueryRecordTypes.COMPLETE_ONLY,
+                item_subtype=item_subtype,
+                release_reviewer=None,
+                release_status=None
+            ),
+            sort_by=SortOptions(sort_type=SortType.UPDATED_TIME, ascending=False, begins_with=None),
+            pagination_key=None,
+            page_size=page_size
+        )
+
+        started_at = time.time()
+        written = 0
+        synced_until: Optional[int] = None
+        first_page = True
+        async for page in paginate_pages(
+            request=request,
+            fetch_page=lambda page_request: self._registry_client.general.list_general_registry_items(general_list_request=page_request),
+            count_items=_count_page_items,
+            prefetch=prefetch
+        ):
+            items = [item for item in page.items or [] if isinstance(item, dict) and item.get("id")]
+            if first_page:
+                # items updated while walking move to the front (behind the walk), so
+                # only the first page bounds what this sync is guaranteed to have seen
+                newest = [item.get("updated_timestamp") or 0 for item in items] + ([since] if since is not None else [])
+                synced_until = max(newest, default=None)
+                first_page = False
+
+            reached_synced = False
+            if since is not None:
+                # items updated at exactly the previous bound are refetched - upserts are idempotent
+                changed = [item for item in items if (item.get("updated_timestamp") or 0) >= since]
+                reached_synced = len(changed) < len(items)
+                items = changed
+
+            self.connection.executemany(_UPSERT, [_item_row(item, item_subtype, started_at) for item in items])
+            self.connection.commit()
+            written += len(items)
+            if reached_synced:
+                break
+
+        removed = 0
+        if full:
+            # every current item was just seen - anything older was deleted from the registry
+            removed = self.connection.execute(
+                "DELETE FROM items WHERE item_subtype = ? AND seen_at < ?", (item_subtype.value, started_at)).rowcount
+
+        # only recorded once the subtype completes, so an interrupted sync is retried from the previous bound
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sync_state (item_subtype, synced_until, synced_at) VALUES (?, ?, ?)",
+            (item_subtype.value, synced_until, started_at))
+        self.connection.commit()
+
+        return RegistryMirrorSubtypeSync(item_subtype=item_subtype, full=full, written=written, removed=removed, synced_until=synced_until)
+
+    async def sync(self, item_subtypes: Optional[List[ItemSubType]] = None, full: bool = False, page_size: int = DEFAULT_MIRROR_PAGE_SIZE, concurrency: int = DEFAULT_FETCH_MANY_CONCURRENCY, prefetch: int = DEFAULT_PREFETCH_DEPTH) -> RegistryMirrorSyncResult:
+        """
+        Brings the mirror up to date with the registry. Subtypes which have
+        never been synced are loaded in full, the others only fetch the items
+        updated since their last sync. Subtypes are synced concurrently.
+
+        Parameters
+        ----------
+        item_subtypes : Optional[List[ItemSubType]], optional
+            The subtypes to sync, by default None (every subtype).
+        full : bool, optional
+            Reload every item (removing items deleted from the registry) even
+            if the subtype was synced before, by default False.
+        page_size : int, optional
+            The number of items requested per page, by default DEFAULT_MIRROR_PAGE_SIZE.
+        concurrency : int, optional
+            The maximum number of subtypes synced at once, by default DEFAULT_FETCH_MANY_CONCURRENCY.
+        prefetch : int, optional
+            The number of pages fetched ahead of writing each subtype, by default DEFAULT_PREFETCH_DEPTH.
+
+        Returns
+        -------
+        RegistryMirrorSyncResult
+            The outcome of each subtype.
+
+        Raises
+        ------
+        Exception
+            The first error of any subtype which failed, once every other
+            subtype has finished (their progress is kept).
+        """
+        subtypes = list(item_subtypes) if item_subtypes is not None else list(ItemSubType)
+        results: Dict[ItemSubType, RegistryMirrorSubtypeSync] = {}
+        errors: List[Exception] = []
+
+        async def sync_subtype(item_subtype: ItemSubType) -> RegistryMirrorSubtypeSync:
+            return await self._sync_subtype(item_subtype=item_subtype, full=full, page_size=page_size, prefetch=prefetch)
+
+        async for _, item_subtype, outcome in bounded_as_completed(inputs=subtypes, fn=sync_subtype, concurrency=concurrency):
+            if isinstance(outcome, Exception):
+                errors.append(outcome)
+            else:
+                results[item_subtype] = outcome
+
+        if errors:
+            raise errors[0]
+        return RegistryMirrorSyncResult(subtypes={subtype: results[subtype] for subtype in subtypes})
+
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a mirrored item.
+
+        Parameters
+        ----------
+        id : str
+            The item id.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The (unparsed) item, or None if it is not in the mirror.
+        """
+        row = self.connection.execute("SELECT item_json FROM items WHERE id = ?", (id,)).fetchone()
+        return json.loads(row["item_json"]) if row is not None else None
+
+    def _where(self, item_subtype: Optional[ItemSubType], owner_username: Optional[str], display_name_prefix: Optional[str], updated_since: Optional[int]) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if item_subtype is not None:
+            clauses.append("item_subtype = ?")
+            params.append(item_subtype.value)
+        if owner_username is not None:
+            clauses.append("owner_username = ?")
+            params.append(owner_username)
+        if display_name_prefix is not None:
+            clauses.append("substr(display_name, 1, ?) = ?")
+            params.extend([len(display_name_prefix), display_name_prefix])
+        if updated_since is not None:
+            clauses.append("updated_timestamp >= ?")
+            params.append(updated_since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, item_subtype: Optional[ItemSubType] = None, owner_username: Optional[str] = None, display_name_prefix: Optional[str] = None, updated_since: Optional[int] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Queries the mirrored items, most recently updated first. For other
+        queries use the connection directly (the items table).
+
+        Parameters
+        ----------
+        item_subtype : Optional[ItemSubType], optional
+            Only items of this subtype, by default None.
+        owner_username : Optional[str], optional
+            Only items owned by this user, by default None.
+        display_name_prefix : Optional[str], optional
+            Only items whose display name starts with this (case sensitive), by default None.
+        updated_since : Optional[int], optional
+            Only items updated at or after this unix timestamp, by default None.
+        limit : Optional[int], optional
+            The maximum number of items to return, by default None (every match).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The matching (unparsed) items.
+        """
+        where, params = self._where(item_subtype, owner_username, display_name_prefix, updated_since)
+        sql = f"SELECT item_json FROM items{where} ORDER BY updated_timestamp DESC, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row["item_json"]) for row in self.connection.execute(sql, params)]
+
+    def count(self, item_subtype: Optional[ItemSubType] = None, owner_username: Optional[str] = None) -> int:
+        """
+        Counts the mirrored items.
+
+        Parameters
+        ----------
+        item_subtype : Optional[ItemSubType], optional
+            Only items of this subtype, by default None.
+        owner_username : Optional[str], optional
+            Only items owned by this user, by default None.
+
+        Returns
+        -------
+        int
+            The number of matching items.
+        """
+        where, params = self._where(item_subtype, owner_username, None, None)
+        return int(self.connection.execute(f"SELECT COUNT(*) FROM items{where}", params).fetchone()[0])
@@ -0,0 +1,201 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: TTL/LRU response cache for registry and datastore item fetches.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple, Type
+import hashlib
+import time
+from jose import jwt  # type: ignore
+from provenaclient.auth.manager import AuthManager
+from provenaclient.models.general import CacheStats
+from provenaclient.utils.config import CacheSettings
+from provenaclient.utils.helpers import BaseModelType
+
+# (endpoint, id, seed_allowed, user identity, model name)
+CacheKey = Tuple[str, str, Optional[bool], str, str]
+
+
+async def principal_identity(auth: AuthManager) -> str:
+    """Identifies the user behind an auth manager, so that responses (which
+    depend on the user's access) are never shared between users.
+
+    Parameters
+    ----------
+    auth : AuthManager
+        The auth manager in use.
+
+    Returns
+    -------
+    str
+        The token subject if the token is a JWT, otherwise a hash of the token.
+    """
+    token = await auth.async_get_token()
+    try:
+        subject = jwt.get_unverified_claims(token).get("sub")
+        if subject:
+            return str(subject)
+    except Exception:
+        pass
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class ResponseCache:
+    """A TTL and LRU bounded cache of parsed fetch responses.
+
+    Entries are indexed by item id so that any mutation of an item (update,
+    revert, version, lock/unlock, delete) can drop every cached response of
+    that item regardless of endpoint, user or seed_allowed. Cached models are
+    deep copied on the way in and out so callers cannot mutate cached state.
+    """
+
+    def __init__(self, settings: CacheSettings) -> None:
+        """Creates an empty cache.
+
+        Parameters
+        ----------
+        settings : CacheSettings
+            The TTL and capacity settings.
+        """
+        self.settings = settings
+        self._entries: "OrderedDict[CacheKey, Tuple[float, object]]" = OrderedDict()
+        self._ids: Dict[str, Set[CacheKey]] = {}
+        # the number of fetches in flight per id, and a version (bumped on
+        # invalidation) so that fetches in flight at the time are not cached -
+        # both dropped once the last fetch of the id completes
+        self._in_flight: Dict[str, int] = {}
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0
+        self._stats = CacheStats()
+
+    def _remove(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._ids.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._ids[key[1]]
+
+    def get(self, key: CacheKey) -> Optional[object]:
+        """Looks up a cached response, counting a hit or miss.
+
+        Parameters
+        ----------
+        key : CacheKey
+            The cache key.
+
+        Returns
+        -------
+        Optional[object]
+            The cached response, or None if absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry[1]
+
+    def set(self, key: CacheKey, value: object) -> None:
+        """Stores a response, evicting the least recently used entries if over capacity.
+
+        Parameters
+        ----------
+        key : CacheKey
+            The cache key.
+        value : object
+            The response to cache.
+        """
+        self._entries[key] = (time.monotonic() + self.settings.ttl, value)
+        self._entries.move_to_end(key)
+        self._ids.setdefault(key[1], set()).add(key)
+        while len(self._entries) > self.settings.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    def invalidate(self, id: str) -> None:
+        """Drops all cached responses for an item.
+
+        Parameters
+        ----------
+        id : str
+            The item id which was modified.
+        """
+        if id in self._in_flight:
+            self._versions[id] = self._versions.get(id, 0) + 1
+        for key in list(self._ids.get(id, set())):
+            self._remove(key)
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drops all cached responses."""
+        self._epoch += 1
+        self._entries.clear()
+        self._ids.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the hit/miss statistics.
+
+        Returns
+        -------
+        CacheStats
+            The cache statistics.
+        """
+        return self._stats.model_copy(update={"size": len(self._entries)})
+
+    async def get_or_fetch(self, auth: AuthManager, endpoint: str, id: str, seed_allowed: Optional[bool], model: Type[BaseModelType], fetch: Callable[[], Awaitable[BaseModelType]]) -> BaseModelType:
+        """Returns the cached response for the item, otherwise fetches and caches it.
+
+        Parameters
+        ----------
+        auth : AuthManager
+            The auth manager, used to key the response by user.
+        endpoint : str
+            The fetch endpoint.
+        id : str
+            The item id.
+        seed_allowed : Optional[bool]
+            The seed_allowed flag of the fetch.
+        model : Type[BaseModelType]
+            The response model being fetched.
+        fetch : Callable[[], Awaitable[BaseModelType]]
+            Performs the fetch on a miss.
+
+        Returns
+        -------
+        BaseModelType
+            The (copied) response.
+        """
+        key: CacheKey = (endpoint, id, seed_allowed, await principal_identity(auth), model.__name__)
+        cached = self.get(key)
+        if isinstance(cached, model):
+            return cached.model_copy(deep=True)
+
+        self._in_flight[id] = self._in_flight.get(id, 0) + 1
+        version = (self._epoch, self._versions.get(id, 0))
+        try:
+            result = await fetch()
+            if version == (self._epoch, self._versions.get(id, 0)):
+                self.set(key, result.model_copy(deep=True))
+        finally:
+            remaining = self._in_flight[id] - 1
+            if remaining:
+                self._in_flight[id] = remaining
+            else:
+                del self._in_flight[id]
+                self._versions.pop(id, None)
+        return result
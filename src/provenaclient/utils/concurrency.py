@@ -0,0 +1,231 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Adaptive (AIMD) client side concurrency limiting of requests to each Provena service, and bounded concurrent fan-out helpers.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Iterable, List, Optional, Tuple, TypeVar, Union
+import asyncio
+import logging
+import time
+import httpx
+from provenaclient.utils.config import Config, ConcurrencySettings
+from provenaclient.utils.retry import SendFunction
+
+logger = logging.getLogger(__name__)
+
+InputType = TypeVar("InputType")
+OutputType = TypeVar("OutputType")
+
+
+def service_key(config: Config, url: str) -> str:
+    """Resolves which Provena service a request URL belongs to, so that
+    requests can share the limiter of that service.
+
+    Parameters
+    ----------
+    config : Config
+        The config which defines the service endpoints.
+    url : str
+        The full request URL.
+
+    Returns
+    -------
+    str
+        The matching service endpoint from the config, or the URL origin if none match.
+    """
+    endpoints: List[str] = [
+        config.registry_api_endpoint,
+        config.datastore_api_endpoint,
+        config.prov_api_endpoint,
+        config.jobs_service_api_endpoint,
+        config.search_api_endpoint,
+        config.search_service_endpoint,
+        config.auth_api_endpoint,
+        config.handle_service_api_endpoint,
+    ]
+    matches = [endpoint for endpoint in endpoints if url.startswith(endpoint)]
+    if matches:
+        # overrides may nest services under one host - prefer the most specific
+        return max(matches, key=len)
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.netloc.decode()}"
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds the number of in-flight requests to a single service, tuning
+    the bound with additive increase/multiplicative decrease (AIMD).
+
+    Each successful response grows the limit by increase_step / limit (so
+    roughly increase_step per limit's worth of successes), while a 429/5xx
+    response, timeout or connection error multiplies it by decrease_factor.
+    Only requests started after the most recent decrease can trigger another,
+    so one burst of throttled responses cuts the limit once rather than
+    collapsing it to the floor.
+    """
+
+    def __init__(self, settings: ConcurrencySettings) -> None:
+        """Creates a limiter starting at settings.initial_limit.
+
+        Parameters
+        ----------
+        settings : ConcurrencySettings
+            The AIMD bounds and step sizes.
+        """
+        self.settings = settings
+        self._limit = float(settings.initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """The current (integer) concurrency limit."""
+        return max(self.settings.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently holding a slot."""
+        return self._in_flight
+
+    def _wake_waiters(self) -> None:
+        available = self.limit - self._in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    async def acquire(self) -> float:
+        """Waits until a slot is available under the current limit and takes it.
+
+        Returns
+        -------
+        float
+            The monotonic time the slot was acquired, to be passed to release.
+        """
+        while self._in_flight >= self.limit:
+            waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # we were woken but won't use the slot - pass it on
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+        return time.monotonic()
+
+    def release(self, started: float, throttled: bool) -> None:
+        """Releases a slot and feeds the outcome back into the limit.
+
+        Parameters
+        ----------
+        started : float
+            The acquisition time returned by acquire.
+        throttled : bool
+            True if the service signalled overload (429/5xx, timeout, connection error).
+        """
+        self._in_flight -= 1
+        if throttled:
+            if started >= self._last_decrease:
+                self._limit = max(float(self.settings.min_limit),
+                                  self._limit * self.settings.decrease_factor)
+                self._last_decrease = time.monotonic()
+                logger.info(f"Service overloaded, reducing concurrency limit to {self.limit}.")
+        else:
+            self._limit = min(float(self.settings.max_limit),
+                              self._limit + self.settings.increase_step / self._limit)
+        self._wake_waiters()
+
+    async def run(self, send: SendFunction) -> httpx.Response:
+        """Sends a single request attempt within a limiter slot.
+
+        Parameters
+        ----------
+        send : SendFunction
+            Zero argument coroutine function which performs the attempt.
+
+        Returns
+        -------
+        httpx.Response
+            The response.
+        """
+        started = await self.acquire()
+        try:
+            response = await send()
+        except (httpx.TimeoutException, httpx.NetworkError):
+            self.release(started, throttled=True)
+            raise
+        except BaseException:
+            self.release(started, throttled=False)
+            raise
+        self.release(started, throttled=response.status_code ==
+                     429 or response.status_code >= 500)
+        return response
+
+
+async def bounded_as_completed(inputs: Iterable[InputType], fn: Callable[[InputType], Awaitable[OutputType]], concurrency: int) -> AsyncIterator[Tuple[int, InputType, Union[OutputType, Exception]]]:
+    """Applies fn to every input with at most concurrency calls in flight,
+    yielding each outcome as soon as it completes.
+
+    A fixed pool of workers pulls from the inputs, so no more than
+    concurrency tasks exist at once however many inputs there are. Exceptions
+    raised by fn are yielded (not raised) so one failure does not abort the
+    rest. If the consumer stops iterating early the workers are cancelled.
+
+    Parameters
+    ----------
+    inputs : Iterable[InputType]
+        The inputs to process.
+    fn : Callable[[InputType], Awaitable[OutputType]]
+        The coroutine function to apply.
+    concurrency : int
+        The maximum number of concurrent calls (at least 1).
+
+    Yields
+    ------
+    Tuple[int, InputType, Union[OutputType, Exception]]
+        The index of the input, the input and its result or exception - in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, got {concurrency}.")
+
+    pending = iter(enumerate(inputs))
+    # None marks a worker having run out of inputs
+    queue: "asyncio.Queue[Optional[Tuple[int, InputType, Union[OutputType, Exception]]]]" = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for index, value in pending:
+                try:
+                    outcome: Union[OutputType, Exception] = await fn(value)
+                except Exception as e:
+                    outcome = e
+                await queue.put((index, value, outcome))
+        finally:
+            queue.put_nowait(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            entry = await queue.get()
+            if entry is None:
+                running -= 1
+                continue
+            yield entry
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -13,7 +13,8 @@ Date      	By	Comments
 '''
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
+import os
 
 def optional_override_prefixor(domain: str, prefix: str, override: Optional[str]) -> str:
     """
@@ -52,6 +53,102 @@ class APIOverrides(BaseModel):
     jobs_service_api_endpoint_override: Optional[str] = None
     keycloak_endpoint_override: Optional[str] = None
 
+class TransportSettings(BaseModel):
+    # Total number of concurrent connections the shared pool may open
+    max_connections: int = 100
+    # Number of idle connections kept alive for reuse
+    max_keepalive_connections: int = 20
+    # How long (seconds) an idle keep-alive connection is held open
+    keepalive_expiry: float = 30.0
+    # Total request timeout in seconds (mirroring API Gateway timeout)
+    timeout: float = 30.0
+    # Opt-in HTTP/2 so concurrent requests to one host are multiplexed over a
+    # single connection. Requires the optional h2 package (pip install provenaclient[http2])
+    http2: bool = False
+    # Coalesce identical concurrent GET requests (same URL, params and user) into
+    # one network call whose parsed result is shared
+    coalesce_requests: bool = True
+
+class RetrySettings(BaseModel):
+    # Total attempts per request including the first (1 disables retrying)
+    max_attempts: int = 3
+    # Base delay (seconds) of the exponential backoff - base * 2^(attempt - 1)
+    backoff_base: float = 0.5
+    # Upper bound (seconds) on any single backoff delay
+    backoff_max: float = 10.0
+    # Use "full jitter" - sleep a random duration between 0 and the backoff delay
+    jitter: bool = True
+    # Status codes considered transient and therefore retryable
+    retry_status_codes: List[int] = [429, 502, 503, 504]
+    # Retry on connection errors and timeouts (httpx transport errors)
+    retry_on_network_errors: bool = True
+    # Methods which are retried by default - other methods (e.g. POST) are only
+    # retried if the caller marks the request as idempotent
+    retry_methods: List[str] = ["GET", "PUT"]
+    # Honour the server's Retry-After header (seconds or HTTP-date) when present
+    respect_retry_after: bool = True
+    # If the server asks us to wait longer than this (seconds), give up instead
+    max_retry_after: float = 60.0
+    # Retry budget - retries are limited to this fraction of the requests sent
+    # over the budget window, so that retries cannot amplify an outage
+    budget_ratio: float = 0.2
+    # Retries always allowed within a window regardless of the ratio
+    budget_min_retries: int = 10
+    # Length (seconds) of the sliding window the budget is computed over
+    budget_window: float = 10.0
+
+class ConcurrencySettings(BaseModel):
+    # Enable the adaptive (AIMD) per service concurrency limiter
+    enabled: bool = True
+    # Concurrent in-flight requests allowed per service before any feedback
+    initial_limit: int = 10
+    # Floor the limit can be cut to
+    min_limit: int = 1
+    # Ceiling the limit can grow to
+    max_limit: int = 100
+    # Additive increase - the limit grows by this much per limit's worth of successful responses
+    increase_step: float = 1.0
+    # Multiplicative decrease - the limit is multiplied by this on a 429/5xx response or timeout
+    decrease_factor: float = 0.5
+
+class CacheSettings(BaseModel):
+    # Opt-in cache of registry/datastore item fetches
+    enabled: bool = False
+    # How long (seconds) a cached fetch response remains valid
+    ttl: float = 60.0
+    # Maximum number of cached responses before the least recently used is evicted
+    max_entries: int = 1024
+
+class KeyCacheSettings(BaseModel):
+    # Persist the keycloak signing keys (JWKS) to disk so that new processes start without a network call
+    persist: bool = True
+    # The file the signing keys are persisted to (shared by every realm and process)
+    path: str = os.path.join(os.path.expanduser("~"), ".provena", "keycloak-keys.json")
+    # How long (seconds) cached signing keys are trusted before being refetched
+    ttl: float = 86400.0
+    # Minimum seconds between refetches forced by a token which fails verification
+    min_refetch_interval: float = 30.0
+
+class TransferSettings(BaseModel):
+    # Number of files transferred to/from the datastore at once
+    workers: int = 16
+    # Files at least this large (bytes) are uploaded in parts
+    multipart_threshold: int = 64 * 1024 * 1024
+    # The size (bytes) of each part of a multipart upload
+    part_size: int = 16 * 1024 * 1024
+    # Number of parts of a single file transferred at once
+    part_concurrency: int = 8
+    # Attempts made to transfer each file before it is reported as failed
+    max_attempts: int = 3
+    # Base delay (seconds) of the exponential backoff between attempts of a file
+    backoff_base: float = 1.0
+    # Maximum delay (seconds) between attempts of a file
+    backoff_max: float = 30.0
+    # Dataset credentials are renewed this many seconds before they expire (cached credentials are reused until then)
+    credential_renewal_margin: float = 300.0
+    # Threads running the blocking S3 work (listing, transfers, checksums) of the async IO methods off the event loop
+    io_threads: int = 4
+
 class EndpointConfig(BaseModel):
     domain: str
     # What is the auth realm name?
@@ -60,7 +157,7 @@ class EndpointConfig(BaseModel):
 
 class Config():
 
-    def __init__(self, domain: str, realm_name: str, api_overrides: APIOverrides = APIOverrides()) -> None:
+    def __init__(self, domain: str, realm_name: str, api_overrides: APIOverrides = APIOverrides(), transport_settings: TransportSettings = TransportSettings(), retry_settings: RetrySettings = RetrySettings(), concurrency_settings: ConcurrencySettings = ConcurrencySettings(), cache_settings: CacheSettings = CacheSettings(), key_cache_settings: KeyCacheSettings = KeyCacheSettings(), transfer_settings: TransferSettings = TransferSettings()) -> None:
         """Creates a EndpointConfig object that holds relevant Provena instance information
         and possible overrides if provided.
 
@@ -72,10 +169,100 @@ class Config():
             Your keycloak realm name.
         api_overrides : APIOverrides, optional
             Provide any overrides to certain API endpoints if you wish, by default APIOverrides() with all overrides set to None.
+        transport_settings : TransportSettings, optional
+            Connection pool and keep-alive settings for the shared HTTP transport, by default TransportSettings().
+        retry_settings : RetrySettings, optional
+            Backoff, idempotency and retry budget settings applied to requests sent through the shared HTTP transport, by default RetrySettings().
+        concurrency_settings : ConcurrencySettings, optional
+            Adaptive per service concurrency limits applied to requests sent through the shared HTTP transport, by default ConcurrencySettings().
+        cache_settings : CacheSettings, optional
+            TTL/LRU cache of registry and datastore item fetches, by default CacheSettings() (disabled).
+        key_cache_settings : KeyCacheSettings, optional
+            TTL and on-disk persistence of the keycloak token signing keys used by the auth flows, by default KeyCacheSettings().
+        transfer_settings : TransferSettings, optional
+            Worker pool, multipart and retry settings of datastore file transfers, by default TransferSettings().
         """
 
         # the unpopulated environment
         self._api_config: EndpointConfig = EndpointConfig(domain=domain, realm_name=realm_name, api_overrides=api_overrides)
+        self._transport_settings: TransportSettings = transport_settings
+        self._retry_settings: RetrySettings = retry_settings
+        self._concurrency_settings: ConcurrencySettings = concurrency_settings
+        self._cache_settings: CacheSettings = cache_settings
+        self._key_cache_settings: KeyCacheSettings = key_cache_settings
+        self._transfer_settings: TransferSettings = transfer_settings
+
+    @property
+    def transport_settings(self) -> TransportSettings:
+        """The connection pool/keep-alive settings used by the shared HTTP transport.
+
+        Returns
+        -------
+        TransportSettings
+            The transport settings.
+        """
+
+        return self._transport_settings
+
+    @property
+    def retry_settings(self) -> RetrySettings:
+        """The retry/backoff settings used for requests through the shared HTTP transport.
+
+        Returns
+        -------
+        RetrySettings
+            The retry settings.
+        """
+
+        return self._retry_settings
+
+    @property
+    def concurrency_settings(self) -> ConcurrencySettings:
+        """The adaptive per service concurrency limiter settings used by the shared HTTP transport.
+
+        Returns
+        -------
+        ConcurrencySettings
+            The concurrency settings.
+        """
+
+        return self._concurrency_settings
+
+    @property
+    def cache_settings(self) -> CacheSettings:
+        """The registry/datastore fetch response cache settings.
+
+        Returns
+        -------
+        CacheSettings
+            The cache settings.
+        """
+
+        return self._cache_settings
+
+    @property
+    def key_cache_settings(self) -> KeyCacheSettings:
+        """The keycloak signing key (JWKS) cache settings used by the auth flows.
+
+        Returns
+        -------
+        KeyCacheSettings
+            The key cache settings.
+        """
+
+        return self._key_cache_settings
+
+    @property
+    def transfer_settings(self) -> TransferSettings:
+        """The worker pool, multipart and retry settings of datastore file transfers.
+
+        Returns
+        -------
+        TransferSettings
+            The transfer settings.
+        """
+
+        return self._transfer_settings
     
     # Property methods to retrieve different API endpoints. 
 
@@ -13,6 +13,7 @@ Date      	By	Comments
 '''
 
 from typing import Optional
+from provenaclient.models.datastore import TransferReport
 
 import httpx
 
@@ -164,6 +165,16 @@ class HTTPValidationException(BaseException):
     pass
 
 
+class StatusFailureException(Exception):
+    """An exception raised when an API responds 200 OK with a status
+    object indicating failure (e.g. fetching an item which does not exist).
+
+    Unlike the handled exceptions above, this is wrapped (as the cause) by
+    the client request helpers so that their error message gives context.
+    """
+    pass
+
+
 class ServerException(BaseException):
     """An exception raised for HTTP 500+ Server Error responses.
 
@@ -187,3 +198,29 @@ class ValidationException(BaseException):
         A custom exception class that inherits from python's base exception
         and takes more parameters.
     """
+
+
+class TransferException(BaseException):
+    """An exception raised when datastore files could not be transferred
+    after every attempt. The report lists the files which were transferred
+    and those which failed.
+
+    Parameters
+    ----------
+    BaseException
+        A custom exception class that inherits from python's base exception
+        and takes more parameters.
+    """
+
+    def __init__(self, message: str, report: TransferReport) -> None:
+        """Initialise the exception with a message and the transfer report.
+
+        Parameters
+        ----------
+        message : str
+            The error message describing the exception
+        report : TransferReport
+            The outcome of every file of the transfer
+        """
+        super().__init__(message)
+        self.report = report
@@ -16,7 +16,7 @@ from pydantic import BaseModel, ValidationError
 from typing import Dict, Any, List, Mapping, Optional, Tuple, TypeVar, Type, Union, ByteString
 import json
 from httpx import Response
-from provenaclient.utils.exceptions import AuthException, HTTPValidationException, ServerException, BadRequestException, ValidationException, NotFoundException
+from provenaclient.utils.exceptions import AuthException, HTTPValidationException, ServerException, BadRequestException, ValidationException, NotFoundException, StatusFailureException
 from provenaclient.utils.exceptions import BaseException
 from ProvenaInterfaces.SharedTypes import StatusResponse
 from ProvenaInterfaces.RegistryModels import ItemBase, ItemSubType
@@ -357,7 +357,7 @@ def check_status_response(json_data: JsonData) -> None:
         json_data (Dict): The JSON data to parse
 
     Raises:
-        Exception: Exception if status if False
+        StatusFailureException: If status is False
     """
     # Check model parses
     status_obj = handle_model_parsing(
@@ -365,7 +365,7 @@ def check_status_response(json_data: JsonData) -> None:
 
     # Check status is success
     if not status_obj.status.success:
-        raise Exception(
+        raise StatusFailureException(
             f"Status object from API indicated failure. Details: {status_obj.status.details}.")
 
 
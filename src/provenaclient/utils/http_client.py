@@ -12,20 +12,152 @@ Date      	By	Comments
 ----------	---	---------------------------------------------------------
 """
 
-from typing import Any, List, Optional, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+import asyncio
 import httpx
 from provenaclient.auth.helpers import HttpxBearerAuth
+from provenaclient.utils.concurrency import AdaptiveConcurrencyLimiter
+from provenaclient.utils.config import ConcurrencySettings, RetrySettings, TransportSettings
+from provenaclient.utils.retry import RetryBudget
+from provenaclient.utils.single_flight import SingleFlight
 from provenaclient.utils.helpers import JsonData
 
 # 30s total timeout (mirroring API Gateway timeout anyway)
 timeout = httpx.Timeout(timeout=30.0)
 
+
+class HttpTransport:
+    """A pooled, long-lived httpx.AsyncClient which is shared between all L2
+    clients of a ProvenaClient so that TCP/TLS connections are re-used across
+    requests.
+
+    The underlying client is created lazily on first use. If settings.http2 is
+    enabled, concurrent requests to the same host are multiplexed over one
+    HTTP/2 connection rather than opening a socket each. Connections are bound
+    to the event loop they were opened on, so if the transport is used from a
+    new event loop (e.g. repeated asyncio.run calls) a fresh pool is created.
+
+    The transport also carries the retry settings and the retry budget shared
+    by every request sent through it, one adaptive concurrency limiter per
+    Provena service and the single-flight group used to coalesce identical
+    concurrent GET requests.
+    """
+
+    settings: TransportSettings
+    retry_settings: Optional[RetrySettings]
+    retry_budget: Optional[RetryBudget]
+    concurrency_settings: Optional[ConcurrencySettings]
+    limiters: Dict[str, AdaptiveConcurrencyLimiter]
+    single_flight: SingleFlight
+
+    def __init__(self, settings: Optional[TransportSettings] = None, retry_settings: Optional[RetrySettings] = None, concurrency_settings: Optional[ConcurrencySettings] = None) -> None:
+        """Creates a transport which will lazily build a pooled httpx client.
+
+        Parameters
+        ----------
+        settings : Optional[TransportSettings], optional
+            The pool limits, keep-alive and timeout settings, by default TransportSettings().
+        retry_settings : Optional[RetrySettings], optional
+            The retry/backoff settings for requests through this transport, by default None (no retries).
+        concurrency_settings : Optional[ConcurrencySettings], optional
+            The adaptive per service concurrency limits, by default None (unbounded).
+        """
+        self.settings = settings if settings is not None else TransportSettings()
+        self.retry_settings = retry_settings
+        self.retry_budget = RetryBudget(
+            retry_settings) if retry_settings is not None else None
+        self.concurrency_settings = concurrency_settings
+        self.limiters = {}
+        self.single_flight = SingleFlight()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        if self.settings.http2:
+            try:
+                import h2  # type: ignore # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 was enabled in the transport settings but the 'h2' package is not installed. "
+                    "Install it with 'pip install provenaclient[http2]'.") from e
+
+        return httpx.AsyncClient(
+            http2=self.settings.http2,
+            timeout=httpx.Timeout(timeout=self.settings.timeout),
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+                keepalive_expiry=self.settings.keepalive_expiry,
+            ),
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Returns the pooled client for the currently running event loop,
+        creating it if required.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The shared async client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # connections from a previous (likely closed) loop cannot be re-used
+            self._client = self._build_client()
+            self._loop = loop
+        return self._client
+
+    def get_limiter(self, service: str) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Returns the concurrency limiter for the given service, creating it
+        if required.
+
+        Parameters
+        ----------
+        service : str
+            The service key (see concurrency.service_key).
+
+        Returns
+        -------
+        Optional[AdaptiveConcurrencyLimiter]
+            The limiter, or None if concurrency limiting is disabled.
+        """
+        if self.concurrency_settings is None or not self.concurrency_settings.enabled:
+            return None
+        limiter = self.limiters.get(service)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(self.concurrency_settings)
+            self.limiters[service] = limiter
+        return limiter
+
+    async def aclose(self) -> None:
+        """Closes the pooled client and releases any open connections."""
+        client = self._client
+        self._client = None
+        self._loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+@asynccontextmanager
+async def _client_session(transport: Optional[HttpTransport]) -> AsyncIterator[httpx.AsyncClient]:
+    """Yields the shared pooled client if a transport is provided, otherwise a
+    fresh single use client which is closed on exit."""
+    if transport is not None:
+        yield transport.get_client()
+    else:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            yield client
+
 # L1 interface.
 
 
 class HttpClient:
     """This class only contains static methods as it acts as an HTTP client and provides a layer over these static methods
     and makes them easily identifiable within the codebase.
+
+    Each method optionally accepts a HttpTransport - if provided the request is
+    sent through its pooled connections, otherwise a single use client is used.
     """
 
     @staticmethod
@@ -34,6 +166,7 @@ class HttpClient:
         params: Optional[dict[str, Any]] = None,
         auth: Optional[HttpxBearerAuth] = None,
         headers: Optional[dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
     ) -> httpx.Response:
         """Makes an asynchronous HTTP GET request to the specified URL using the provided parameters, authentication, and headers.
 
@@ -47,13 +180,15 @@ class HttpClient:
             Authentication object (httpx bearer token only), to be included in the request headers, by default None.
         headers : Optional[dict[str,Any]], optional
             A dictionary having additional HTTP headers to send with the GET request, by default None.
+        transport : Optional[HttpTransport], optional
+            The shared pooled transport to send the request through, by default None (single use client).
 
         Returns
         -------
         httpx.Response
             The response from the server as an httpx.Response object.
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with _client_session(transport) as client:
             response = await client.get(url, params=params, headers=headers, auth=auth)
             return response
 
@@ -63,6 +198,7 @@ class HttpClient:
         auth: HttpxBearerAuth,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
     ) -> httpx.Response:
         """Makes an asynchronous HTTP DELETE request to the specified URL using the provided parameters, authentication, and headers.
 
@@ -76,13 +212,15 @@ class HttpClient:
             Authentication object (httpx bearer token only), to be included in the request headers, by default None.
         headers : Optional[dict[str,Any]], optional
             A dictionary having additional HTTP headers to send with the GET request, by default None.
+        transport : Optional[HttpTransport], optional
+            The shared pooled transport to send the request through, by default None (single use client).
 
         Returns
         -------
         httpx.Response
             The response from the server as an httpx.Response object.
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with _client_session(transport) as client:
             response = await client.delete(
                 url, params=params, headers=headers, auth=auth
             )
@@ -96,6 +234,7 @@ class HttpClient:
         data: Union[Optional[dict[str, Any]], Optional[List[dict[str, Any]]]] = None,
         files: Optional[dict[str, tuple[str, bytes, str]]] = None,
         headers: Optional[dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
     ) -> httpx.Response:
         """Makes an asynchronous HTTP POST request to the specified URL with the provided data, authentication, and headers.
 
@@ -113,13 +252,15 @@ class HttpClient:
             A files request object containing the file content and the media type.
         headers : Optional[dict[str, Any]], optional
             A dictionary representing additional HTTP headers to send with the POST request, by default None.
+        transport : Optional[HttpTransport], optional
+            The shared pooled transport to send the request through, by default None (single use client).
 
         Returns
         -------
         httpx.Response
             The response from the server as an httpx.Response object.
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with _client_session(transport) as client:
             response = await client.post(
                 url, params=params, json=data, headers=headers, files=files, auth=auth
             )
@@ -132,6 +273,7 @@ class HttpClient:
         params: Optional[dict[str, Any]] = None,
         data: Optional[JsonData] = None,
         headers: Optional[dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
     ) -> httpx.Response:
         """Makes an asynchronous HTTP put request to the specified URL with the provided data, authentication, and headers.
 
@@ -147,14 +289,55 @@ class HttpClient:
             A dictionary of the data to be sent in the body of the put request, by default None.
         headers : Optional[dict[str, Any]], optional
             A dictionary representing additional HTTP headers to send with the put request, by default None.
+        transport : Optional[HttpTransport], optional
+            The shared pooled transport to send the request through, by default None (single use client).
 
         Returns
         -------
         httpx.Response
             The response from the server as an httpx.Response object.
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with _client_session(transport) as client:
             response = await client.put(
                 url, params=params, json=data, headers=headers, auth=auth
             )
             return response
+
+    @staticmethod
+    @asynccontextmanager
+    async def make_streamed_get_request(
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        auth: Optional[HttpxBearerAuth] = None,
+        headers: Optional[dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Makes an asynchronous HTTP GET request without reading the response
+        body, so that large bodies can be consumed incrementally (e.g. with
+        response.aiter_text()) within the context.
+
+        Parameters
+        ----------
+        url : str
+            The URL to which the GET request will be sent.
+        params : Optional[dict[str, Any]], optional
+            A dictionary of the query parameters to be included in the GET request, by default None.
+        auth : Optional[HttpxBearerAuth], optional
+            Authentication object (httpx bearer token only), to be included in the request headers, by default None.
+        headers : Optional[dict[str,Any]], optional
+            A dictionary having additional HTTP headers to send with the GET request, by default None.
+        transport : Optional[HttpTransport], optional
+            The shared pooled transport to send the request through, by default None (single use client).
+
+        Yields
+        ------
+        httpx.Response
+            The response with its body unread - it is closed when the context exits.
+        """
+        async with _client_session(transport) as client:
+            request = client.build_request("GET", url, params=params, headers=headers)
+            response = await client.send(request, auth=auth, stream=True)
+            try:
+                yield response
+            finally:
+                await response.aclose()
@@ -0,0 +1,185 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Incremental JSON parsing of large object responses whose bulk is a single array field.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+import json
+from provenaclient.utils.exceptions import ValidationException
+
+_WHITESPACE = " \t\n\r"
+
+
+class _State(str, Enum):
+    START = "START"
+    KEY = "KEY"
+    COLON = "COLON"
+    VALUE = "VALUE"
+    AFTER_VALUE = "AFTER_VALUE"
+    ARRAY = "ARRAY"
+    ELEMENT = "ELEMENT"
+    AFTER_ELEMENT = "AFTER_ELEMENT"
+    END = "END"
+
+
+# (key, value, is_array_element) - elements of the streamed array are reported
+# one at a time with is_array_element True, every other top level field whole
+JsonStreamEvent = Tuple[str, Any, bool]
+
+
+class JsonArrayFieldParser:
+    """Incrementally parses a JSON object of the form {..., "<array_key>": [...], ...}
+    as text arrives, reporting each element of the array field as soon as it
+    is complete so that the full document never has to be held in memory.
+
+    Only the unconsumed tail of the input is buffered - at most one element
+    (or one other top level value) at a time. Each value is decoded with the
+    standard library json decoder.
+    """
+
+    def __init__(self, array_key: str) -> None:
+        """Creates a parser for a document streaming the given field.
+
+        Parameters
+        ----------
+        array_key : str
+            The top level field whose array elements should be reported individually.
+        """
+        self.array_key = array_key
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _State.START
+        self._key: Optional[str] = None
+
+    def _skip_whitespace(self, position: int) -> int:
+        while position < len(self._buffer) and self._buffer[position] in _WHITESPACE:
+            position += 1
+        return position
+
+    def _decode(self, position: int) -> Optional[Tuple[Any, int]]:
+        # decodes a whole value, or returns None if more input is needed
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            return None
+        # a number at the end of the buffer may continue in the next chunk
+        if self._skip_whitespace(end) >= len(self._buffer):
+            return None
+        return value, end
+
+    def _expect(self, position: int, expected: str) -> None:
+        raise ValidationException(
+            message=f"Invalid JSON stream - expected {expected} at '{self._buffer[position:position + 20]}'.")
+
+    def feed(self, text: str) -> List[JsonStreamEvent]:
+        """Consumes the next chunk of the document.
+
+        Parameters
+        ----------
+        text : str
+            The next chunk of JSON text.
+
+        Returns
+        -------
+        List[JsonStreamEvent]
+            The fields and array elements completed by this chunk, in document order.
+
+        Raises
+        ------
+        ValidationException
+            If the document is not a JSON object.
+        """
+        self._buffer += text
+        events: List[JsonStreamEvent] = []
+        position = 0
+
+        while True:
+            position = self._skip_whitespace(position)
+            if position >= len(self._buffer) or self._state == _State.END:
+                break
+            char = self._buffer[position]
+
+            if self._state == _State.START:
+                if char != "{":
+                    self._expect(position, "an object")
+                position += 1
+                self._state = _State.KEY
+            elif self._state == _State.KEY:
+                if char == "}":
+                    position += 1
+                    self._state = _State.END
+                    continue
+                if char != '"':
+                    self._expect(position, "a field name")
+                decoded = self._decode(position)
+                if decoded is None:
+                    break
+                self._key, position = decoded
+                self._state = _State.COLON
+            elif self._state == _State.COLON:
+                if char != ":":
+                    self._expect(position, "':'")
+                position += 1
+                self._state = _State.ARRAY if self._key == self.array_key else _State.VALUE
+            elif self._state == _State.ARRAY and char == "[":
+                position += 1
+                self._state = _State.ELEMENT
+            elif self._state in (_State.VALUE, _State.ARRAY):
+                # other fields (and a non array value of the streamed field) are decoded whole
+                decoded = self._decode(position)
+                if decoded is None:
+                    break
+                value, position = decoded
+                assert self._key is not None
+                events.append((self._key, value, False))
+                self._state = _State.AFTER_VALUE
+            elif self._state == _State.AFTER_VALUE:
+                if char not in ",}":
+                    self._expect(position, "',' or '}'")
+                position += 1
+                self._state = _State.KEY if char == "," else _State.END
+            elif self._state == _State.ELEMENT:
+                if char == "]":
+                    position += 1
+                    self._state = _State.AFTER_VALUE
+                    continue
+                decoded = self._decode(position)
+                if decoded is None:
+                    break
+                value, position = decoded
+                events.append((self.array_key, value, True))
+                self._state = _State.AFTER_ELEMENT
+            elif self._state == _State.AFTER_ELEMENT:
+                if char not in ",]":
+                    self._expect(position, "',' or ']'")
+                position += 1
+                self._state = _State.ELEMENT if char == "," else _State.AFTER_VALUE
+
+        # drop everything consumed so memory stays bounded by a single value
+        self._buffer = self._buffer[position:]
+        return events
+
+    def close(self) -> None:
+        """Checks that the whole document was received.
+
+        Raises
+        ------
+        ValidationException
+            If the document was truncated or has trailing content.
+        """
+        if self._state != _State.END:
+            raise ValidationException(
+                message="Invalid JSON stream - the document ended before it was complete.")
+        if self._buffer.strip():
+            raise ValidationException(
+                message="Invalid JSON stream - unexpected content after the document.")
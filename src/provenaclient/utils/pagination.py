@@ -0,0 +1,165 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Generic pagination of Provena list endpoints, prefetching upcoming pages while the current page is consumed.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, TypeVar, Union
+import asyncio
+from pydantic import BaseModel
+
+# Number of pages fetched ahead of the consumer by default
+DEFAULT_PREFETCH_DEPTH = 1
+
+
+class PaginatedResponse(Protocol):
+    # The key of the next page, or None if this is the last page
+    pagination_key: Optional[Dict[str, Any]]
+
+
+ListRequestType = TypeVar("ListRequestType", bound=BaseModel)
+PageType = TypeVar("PageType", bound=PaginatedResponse)
+ItemType = TypeVar("ItemType")
+
+
+async def paginate_pages(request: ListRequestType, fetch_page: Callable[[ListRequestType], Awaitable[PageType]], count_items: Callable[[PageType], int], prefetch: int = DEFAULT_PREFETCH_DEPTH, total_limit: Optional[int] = None) -> AsyncIterator[PageType]:
+    """Walks a paginated list endpoint, yielding each page in order.
+
+    Page N+1 can only be requested once page N has returned its pagination
+    key, so pages are fetched one at a time - but a background task fetches up
+    to prefetch pages ahead of the consumer, so the next page is usually ready
+    (or in flight) while the current one is being processed.
+
+    The request is never mutated - each page is requested with a copy
+    carrying that page's pagination key.
+
+    Parameters
+    ----------
+    request : ListRequestType
+        The list request of the first page (its pagination key is where the walk starts).
+    fetch_page : Callable[[ListRequestType], Awaitable[PageType]]
+        Requests a single page.
+    count_items : Callable[[PageType], int]
+        Counts the items of a page, to stop fetching once total_limit is reached.
+    prefetch : int, optional
+        The number of pages to fetch ahead of the consumer (0 fetches each page
+        only when the consumer asks for it), by default DEFAULT_PREFETCH_DEPTH.
+    total_limit : Optional[int], optional
+        Stop fetching once this many items have been fetched, by default None (walk every page).
+
+    Yields
+    ------
+    PageType
+        Each page, in order.
+    """
+    if prefetch < 0:
+        raise ValueError(f"Prefetch depth must be at least 0, got {prefetch}.")
+
+    async def pages() -> AsyncIterator[PageType]:
+        page_request = request.model_copy()
+        fetched = 0
+        while True:
+            page = await fetch_page(page_request)
+            fetched += count_items(page)
+            yield page
+            if not page.pagination_key or (total_limit is not None and fetched >= total_limit):
+                return
+            page_request = request.model_copy(update={"pagination_key": page.pagination_key})
+
+    if prefetch == 0:
+        async for page in pages():
+            yield page
+        return
+
+    # the producer blocks once prefetch pages are waiting, so at most prefetch
+    # pages are buffered (plus the one being fetched). None marks the end.
+    queue: "asyncio.Queue[Union[PageType, BaseException, None]]" = asyncio.Queue(maxsize=prefetch)
+
+    async def producer() -> None:
+        try:
+            async for page in pages():
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    task = asyncio.create_task(producer())
+    try:
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            if isinstance(entry, BaseException):
+                raise entry
+            yield entry
+    finally:
+        # the consumer may stop early - don't keep fetching
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def paginate(request: ListRequestType, fetch_page: Callable[[ListRequestType], Awaitable[PageType]], get_items: Callable[[PageType], Optional[List[ItemType]]], prefetch: int = DEFAULT_PREFETCH_DEPTH, total_limit: Optional[int] = None) -> AsyncIterator[ItemType]:
+    """Walks a paginated list endpoint, yielding every item in order while
+    upcoming pages are prefetched (see paginate_pages).
+
+    Parameters
+    ----------
+    request : ListRequestType
+        The list request of the first page - never mutated.
+    fetch_page : Callable[[ListRequestType], Awaitable[PageType]]
+        Requests a single page.
+    get_items : Callable[[PageType], Optional[List[ItemType]]]
+        Extracts the items of a page.
+    prefetch : int, optional
+        The number of pages to fetch ahead of the consumer, by default DEFAULT_PREFETCH_DEPTH.
+    total_limit : Optional[int], optional
+        The maximum number of items to yield, by default None (every item).
+
+    Yields
+    ------
+    ItemType
+        Each item, in order.
+    """
+    if total_limit is not None and total_limit <= 0:
+        return
+
+    yielded = 0
+    async for page in paginate_pages(request=request, fetch_page=fetch_page, count_items=lambda page: len(get_items(page) or []), prefetch=prefetch, total_limit=total_limit):
+        for item in get_items(page) or []:
+            yield item
+            yielded += 1
+            if total_limit is not None and yielded >= total_limit:
+                return
+
+
+async def collect_paginated(request: ListRequestType, fetch_page: Callable[[ListRequestType], Awaitable[PageType]], get_items: Callable[[PageType], Optional[List[ItemType]]], prefetch: int = DEFAULT_PREFETCH_DEPTH, total_limit: Optional[int] = None) -> List[ItemType]:
+    """Collects every item of a paginated list endpoint (see paginate).
+
+    Parameters
+    ----------
+    request : ListRequestType
+        The list request of the first page - never mutated.
+    fetch_page : Callable[[ListRequestType], Awaitable[PageType]]
+        Requests a single page.
+    get_items : Callable[[PageType], Optional[List[ItemType]]]
+        Extracts the items of a page.
+    prefetch : int, optional
+        The number of pages to fetch ahead, by default DEFAULT_PREFETCH_DEPTH.
+    total_limit : Optional[int], optional
+        The maximum number of items to collect, by default None (every item).
+
+    Returns
+    -------
+    List[ItemType]
+        The items, in order.
+    """
+    return [item async for item in paginate(request=request, fetch_page=fetch_page, get_items=get_items, prefetch=prefetch, total_limit=total_limit)]
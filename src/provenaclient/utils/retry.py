@@ -0,0 +1,232 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Retry policy for the L1 HTTP layer - exponential backoff with jitter, Retry-After support and a retry budget.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Deque, Optional
+import asyncio
+import logging
+import random
+import time
+import httpx
+from provenaclient.utils.config import RetrySettings
+
+logger = logging.getLogger(__name__)
+
+SendFunction = Callable[[], Awaitable[httpx.Response]]
+
+
+class RetryBudget:
+    """A sliding window retry budget shared between all requests of a transport.
+
+    Retries are permitted while the number of retries within the window is
+    below budget_min_retries + budget_ratio * requests within the window. Once
+    exhausted, failures are surfaced immediately rather than retried so that a
+    struggling service is not hit with a multiple of its normal load.
+    """
+
+    def __init__(self, settings: RetrySettings) -> None:
+        """Creates an empty budget.
+
+        Parameters
+        ----------
+        settings : RetrySettings
+            The retry settings which define the ratio, floor and window.
+        """
+        self.settings = settings
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.settings.budget_window
+        for window in (self._requests, self._retries):
+            while window and window[0] < cutoff:
+                window.popleft()
+
+    def record_request(self) -> None:
+        """Records an initial (non retry) request attempt."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """Attempts to withdraw a retry from the budget.
+
+        Returns
+        -------
+        bool
+            True if the retry is permitted (and has been recorded), False if the budget is exhausted.
+        """
+        now = time.monotonic()
+        self._prune(now)
+        allowed = self.settings.budget_min_retries + \
+            self.settings.budget_ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header value, which is either a number of seconds
+    or an HTTP-date.
+
+    Parameters
+    ----------
+    value : Optional[str]
+        The raw header value.
+
+    Returns
+    -------
+    Optional[float]
+        The number of seconds to wait, or None if absent or unparseable.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def compute_backoff(settings: RetrySettings, attempt: int) -> float:
+    """Computes the (optionally jittered) exponential backoff delay.
+
+    Parameters
+    ----------
+    settings : RetrySettings
+        The retry settings.
+    attempt : int
+        The 1-indexed attempt which just failed.
+
+    Returns
+    -------
+    float
+        The delay in seconds before the next attempt.
+    """
+    delay = min(settings.backoff_max,
+                settings.backoff_base * (2 ** (attempt - 1)))
+    if settings.jitter:
+        delay = random.uniform(0, delay)
+    return delay
+
+
+def is_retryable_method(settings: RetrySettings, method: str, idempotent: Optional[bool]) -> bool:
+    """Determines whether a request may be retried based on its method and
+    the caller's idempotency override.
+
+    Parameters
+    ----------
+    settings : RetrySettings
+        The retry settings.
+    method : str
+        The HTTP method.
+    idempotent : Optional[bool]
+        Explicit override - True to opt a request in (e.g. read only POST), False to opt out. None uses the method defaults.
+
+    Returns
+    -------
+    bool
+        True if the request may be retried.
+    """
+    if idempotent is not None:
+        return idempotent
+    return method.upper() in [m.upper() for m in settings.retry_methods]
+
+
+async def send_with_retry(
+    send: SendFunction,
+    method: str,
+    settings: Optional[RetrySettings],
+    budget: Optional[RetryBudget] = None,
+    idempotent: Optional[bool] = None,
+) -> httpx.Response:
+    """Sends a request via the provided callable, retrying transient failures
+    according to the retry settings.
+
+    The send callable is re-invoked on each attempt so that it can rebuild
+    the request (e.g. fetch fresh auth). When retries are exhausted (or not
+    permitted) the final response is returned for the usual status code
+    handling, or the final network exception is raised.
+
+    Parameters
+    ----------
+    send : SendFunction
+        Zero argument coroutine function which performs a single attempt.
+    method : str
+        The HTTP method, used for the idempotency check.
+    settings : Optional[RetrySettings]
+        The retry settings - if None a single attempt is made.
+    budget : Optional[RetryBudget], optional
+        The shared retry budget to withdraw retries from, by default None (unlimited).
+    idempotent : Optional[bool], optional
+        Override for whether this request is safe to retry, by default None (method defaults).
+
+    Returns
+    -------
+    httpx.Response
+        The final response.
+    """
+    if settings is None or settings.max_attempts <= 1 or not is_retryable_method(settings, method, idempotent):
+        return await send()
+
+    if budget is not None:
+        budget.record_request()
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            response = await send()
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            if not settings.retry_on_network_errors or attempt >= settings.max_attempts:
+                raise e
+            if budget is not None and not budget.try_acquire_retry():
+                logger.warning("Retry budget exhausted, not retrying.")
+                raise e
+            delay = compute_backoff(settings, attempt)
+            logger.info(
+                f"{method} request failed with {type(e).__name__}, retrying in {delay:.2f}s (attempt {attempt}/{settings.max_attempts}).")
+            await asyncio.sleep(delay)
+            continue
+
+        if response.status_code not in settings.retry_status_codes or attempt >= settings.max_attempts:
+            return response
+
+        delay = compute_backoff(settings, attempt)
+        if settings.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > settings.max_retry_after:
+                    # the server will not be back in a reasonable time
+                    return response
+                delay = max(delay, retry_after)
+
+        if budget is not None and not budget.try_acquire_retry():
+            logger.warning("Retry budget exhausted, not retrying.")
+            return response
+
+        logger.info(
+            f"{method} request returned {response.status_code}, retrying in {delay:.2f}s (attempt {attempt}/{settings.max_attempts}).")
+        await response.aclose()
+        await asyncio.sleep(delay)
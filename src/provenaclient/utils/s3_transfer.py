@@ -0,0 +1,443 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Parallel S3 transfer engine used by the datastore IO sub module - a worker pool of files, multipart transfers of large files and per-file retry.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import math
+import mimetypes
+import os
+import posixpath
+import time
+from boto3.s3.transfer import TransferConfig  # type: ignore
+from botocore.config import Config as BotoConfig  # type: ignore
+import cloudpathlib.s3 as s3  # type: ignore
+from provenaclient.models.datastore import FileTransfer, S3ObjectInfo, SyncDirection, TransferFailure, TransferReport
+from provenaclient.utils.config import TransferSettings
+
+# Local errors which another attempt cannot fix
+NON_RETRYABLE_ERRORS = (FileNotFoundError, IsADirectoryError, PermissionError)
+# Bytes read at a time while streaming an object to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+# The most keys S3 deletes in one request
+DELETE_BATCH_SIZE = 1000
+# Modified times within this many seconds are considered equal (file systems differ in precision)
+MTIME_TOLERANCE = 2.0
+
+
+def transfer_pool_size(settings: TransferSettings) -> int:
+    """
+    The connection pool size which lets every worker transfer all of its parts at once.
+
+    Args:
+        settings (TransferSettings): The transfer settings
+
+    Returns:
+        int: The number of connections
+    """
+    return max(10, settings.workers * settings.part_concurrency)
+
+
+def setup_transfer_client(s3_client: s3.S3Client, settings: TransferSettings) -> Any:
+    """
+    Creates a boto3 S3 client sharing the credentials of a cloud path lib
+    client, with a connection pool large enough for every worker to transfer
+    all of its parts at once.
+
+    Args:
+        s3_client (s3.S3Client): The cloud path lib client holding the datastore credentials
+        settings (TransferSettings): The transfer settings
+
+    Returns:
+        Any: The boto3 S3 client
+    """
+    return s3_client.sess.client(
+        "s3",
+        endpoint_url=s3_client.client.meta.endpoint_url,
+        config=BotoConfig(max_pool_connections=transfer_pool_size(settings))
+    )
+
+
+def join_key(prefix: str, relative_path: str) -> str:
+    """
+    Joins an object key prefix (e.g. the dataset's key) and a relative path.
+
+    Args:
+        prefix (str): The key prefix, with or without a trailing slash
+        relative_path (str): The relative (posix) path
+
+    Returns:
+        str: The object key
+    """
+    prefix = prefix.strip("/")
+    return posixpath.join(prefix, relative_path) if prefix else relative_path
+
+
+def folder_key_prefix(key: str) -> str:
+    """
+    Returns the key as a folder prefix ending in a slash, so that listing
+    it cannot match sibling keys which merely start with the same characters
+    (e.g. "datasets/abcd/..." when listing "datasets/abc").
+
+    Args:
+        key (str): The key, with or without a trailing slash
+
+    Returns:
+        str: The slash terminated prefix, or "" for the bucket root
+    """
+    key = key.strip("/")
+    return key + "/" if key else ""
+
+
+def local_upload_transfers(source: str, key_prefix: str) -> List[FileTransfer]:
+    """
+    Lists the files to upload from a local file or directory - a directory's
+    contents are placed under the prefix (keeping their relative paths), a
+    single file is placed directly under it.
+
+    Args:
+        source (str): The local file or directory
+        key_prefix (str): The key the files are uploaded under
+
+    Returns:
+        List[FileTransfer]: A transfer of every file
+    """
+    if os.path.isfile(source):
+        return [FileTransfer(local_path=source, key=join_key(key_prefix, os.path.basename(source)), size=os.path.getsize(source))]
+    if not os.path.isdir(source):
+        raise FileNotFoundError(f"The source '{source}' does not exist.")
+
+    transfers: List[FileTransfer] = []
+    for directory, _, files in os.walk(source):
+        for name in files:
+            local_path = os.path.join(directory, name)
+            relative_path = os.path.relpath(local_path, source).replace(os.sep, "/")
+            transfers.append(FileTransfer(local_path=local_path, key=join_key(key_prefix, relative_path), size=os.path.getsize(local_path)))
+    return transfers
+
+
+def local_download_transfers(objects: List[S3ObjectInfo], key_prefix: str, destination: str) -> List[FileTransfer]:
+    """
+    Maps listed objects to local files, keeping their paths relative to the
+    prefix under the destination directory.
+
+    Args:
+        objects (List[S3ObjectInfo]): The objects to download
+        key_prefix (str): The prefix the objects were listed under
+        destination (str): The local directory to download into
+
+    Returns:
+        List[FileTransfer]: A transfer of every object
+    """
+    prefix = folder_key_prefix(key_prefix)
+    transfers: List[FileTransfer] = []
+    for info in objects:
+        if not info.key.startswith(prefix):
+            raise ValueError(f"Object {info.key} is not under the prefix {key_prefix}.")
+        relative_path = info.key[len(prefix):]
+        transfers.append(FileTransfer(local_path=os.path.join(destination, *relative_path.split("/")), key=info.key, size=info.size, mtime=info.last_modified))
+    return transfers
+
+
+def local_etag(local_path: str, size: int, settings: TransferSettings) -> str:
+    """
+    Computes the entity tag S3 gives the file when uploaded with the settings -
+    the MD5 of the content, or for multipart uploads the MD5 of the part MD5s
+    suffixed with the number of parts.
+
+    Args:
+        local_path (str): The local file
+        size (int): The size of the file
+        settings (TransferSettings): The multipart threshold and part size of the upload
+
+    Returns:
+        str: The entity tag (without quotes)
+    """
+    part_size = size if size < settings.multipart_threshold else settings.part_size
+    digests: List[bytes] = []
+    with open(local_path, "rb") as file:
+        while True:
+            digest = hashlib.md5()
+            read = 0
+            while read < part_size:
+                chunk = file.read(min(STREAM_CHUNK_SIZE, part_size - read))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                read += len(chunk)
+            if read == 0 and digests:
+                break
+            digests.append(digest.digest())
+            if read < part_size:
+                break
+
+    if size < settings.multipart_threshold:
+        return digests[0].hex()
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def in_sync(local_path: str, info: S3ObjectInfo, direction: SyncDirection, checksum: bool, settings: TransferSettings) -> bool:
+    """
+    Decides whether a local file and an object hold the same content.
+
+    Sizes are compared first. With checksum, the content is compared with the
+    object's entity tag whenever the entity tag is comparable (an MD5, or a
+    multipart tag with the part count the settings produce). Otherwise the
+    copy being synced from must not be newer than the copy being synced to.
+
+    Args:
+        local_path (str): The local file
+        info (S3ObjectInfo): The object
+        direction (SyncDirection): UP if the local file is the source, DOWN if the object is
+        checksum (bool): Compare content rather than modified times where possible
+        settings (TransferSettings): The multipart settings uploads were made with
+
+    Returns:
+        bool: True if the file does not need to be transferred
+    """
+    stat = os.stat(local_path)
+    if stat.st_size != info.size:
+        return False
+
+    if checksum:
+        parts = info.etag.split("-")
+        expected_parts = math.ceil(info.size / settings.part_size) if info.size >= settings.multipart_threshold else None
+        comparable = len(parts) == 1 if expected_parts is None else len(parts) == 2 and parts[1] == str(expected_parts)
+        if comparable:
+            return local_etag(local_path, stat.st_size, settings) == info.etag
+
+    if direction == SyncDirection.UP:
+        return stat.st_mtime <= info.last_modified + MTIME_TOLERANCE
+    return info.last_modified <= stat.st_mtime + MTIME_TOLERANCE
+
+
+def plan_sync(local_files: List[FileTransfer], objects: List[S3ObjectInfo], key_prefix: str, local_root: str, direction: SyncDirection, checksum: bool, settings: TransferSettings) -> Tuple[List[FileTransfer], List[FileTransfer], int]:
+    """
+    Pairs local files with objects by key, and plans the transfers which bring
+    the destination in line with the source.
+
+    Args:
+        local_files (List[FileTransfer]): The local files, keyed by the object key they map to (see local_upload_transfers)
+        objects (List[S3ObjectInfo]): The objects listed under the prefix (any others are ignored)
+        key_prefix (str): The prefix the local root maps to
+        local_root (str): The local directory being synced
+        direction (SyncDirection): UP to sync local files to objects, DOWN for objects to local files
+        checksum (bool): Compare content rather than modified times where possible
+        settings (TransferSettings): The multipart settings uploads were made with
+
+    Returns:
+        Tuple[List[FileTransfer], List[FileTransfer], int]: The transfers, the destination files without
+            a source (extraneous) and the number of unchanged files
+    """
+    # never plan (and so never delete) objects of a sibling prefix, e.g. datasets/abcd when syncing datasets/abc
+    prefix = folder_key_prefix(key_prefix)
+    objects = [info for info in objects if info.key.startswith(prefix)]
+    local_by_key = {transfer.key: transfer for transfer in local_files}
+    objects_by_key = {info.key: info for info in objects}
+
+    transfers: List[FileTransfer] = []
+    unchanged = 0
+    if direction == SyncDirection.UP:
+        for transfer in local_files:
+            info = objects_by_key.get(transfer.key)
+            if info is not None and in_sync(transfer.local_path, info, direction, checksum, settings):
+                unchanged += 1
+            else:
+                transfers.append(transfer)
+        extraneous = [FileTransfer(local_path="", key=info.key, size=info.size) for info in objects if info.key not in local_by_key]
+    else:
+        for download in local_download_transfers(objects=objects, key_prefix=key_prefix, destination=local_root):
+            if download.key in local_by_key and in_sync(download.local_path, objects_by_key[download.key], direction, checksum, settings):
+                unchanged += 1
+            else:
+                transfers.append(download)
+        extraneous = [transfer for transfer in local_files if transfer.key not in objects_by_key]
+    return transfers, extraneous, unchanged
+
+
+class S3TransferEngine:
+    """
+    Transfers many files to/from a bucket with a pool of worker threads, so
+    aggregate throughput is bounded by bandwidth rather than per-file latency.
+
+    Files of at least multipart_threshold bytes are transferred in part_size
+    parts (multipart uploads, ranged GETs), part_concurrency at a time. Objects
+    are streamed to disk, so memory use is bounded by the workers and parts in
+    flight rather than the size of the objects. Each file is attempted up to
+    max_attempts times with exponential backoff - a failed file never stops
+    the others, and is reported once every file has been attempted.
+    """
+
+    def __init__(self, client: Any, bucket: str, settings: TransferSettings) -> None:
+        """
+        Creates an engine transferring with the given client.
+
+        Args:
+            client (Any): The boto3 S3 client (see setup_transfer_client)
+            bucket (str): The bucket of the objects
+            settings (TransferSettings): The worker pool, multipart and retry settings
+        """
+        self.client = client
+        self.bucket = bucket
+        self.settings = settings
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.multipart_threshold,
+            multipart_chunksize=settings.part_size,
+            max_concurrency=settings.part_concurrency,
+            use_threads=True
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        return float(min(self.settings.backoff_max, self.settings.backoff_base * (2 ** (attempt - 1))))
+
+    def _attempt(self, transfer: FileTransfer, action: Callable[[FileTransfer], None]) -> Optional[TransferFailure]:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                action(transfer)
+                return None
+            except Exception as e:
+                if isinstance(e, NON_RETRYABLE_ERRORS) or attempt >= self.settings.max_attempts:
+                    return TransferFailure(transfer=transfer, error_info=f"{type(e).__name__}: {e}", attempts=attempt)
+                time.sleep(self._backoff(attempt))
+
+    def _run(self, transfers: List[FileTransfer], action: Callable[[FileTransfer], None]) -> TransferReport:
+        report = TransferReport()
+        if not transfers:
+            return report
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.settings.workers, len(transfers)))) as pool:
+            outcomes = list(pool.map(lambda transfer: self._attempt(transfer, action), transfers))
+
+        for transfer, failure in zip(transfers, outcomes):
+            if failure is None:
+                report.transferred.append(transfer)
+                report.bytes_transferred += transfer.size
+            else:
+                report.failed.append(failure)
+        return report
+
+    def _upload(self, transfer: FileTransfer) -> None:
+        extra_args: Dict[str, Any] = {}
+        content_type, _ = mimetypes.guess_type(transfer.local_path)
+        if content_type is not None:
+            extra_args["ContentType"] = content_type
+
+        if transfer.size < self.settings.multipart_threshold:
+            # small files in a single request, without a transfer manager per file
+            with open(transfer.local_path, "rb") as body:
+                self.client.put_object(Bucket=self.bucket, Key=transfer.key, Body=body, **extra_args)
+        else:
+            self.client.upload_file(
+                Filename=transfer.local_path,
+                Bucket=self.bucket,
+                Key=transfer.key,
+                ExtraArgs=extra_args or None,
+                Config=self.transfer_config
+            )
+
+    def upload(self, transfers: List[FileTransfer]) -> TransferReport:
+        """
+        Uploads the files concurrently.
+
+        Args:
+            transfers (List[FileTransfer]): The files and their object keys
+
+        Returns:
+            TransferReport: The uploaded and failed files
+        """
+        return self._run(transfers, self._upload)
+
+    def list_objects(self, prefix: str) -> List[S3ObjectInfo]:
+        """
+        Lists every object under the prefix (folder markers excluded), with
+        one paginated listing.
+
+        Args:
+            prefix (str): The key prefix
+
+        Returns:
+            List[S3ObjectInfo]: The objects, in key order
+        """
+        objects: List[S3ObjectInfo] = []
+        for page in self.client.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=prefix):
+            for entry in page.get("Contents", []):
+                if entry["Key"].endswith("/"):
+                    continue
+                objects.append(S3ObjectInfo(
+                    key=entry["Key"],
+                    size=entry["Size"],
+                    etag=entry["ETag"].strip('"'),
+                    last_modified=entry["LastModified"].timestamp()
+                ))
+        return objects
+
+    def _download(self, transfer: FileTransfer) -> None:
+        os.makedirs(os.path.dirname(transfer.local_path) or ".", exist_ok=True)
+        if transfer.size < self.settings.multipart_threshold:
+            # small objects in a single streamed GET, replacing the file once complete
+            temp_path = f"{transfer.local_path}.{os.getpid()}.partial"
+            try:
+                body = self.client.get_object(Bucket=self.bucket, Key=transfer.key)["Body"]
+                with open(temp_path, "wb") as file:
+                    for chunk in body.iter_chunks(STREAM_CHUNK_SIZE):
+                        file.write(chunk)
+                os.replace(temp_path, transfer.local_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        else:
+            # ranged GETs of part_size, written in place by the transfer manager
+            self.client.download_file(
+                Bucket=self.bucket,
+                Key=transfer.key,
+                Filename=transfer.local_path,
+                Config=self.transfer_config
+            )
+        if transfer.mtime is not None:
+            # keep the object's modified time, so later syncs can compare them
+            os.utime(transfer.local_path, (transfer.mtime, transfer.mtime))
+
+    def download(self, transfers: List[FileTransfer]) -> TransferReport:
+        """
+        Downloads the objects concurrently, creating local directories as needed.
+
+        Args:
+            transfers (List[FileTransfer]): The object keys and their local files
+
+        Returns:
+            TransferReport: The downloaded and failed files
+        """
+        return self._run(transfers, self._download)
+
+    def delete_objects(self, keys: List[str]) -> List[str]:
+        """
+        Deletes the objects, in batches of DELETE_BATCH_SIZE.
+
+        Args:
+            keys (List[str]): The object keys
+
+        Returns:
+            List[str]: The keys which could not be deleted
+        """
+        failed: List[str] = []
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start:start + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+            failed.extend(error["Key"] for error in response.get("Errors", []))
+        return failed
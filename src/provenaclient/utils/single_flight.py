@@ -0,0 +1,83 @@
+'''
+Created Date: Friday October 16th 2026 +1000
+Author: Peter Baker
+-----
+Last Modified: Friday October 16th 2026 +1000
+Modified By: Peter Baker
+-----
+Description: Single-flight coalescing of identical concurrent requests into one call.
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+'''
+
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+from provenaclient.utils.helpers import BaseModelType
+
+
+class _Call:
+    """An in-flight call and the callers waiting on it."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, task: "asyncio.Task[Any]") -> None:
+        self.loop = loop
+        self.task = task
+        self.followers = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key so that only the first
+    (the leader) performs the work, and every caller arriving while it is in
+    flight awaits the same result (or exception).
+
+    The work runs as its own task, so cancelling any one caller (including
+    the leader) does not cancel it for the others. When a result is shared,
+    each caller receives its own deep copy of the parsed model so no two
+    callers share mutable state.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty single-flight group."""
+        self._calls: Dict[Hashable, _Call] = {}
+        # number of calls which were served by another caller's request
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[BaseModelType]]) -> BaseModelType:
+        """Runs fn, or joins an identical call already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies identical calls.
+        fn : Callable[[], Awaitable[BaseModelType]]
+            Performs the call.
+
+        Returns
+        -------
+        BaseModelType
+            The parsed result.
+        """
+        loop = asyncio.get_running_loop()
+        call = self._calls.get(key)
+        if call is None or call.loop is not loop or call.task.done():
+            async def run() -> BaseModelType:
+                return await fn()
+
+            call = _Call(loop=loop, task=loop.create_task(run()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda finished: self._forget(key, finished))
+        else:
+            call.followers += 1
+            self.coalesced += 1
+
+        result: BaseModelType = await asyncio.shield(call.task)
+        return result.model_copy(deep=True) if call.followers else result
+
+    def _forget(self, key: Hashable, finished: "asyncio.Task[Any]") -> None:
+        call = self._calls.get(key)
+        if call is not None and call.task is finished:
+            del self._calls[key]
+        # avoid "exception never retrieved" warnings if every caller was cancelled
+        if not finished.cancelled():
+            finished.exception()
@@ -18,16 +18,55 @@ Date      	By	Comments
 
 from provenaclient.clients.client_helpers import parsed_delete_request, parsed_delete_request_with_status, parsed_get_request, parsed_get_request_with_status, parsed_post_request, parsed_post_request_with_status, parsed_put_request, parsed_put_request_with_status
 from provenaclient.utils.helpers import py_to_dict
-from provenaclient.utils.http_client import HttpClient, HttpxBearerAuth
-from provenaclient.utils.exceptions import AuthException, BadRequestException, CustomTimeoutException, HTTPValidationException, ServerException, ValidationException
+from provenaclient.utils.http_client import HttpClient, HttpTransport, HttpxBearerAuth
+from provenaclient.utils.exceptions import AuthException, BadRequestException, CustomTimeoutException, HTTPValidationException, NotFoundException, ServerException, ValidationException
+from provenaclient.models.registry import FetchErrorType, RegistryCountProgress
+from provenaclient.modules.module_helpers import collect_fetch_many, stream_fetch_many
+from provenaclient.modules.datastore import Datastore
+from provenaclient.modules.search import Search
+from provenaclient.modules.registry import Registry, RegistryAdminClient
+from provenaclient.utils.json_stream import JsonArrayFieldParser
+from provenaclient.utils.pagination import paginate
+from ProvenaInterfaces.RegistryAPI import NoFilterSubtypeListRequest
+from provenaclient.auth.implementations import OfflineFlow
+from provenaclient.modules.provena_client import ProvenaClient
+from provenaclient.auth.helpers import AccessToken
+from provenaclient.auth.key_cache import PublicKeyCache
+from provenaclient.auth.token_store import FileTokenStore
+from jose import jwt  # type: ignore
+import hashlib
+import logging
+import os
+import rsa  # type: ignore
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from provenaclient.clients import RegistryClient, SearchClient
+from ProvenaInterfaces.RegistryAPI import OrganisationFetchResponse, PersonFetchResponse, UntypedFetchResponse
+from ProvenaInterfaces.RegistryModels import ItemSubType
+from provenaclient.models import FailedSearchItem, LoadedSearchItem, UnauthorisedSearchItem
+from ProvenaInterfaces.SearchAPI import QueryResult, QueryResults
+from ProvenaInterfaces.RegistryModels import ItemDataset
+from types import SimpleNamespace
 from ProvenaInterfaces.SharedTypes import StatusResponse, Status
 from unit_helpers import MockedClientService, MockedAuthService, MockRequestModel, MockResponseModel, is_exception_in_chain
-from provenaclient.utils.config import Config
+from provenaclient.utils.config import APIOverrides, CacheSettings, Config, ConcurrencySettings, KeyCacheSettings, RetrySettings, TransferSettings, TransportSettings
+from provenaclient.modules.submodules.datastore_io_submodule import AccessEnum, IOSubModule, S3Access
+from cloudpathlib import S3Path
+from cloudpathlib.s3 import S3Client
+from provenaclient.utils.s3_transfer import S3TransferEngine, folder_key_prefix, local_download_transfers, local_upload_transfers
+from provenaclient.utils.cache import ResponseCache, principal_identity
+from provenaclient.clients.client_helpers import cached_fetch, invalidate_cached_item
+from provenaclient.utils.concurrency import AdaptiveConcurrencyLimiter, service_key
+from provenaclient.utils.retry import RetryBudget, parse_retry_after
 
 import pytest
 import httpx
 from pytest_httpx import HTTPXMock
+import asyncio
 import json
+from typing import Any, Dict, List, Tuple
+import sys
 from pydantic import ValidationError
 
 @pytest.fixture
@@ -182,6 +221,54 @@ async def test_http_client_put_request_mock_errors(httpx_mock: HTTPXMock, valid_
     assert str(request.url) == url
     assert json.loads(request.read()) == incomplete_data, "The request payload does not match the incomplete data sent."
 
+@pytest.mark.asyncio
+async def test_http_transport_pooled_client(httpx_mock: HTTPXMock, valid_token: HttpxBearerAuth) -> None:
+    """Tests that requests made through a HttpTransport share one pooled client until it is closed."""
+    url = "https://api.example.com/data"
+    transport = HttpTransport(settings=TransportSettings(max_connections=5, max_keepalive_connections=2))
+
+    httpx_mock.add_response(method="GET", url=url, json={"success": True}, status_code=200)
+    httpx_mock.add_response(method="PUT", url=url, json={"success": True}, status_code=200)
+
+    response = await HttpClient.make_get_request(url, auth=valid_token, transport=transport)
+    assert response.status_code == 200
+    pooled_client = transport.get_client()
+
+    response = await HttpClient.make_put_request(url, data={"key": "value"}, auth=valid_token, transport=transport)
+    assert response.status_code == 200
+    assert transport.get_client() is pooled_client, "Expected the same pooled client to be re-used."
+    assert not pooled_client.is_closed
+
+    await transport.aclose()
+    assert pooled_client.is_closed, "Expected pooled client to be closed by aclose."
+    assert transport.get_client() is not pooled_client, "Expected a fresh client after closing the transport."
+    await transport.aclose()
+
+@pytest.mark.asyncio
+async def test_http_transport_http2_requires_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that enabling HTTP/2 without the optional h2 package raises a helpful ImportError."""
+    monkeypatch.setitem(sys.modules, "h2", None)
+    transport = HttpTransport(settings=TransportSettings(http2=True))
+
+    with pytest.raises(ImportError) as exec_info:
+        transport.get_client()
+    assert "provenaclient[http2]" in str(exec_info.value)
+
+
+@pytest.mark.asyncio
+async def test_http_transport_http2_request(httpx_mock: HTTPXMock, valid_token: HttpxBearerAuth) -> None:
+    """Tests that a request is sent through the HTTP/2 enabled pooled client when the optional h2 package is installed."""
+    pytest.importorskip("h2")
+    url = "https://api.example.com/data"
+    transport = HttpTransport(settings=TransportSettings(http2=True))
+    httpx_mock.add_response(method="GET", url=url, json={"success": True}, status_code=200)
+
+    response = await HttpClient.make_get_request(url, auth=valid_token, transport=transport)
+
+    assert response.status_code == 200 and response.json() == {"success": True}
+    assert transport.get_client()._transport._pool._http2, "Expected the pooled client to negotiate HTTP/2."  # type: ignore
+    await transport.aclose()
+
 
 """L1 Layer Testing With Real API/HTTP Server (JSONPlaceHolder)
 
@@ -507,6 +594,1253 @@ async def test_internal_server_error_exception(httpx_mock: HTTPXMock, client_ser
 
 
 
+"""Retry Testing"""
+
+@pytest.fixture
+def retry_sleeps(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Records (rather than waits on) the backoff delays used between retries."""
+    sleeps: list = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("provenaclient.utils.retry.asyncio.sleep", fake_sleep)
+    return sleeps
+
+@pytest.mark.asyncio
+async def test_retry_transient_errors(httpx_mock: HTTPXMock, client_service: MockedClientService, retry_sleeps: list) -> None:
+    """Tests that GET/PUT requests are retried on transient status codes and timeouts, but POST is only retried when marked idempotent.
+
+    Parameters
+    ----------
+    httpx_mock : HTTPXMock
+        The mock for HTTPX requests to simulate server responses.
+    client_service : MockedClientService
+        The mocked client service used to make HTTP requests.
+    """
+
+    url = "http://example.com/api"
+    response_model = MockResponseModel(bar = "example_return_value")
+    transport = HttpTransport(retry_settings=RetrySettings(jitter=False))
+    client_service._transport = transport
+
+    # GET 503 then success
+    httpx_mock.add_response(method="GET", url=url, status_code=503)
+    httpx_mock.add_response(method="GET", url=url, json=response_model.dict(), status_code=200)
+    result = await parsed_get_request(client=client_service, url=url, params=None, model=MockResponseModel, error_message="Error occurred")
+    assert result == response_model
+    assert len(httpx_mock.get_requests(method="GET")) == 2
+
+    # PUT timeout then success
+    httpx_mock.add_exception(httpx.ReadTimeout("Timed out"), method="PUT", url=url)
+    httpx_mock.add_response(method="PUT", url=url, json=response_model.dict(), status_code=200)
+    result = await parsed_put_request(client=client_service, url=url, params=None, json_body=None, model=MockResponseModel, error_message="Error occurred")
+    assert result == response_model
+
+    # POST is not retried by default
+    httpx_mock.add_response(method="POST", url=url, status_code=503)
+    with pytest.raises(ServerException):
+        await parsed_post_request(client=client_service, url=url, params=None, json_body=None, model=MockResponseModel, error_message="Error occurred")
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+
+    # ... unless marked idempotent
+    httpx_mock.add_response(method="POST", url=url, status_code=503)
+    httpx_mock.add_response(method="POST", url=url, json=response_model.dict(), status_code=200)
+    result = await parsed_post_request(client=client_service, url=url, params=None, json_body=None, model=MockResponseModel, error_message="Error occurred", idempotent=True)
+    assert result == response_model
+    assert len(httpx_mock.get_requests(method="POST")) == 3
+
+    # exponential backoff without jitter
+    assert retry_sleeps == [0.5, 0.5, 0.5]
+
+    await transport.aclose()
+
+@pytest.mark.asyncio
+async def test_retry_after_and_budget(httpx_mock: HTTPXMock, client_service: MockedClientService, retry_sleeps: list) -> None:
+    """Tests that Retry-After is honoured, that per call overrides apply and that an exhausted retry budget stops retrying.
+
+    Parameters
+    ----------
+    httpx_mock : HTTPXMock
+        The mock for HTTPX requests to simulate server responses.
+    client_service : MockedClientService
+        The mocked client service used to make HTTP requests.
+    """
+
+    url = "http://example.com/api"
+    response_model = MockResponseModel(bar = "example_return_value")
+    settings = RetrySettings(jitter=False, budget_min_retries=1, budget_ratio=0)
+    transport = HttpTransport(retry_settings=settings)
+    client_service._transport = transport
+
+    # Retry-After takes precedence over the (shorter) backoff
+    httpx_mock.add_response(method="GET", url=url, status_code=429, headers={"Retry-After": "7"})
+    httpx_mock.add_response(method="GET", url=url, json=response_model.dict(), status_code=200)
+    result = await parsed_get_request(client=client_service, url=url, params=None, model=MockResponseModel, error_message="Error occurred")
+    assert result == response_model
+    assert retry_sleeps == [7.0]
+
+    # the single retry in the budget has been used - failures now surface immediately
+    httpx_mock.add_response(method="GET", url=url, status_code=503)
+    with pytest.raises(ServerException):
+        await parsed_get_request(client=client_service, url=url, params=None, model=MockResponseModel, error_message="Error occurred")
+    assert len(httpx_mock.get_requests(method="GET")) == 3
+
+    # per call override disabling retries
+    with pytest.raises(ServerException):
+        await parsed_get_request(client=client_service, url=url, params=None, model=MockResponseModel, error_message="Error occurred", retry_settings=RetrySettings(max_attempts=1))
+    assert len(httpx_mock.get_requests(method="GET")) == 4
+
+    budget = RetryBudget(RetrySettings(budget_min_retries=0, budget_ratio=0.5))
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_acquire_retry() and not budget.try_acquire_retry()
+
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("not a date") is None
+
+    await transport.aclose()
+
+
+"""Concurrency Limiter Testing"""
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter() -> None:
+    """Tests that the limiter bounds in-flight requests and adjusts its limit with AIMD."""
+
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencySettings(initial_limit=2, min_limit=1, max_limit=3))
+    release = asyncio.Event()
+    peak = 0
+
+    async def send() -> httpx.Response:
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await release.wait()
+        return httpx.Response(status_code=200)
+
+    tasks = [asyncio.create_task(limiter.run(send)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2, "Expected in-flight requests to be bounded by the limit."
+
+    # additive increase on success, capped at max_limit
+    assert limiter.limit == 3
+
+    # multiplicative decrease on throttling - only once per burst
+    async def throttled() -> httpx.Response:
+        return httpx.Response(status_code=429)
+
+    started = [await limiter.acquire() for _ in range(2)]
+    limiter.release(started[0], throttled=True)
+    limiter.release(started[1], throttled=True)
+    assert limiter.limit == 1
+    response = await limiter.run(throttled)
+    assert response.status_code == 429 and limiter.limit == 1 and limiter.in_flight == 0
+
+def test_service_key() -> None:
+    """Tests requests are keyed to the Config service endpoint they target."""
+
+    config = Config(domain="example.com", realm_name="test", api_overrides=APIOverrides(
+        prov_api_endpoint_override="https://example.com/prov"))
+
+    assert service_key(config, config.registry_api_endpoint + "/registry/item") == config.registry_api_endpoint
+    assert service_key(config, "https://example.com/prov/model_run") == "https://example.com/prov"
+    assert service_key(config, "http://other.org:8080/api") == "http://other.org:8080"
+
+
+@pytest.mark.asyncio
+async def test_coalesced_get_requests(httpx_mock: HTTPXMock, client_service: MockedClientService) -> None:
+    """Tests that identical concurrent GET requests are coalesced into one network call.
+
+    Parameters
+    ----------
+    httpx_mock : HTTPXMock
+        The mock for HTTPX requests to simulate server responses.
+    client_service : MockedClientService
+        The mocked client service used to make HTTP requests.
+    """
+
+    url = "http://example.com/api"
+    response_model = MockResponseModel(bar = "example_return_value")
+    transport = HttpTransport()
+    client_service._transport = transport
+
+    httpx_mock.add_response(method="GET", json=response_model.dict(), status_code=200)
+
+    def get(id: str) -> Any:
+        return parsed_get_request(client=client_service, url=url, params={"id": id}, model=MockResponseModel, error_message="Error occurred")
+
+    results = await asyncio.gather(*[get("1") for _ in range(5)], get("2"))
+    assert all(result == response_model for result in results)
+    assert len({id(result) for result in results}) == 6, "Each caller should receive its own copy of the result."
+    assert len(httpx_mock.get_requests()) == 2
+    assert transport.single_flight.coalesced == 4
+
+    # once complete, later requests are sent again
+    await get("1")
+    assert len(httpx_mock.get_requests()) == 3
+
+    await transport.aclose()
+
+"""Response Cache Testing"""
+
+@pytest.mark.asyncio
+async def test_cached_fetch(httpx_mock: HTTPXMock, client_service: MockedClientService) -> None:
+    """Tests that fetches are served from the cache per id/user until the item is invalidated.
+
+    Parameters
+    ----------
+    httpx_mock : HTTPXMock
+        The mock for HTTPX requests to simulate server responses.
+    client_service : MockedClientService
+        The mocked client service used to make HTTP requests.
+    """
+
+    url = "http://example.com/api"
+    response_model = MockResponseModel(bar = "example_return_value")
+    client_service._cache = ResponseCache(CacheSettings(enabled=True))
+
+    async def fetch(id: str) -> MockResponseModel:
+        return await cached_fetch(
+            client=client_service, endpoint=url, id=id, seed_allowed=None, model=MockResponseModel,
+            fetch=lambda: parsed_get_request(client=client_service, url=url, params={"id": id}, model=MockResponseModel, error_message="Error occurred")
+        )
+
+    httpx_mock.add_response(method="GET", json=response_model.dict(), status_code=200)
+
+    first = await fetch("1")
+    first.bar = "mutated by caller"
+    assert await fetch("1") == response_model, "Cached responses should not be affected by callers."
+    await fetch("2")
+    assert len(httpx_mock.get_requests()) == 2
+
+    # a different user must not see another user's cached response
+    client_service._auth.token = "another_user_token"  # type: ignore
+    await fetch("1")
+    assert len(httpx_mock.get_requests()) == 3
+
+    # mutations drop cached responses of the item for all users
+    invalidate_cached_item(client_service, "1")
+    await fetch("1")
+    assert len(httpx_mock.get_requests()) == 4
+
+    stats = client_service._cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations, stats.size) == (1, 4, 2, 2)
+
+    # an invalidation during a fetch stops it being cached, and no per id state outlives the fetches
+    cache = client_service._cache
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_fetch() -> MockResponseModel:
+        started.set()
+        await release.wait()
+        return response_model
+
+    pending = asyncio.create_task(cache.get_or_fetch(client_service._auth, "slow", "3", None, MockResponseModel, slow_fetch))
+    await started.wait()
+    cache.invalidate("3")
+    release.set()
+    await pending
+    assert cache.get(("slow", "3", None, await principal_identity(client_service._auth), "MockResponseModel")) is None
+    for id in ["1", "2", "3", "4"]:
+        cache.invalidate(id)
+    assert cache._versions == {} and cache._in_flight == {}
+
+def test_response_cache_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests LRU eviction and TTL expiry of the response cache."""
+
+    cache = ResponseCache(CacheSettings(enabled=True, max_entries=2, ttl=10))
+    now = 1000.0
+    monkeypatch.setattr("provenaclient.utils.cache.time.monotonic", lambda: now)
+
+    keys = [("url", str(i), None, "user", "Model") for i in range(3)]
+    cache.set(keys[0], "a")
+    cache.set(keys[1], "b")
+    assert cache.get(keys[0]) == "a"
+    cache.set(keys[2], "c")
+    assert cache.get(keys[1]) is None, "Expected the least recently used entry to be evicted."
+    assert cache.get(keys[0]) == "a"
+
+    now += 11
+    assert cache.get(keys[0]) is None, "Expected the entry to have expired."
+    assert cache.stats().evictions == 1
+
+
+"""Fetch Many Testing"""
+
+@pytest.mark.asyncio
+async def test_fetch_many() -> None:
+    """Tests bounded concurrent fetching of many ids, including per id error categorisation."""
+
+    in_flight = 0
+    max_in_flight = 0
+    calls = []
+
+    async def fetch(id: str) -> MockResponseModel:
+        nonlocal in_flight, max_in_flight
+        calls.append(id)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # later ids finish first so completion order differs from the request order
+        await asyncio.sleep(0.001 * (10 - int(id)))
+        in_flight -= 1
+        if id == "3":
+            raise NotFoundException(message="Not found", error_code=404)
+        if id == "4":
+            raise AuthException(message="Unauthorised", error_code=401)
+        if id == "5":
+            raise ServerException(message="Forbidden", error_code=403)
+        if id == "6":
+            raise ValueError("Something else")
+        return MockResponseModel(bar=id)
+
+    ids = ["1", "2", "3", "4", "5", "6", "7", "8", "2"]
+    response = await collect_fetch_many(ids=ids, fetch=fetch, concurrency=3)
+
+    assert max_in_flight == 3
+    assert sorted(calls) == sorted(set(ids)), "Expected duplicate ids to be fetched once."
+    assert list(response.items) == ["1", "2", "7", "8"], "Expected results in the requested order."
+    assert response.items["7"] == MockResponseModel(bar="7")
+    assert {id: error.error_type for id, error in response.errors.items()} == {
+        "3": FetchErrorType.NOT_FOUND,
+        "4": FetchErrorType.UNAUTHORISED,
+        "5": FetchErrorType.UNAUTHORISED,
+        "6": FetchErrorType.OTHER,
+    }
+
+    # streaming yields in completion order and stops fetching when the consumer stops
+    calls.clear()
+    stream = stream_fetch_many(ids=ids, fetch=fetch, concurrency=1)
+    streamed = []
+    async for item in stream:
+        streamed.append(item.id)
+        if len(streamed) == 2:
+            break
+    await stream.aclose()  # type: ignore
+    assert streamed == ["1", "2"] and len(calls) <= 3
+
+    with pytest.raises(ValueError):
+        await collect_fetch_many(ids=ids, fetch=fetch, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_status_failure_is_not_found(httpx_mock: HTTPXMock) -> None:
+    """Tests that a 200 OK fetch with a failed status (how the registry reports a missing item) is categorised as not found."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    auth = MockedAuthService()
+    registry = Registry(auth=auth, config=config, registry_client=RegistryClient(auth, config))
+    httpx_mock.add_response(method="GET", json={"status": {"success": False, "details": "Item does not exist."}}, status_code=200)
+
+    response = await registry.organisation.fetch_many(ids=["missing"])
+
+    assert response.items == {}
+    assert response.errors["missing"].error_type == FetchErrorType.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_search_datasets_concurrent_hydration() -> None:
+    """Tests that search results are loaded concurrently while retaining score order and error partitioning."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    class SearchClient:
+        async def search_registry(self, query: str, limit: int, subtype_filter: Any) -> QueryResults:
+            return QueryResults(status=Status(success=True, details="OK"), results=[
+                QueryResult(id=str(i), score=1.0 - i / 10) for i in range(8)
+            ])
+
+    class DatastoreClient:
+        async def fetch_dataset(self, id: str) -> Any:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # higher ranked results take longest to load
+            await asyncio.sleep(0.001 * (10 - int(id)))
+            in_flight -= 1
+            if id in ["2", "5"]:
+                raise AuthException(message="Unauthorised", error_code=401)
+            if id == "6":
+                raise ServerException(message="Server error", error_code=500)
+            # a minimal dataset which satisfies the ItemDataset validators
+            access_info = SimpleNamespace(uri=None)
+            collection_format = SimpleNamespace(dataset_info=SimpleNamespace(access_info=access_info))
+            return SimpleNamespace(item=ItemDataset.model_construct(id=id, access_info_uri=None, collection_format=collection_format))
+
+    datastore = Datastore(auth=MockedAuthService(), config=Config(domain="dev.rrap-is.com", realm_name="rrap"),
+                          datastore_client=DatastoreClient(), search_client=SearchClient())  # type: ignore
+
+    response = await datastore.search_datasets(query="test", concurrency=4)
+    assert max_in_flight == 4
+    assert [item.id for item in response.items] == ["0", "1", "3", "4", "7"], "Expected score ordering to be retained."
+    assert [item.id for item in response.auth_errors] == ["2", "5"]
+    assert [item.id for item in response.misc_errors] == ["6"]
+
+    streamed = [item async for item in datastore.search_datasets_stream(query="test", concurrency=8)]
+    assert [item.id for item in streamed][0] == "7", "Expected streamed items in completion order."
+    assert sum(isinstance(item, LoadedSearchItem) for item in streamed) == 5
+    assert sum(isinstance(item, (UnauthorisedSearchItem, FailedSearchItem)) for item in streamed) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_and_load(httpx_mock: HTTPXMock) -> None:
+    """Tests that mixed subtype search results are loaded into their typed fetch responses, in score order."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    auth = MockedAuthService()
+    cache = ResponseCache(CacheSettings(enabled=True))
+    search = Search(auth=auth, config=config, search_client=SearchClient(auth, config),
+                    registry_client=RegistryClient(auth, config, cache=cache))
+
+    subtypes = {"1": ItemSubType.ORGANISATION, "2": ItemSubType.PERSON, "4": ItemSubType.SOFTWARE}
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search/entity-registry"):
+            return httpx.Response(200, json={"status": {"success": True, "details": "OK"}, "results": [
+                {"id": id, "score": 1.0 - int(id) / 10} for id in ["1", "2", "3", "4"]
+            ]})
+        id = request.url.params["id"]
+        if id == "3":
+            return httpx.Response(401, json={"detail": "Unauthorised"})
+        item = {"id": id, "owner_username": "user", "created_timestamp": 0, "updated_timestamp": 0,
+                "item_category": "AGENT", "item_subtype": subtypes[id].value, "record_type": "SEED_ITEM"}
+        return httpx.Response(200, json={"status": {"success": True, "details": "OK"}, "item": item})
+
+    httpx_mock.add_callback(respond)
+
+    response = await search.search_and_load(query="test")
+    assert [item.id for item in response.items] == ["1", "2", "4"]
+    assert isinstance(response.items[0].fetch_response, OrganisationFetchResponse)
+    assert isinstance(response.items[1].fetch_response, PersonFetchResponse)
+    assert isinstance(response.items[2].fetch_response, UntypedFetchResponse), "Expected untyped response for subtypes without a typed model."
+    assert [item.id for item in response.auth_errors] == ["3"] and response.misc_errors == []
+
+    # loads go through the fetch cache
+    await search.search_and_load(query="test")
+    assert cache.stats().hits == 3
+
+    # constructing without a registry client still supports searching, but not loading
+    search = Search(auth=auth, config=config, search_client=SearchClient(auth, config))
+    with pytest.raises(ValueError):
+        await search.search_and_load(query="test")
+
+
+"""Streaming Export Testing"""
+
+def test_json_array_field_parser() -> None:
+    """Tests that array elements are parsed incrementally regardless of how the text is chunked."""
+
+    document = {"status": {"success": True, "details": "OK"}, "count": 12345,
+                "items": [{"id": str(i), "text": "a \\\"quoted\\\" [value], {here}"} for i in range(5)], "after": None}
+    text = json.dumps(document, indent=2)
+
+    for chunk_size in [1, 7, len(text)]:
+        parser = JsonArrayFieldParser(array_key="items")
+        events = []
+        for start in range(0, len(text), chunk_size):
+            events.extend(parser.feed(text[start:start + chunk_size]))
+        parser.close()
+        assert [value for key, value, is_element in events if is_element] == document["items"]
+        assert [(key, value) for key, value, is_element in events if not is_element] == [
+            ("status", document["status"]), ("count", 12345), ("after", None)]
+
+    # truncated documents are rejected
+    parser = JsonArrayFieldParser(array_key="items")
+    parser.feed(text[:-10])
+    with pytest.raises(ValidationException):
+        parser.close()
+
+@pytest.mark.asyncio
+async def test_export_items_stream(httpx_mock: HTTPXMock, tmp_path: Any) -> None:
+    """Tests streaming the registry export into items and an NDJSON file, including failed statuses."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    admin = RegistryAdminClient(auth=MockedAuthService(), config=config, registry_client=RegistryClient(MockedAuthService(), config))
+    items = [{"id": str(i), "item_payload": {"id": str(i)}, "auth_payload": {}, "lock_payload": {}} for i in range(3)]
+
+    httpx_mock.add_response(method="GET", json={"status": {"success": True, "details": "OK"}, "items": items})
+    exported = [item async for item in admin.export_items_stream()]
+    assert [item.id for item in exported] == ["0", "1", "2"]
+
+    httpx_mock.add_response(method="GET", json={"status": {"success": True, "details": "OK"}, "items": items})
+    file_path = str(tmp_path / "export.ndjson")
+    assert await admin.export_items_to_file(file_path=file_path) == 3
+    with open(file_path) as file:
+        assert [json.loads(line)["id"] for line in file] == ["0", "1", "2"]
+
+    httpx_mock.add_response(method="GET", json={"status": {"success": False, "details": "Failed"}, "items": None})
+    with pytest.raises(Exception):
+        await admin.export_items_to_file(file_path=str(tmp_path / "failed.ndjson"))
+    assert not (tmp_path / "failed.ndjson").exists() and not (tmp_path / "failed.ndjson.partial").exists()
+
+
+"""Auth Token Validation Testing"""
+
+@pytest.fixture(scope="module")
+def rsa_keys() -> Any:
+    """An RSA key pair (public key PEM, private key PEM) for signing test JWTs."""
+    public_key, private_key = rsa.newkeys(1024)
+    return public_key.save_pkcs1().decode(), private_key.save_pkcs1().decode()
+
+def sign_token(private_key: str, expires_in: float) -> str:
+    """Signs a test access token expiring in the given number of seconds."""
+    return str(jwt.encode({"sub": "user", "exp": int(time.time() + expires_in)}, private_key, algorithm="RS256"))
+
+def test_validate_token_caches_verification(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that the RS256 verification only runs when the token changes, with expiry still enforced."""
+
+    public_key, private_key = rsa_keys
+    manager = MockedAuthService()
+    manager.logger = logging.getLogger("test-auth")
+
+    decodes = 0
+    decode = jwt.decode
+
+    def counting_decode(*args: Any, **kwargs: Any) -> Any:
+        nonlocal decodes
+        decodes += 1
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr("provenaclient.auth.helpers.jwt.decode", counting_decode)
+
+    token = sign_token(private_key, expires_in=300)
+    assert all(manager.validate_token(public_key=public_key, access_token=token) for _ in range(5))
+    assert decodes == 1, "Expected a single full verification of an unchanged token."
+
+    # a new token is fully verified
+    other_token = sign_token(private_key, expires_in=600)
+    assert manager.validate_token(public_key=public_key, access_token=other_token)
+    assert decodes == 2
+
+    # the cached expiry is still compared against the clock
+    now = time.time()
+    monkeypatch.setattr("provenaclient.auth.helpers.datetime", type("FrozenDatetime", (datetime,), {
+        "now": classmethod(lambda cls, tz=None: datetime.fromtimestamp(now + 590, tz))}))
+    assert not manager.validate_token(public_key=public_key, access_token=other_token)
+    assert decodes == 2
+
+    # tampered tokens fail verification
+    assert not manager.validate_token(public_key=public_key, access_token=token[:-4] + "abcd")
+
+
+def make_offline_flow(public_key: str, access_token: str) -> OfflineFlow:
+    """Builds an offline flow with the given keys and current token, without any network calls."""
+    flow = OfflineFlow.__new__(OfflineFlow)
+    flow.logger = logging.getLogger("test-auth")
+    flow.client_id = "client"
+    flow.scopes = []
+    flow.token_endpoint = "https://auth.example.com/token"
+    flow.offline_token = "offline-token"
+    flow.public_key = public_key
+    flow.tokens = AccessToken(access_token=access_token)
+    return flow
+
+@pytest.mark.asyncio
+async def test_async_token_refresh(httpx_mock: HTTPXMock, rsa_keys: Any) -> None:
+    """Tests that the async auth path refreshes an expiring token with the async http client."""
+
+    public_key, private_key = rsa_keys
+    # expires within the expiry window, so must be refreshed
+    flow = make_offline_flow(public_key, sign_token(private_key, expires_in=10))
+
+    fresh_token = sign_token(private_key, expires_in=300)
+    httpx_mock.add_response(method="POST", url=flow.token_endpoint, json={"access_token": fresh_token})
+
+    auth = await flow.async_get_auth()
+    assert auth.token == fresh_token
+    request = httpx_mock.get_request()
+    assert request is not None and b"refresh_token=offline-token" in request.content
+
+    # the fresh token is reused without another refresh
+    assert await flow.async_get_token() == fresh_token
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_refresh_single_flight(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that concurrent coroutines and threads which find the token stale trigger exactly one refresh."""
+
+    public_key, private_key = rsa_keys
+    refreshes = 0
+
+    async def async_refresh(**kwargs: Any) -> Any:
+        nonlocal refreshes
+        refreshes += 1
+        await asyncio.sleep(0.01)
+        return {"access_token": sign_token(private_key, expires_in=300)}
+
+    def sync_refresh(**kwargs: Any) -> Any:
+        nonlocal refreshes
+        refreshes += 1
+        time.sleep(0.01)
+        return {"access_token": sign_token(private_key, expires_in=300)}
+
+    monkeypatch.setattr("provenaclient.auth.implementations.async_keycloak_refresh_token_request", async_refresh)
+    monkeypatch.setattr("provenaclient.auth.implementations.keycloak_refresh_token_request", sync_refresh)
+
+    flow = make_offline_flow(public_key, sign_token(private_key, expires_in=10))
+    tokens = await asyncio.gather(*[flow.async_get_token() for _ in range(50)])
+    assert refreshes == 1 and len(set(tokens)) == 1
+
+    # threads share the same guarantee
+    refreshes = 0
+    flow = make_offline_flow(public_key, sign_token(private_key, expires_in=10))
+    tokens = await asyncio.gather(*[asyncio.to_thread(flow.get_token) for _ in range(8)])
+    assert refreshes == 1 and len(set(tokens)) == 1
+
+
+@pytest.mark.asyncio
+async def test_background_token_renewal(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that background renewal renews the token ahead of expiry and stops with the client lifecycle."""
+
+    public_key, private_key = rsa_keys
+    renewals = 0
+
+    async def async_refresh(**kwargs: Any) -> Any:
+        nonlocal renewals
+        renewals += 1
+        return {"access_token": sign_token(private_key, expires_in=300)}
+
+    monkeypatch.setattr("provenaclient.auth.implementations.async_keycloak_refresh_token_request", async_refresh)
+    monkeypatch.setattr("provenaclient.auth.manager.MIN_RENEWAL_INTERVAL", 0.01)
+
+    # valid now (outside the expiry window) but due for renewal almost immediately
+    initial_token = sign_token(private_key, expires_in=100)
+    flow = make_offline_flow(public_key, initial_token)
+    flow.renewal_margin = 99.9
+
+    async with ProvenaClient(auth=flow, config=Config(domain="dev.rrap-is.com", realm_name="rrap")):
+        await asyncio.sleep(0.5)
+        assert renewals == 1, "Expected a single renewal ahead of expiry."
+        assert flow.tokens.access_token != initial_token
+        task = flow._renewal_task
+        assert task is not None and not task.done()
+
+    assert task.done() and flow._renewal_task is None, "Expected renewal to stop when the client closes."
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_requires_renewal_support(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that background renewal fails fast, rather than retrying forever, for auth managers which cannot renew."""
+
+    monkeypatch.setattr("provenaclient.auth.manager.MIN_RENEWAL_INTERVAL", 0.01)
+    with pytest.raises(NotImplementedError):
+        MockedAuthService().start_background_renewal()
+
+    class DeferringAuthService(MockedAuthService):
+        async def async_renew_access_token(self) -> str:
+            return await super().async_renew_access_token()
+
+    auth = DeferringAuthService()
+    auth._verified = None
+    auth.logger = logging.getLogger("test-auth")
+    auth.start_background_renewal(margin=0)
+    task = auth._renewal_task
+    assert task is not None
+    await asyncio.wait_for(task, timeout=1)
+    assert task.exception() is None, "Expected the renewal loop to stop when renewal is unsupported."
+    await auth.stop_background_renewal()
+
+
+def test_public_key_cache_persistence_and_rotation(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> None:
+    """Tests that signing keys are served from disk on a cold start and refetched only for an unknown kid."""
+
+    old_public, old_private = rsa.newkeys(1024)
+    new_public, new_private = rsa.newkeys(1024)
+    realm_keys = {"old": old_public.save_pkcs1().decode()}
+    fetches = 0
+
+    def fetch_jwks(keycloak_endpoint: str, logger: Any) -> Any:
+        nonlocal fetches
+        fetches += 1
+        return dict(realm_keys)
+
+    monkeypatch.setattr("provenaclient.auth.key_cache.retrieve_keycloak_jwks", fetch_jwks)
+    settings = KeyCacheSettings(path=str(tmp_path / "keys.json"))
+    logger = logging.getLogger("test-auth")
+
+    first = PublicKeyCache(keycloak_endpoint="https://auth.example.com", settings=settings, logger=logger)
+    assert first.public_key_for("old") == realm_keys["old"]
+    assert fetches == 1
+
+    # a new process starts from the persisted keys without any network call
+    second = PublicKeyCache(keycloak_endpoint="https://auth.example.com", settings=settings, logger=logger)
+    assert second.public_key_for("old") == realm_keys["old"]
+    assert fetches == 1
+
+    # keycloak rotates its key - a token signed by the new kid triggers exactly one refetch
+    realm_keys["new"] = new_public.save_pkcs1().decode()
+    token = str(jwt.encode({"sub": "user", "exp": int(time.time() + 300)}, new_private.save_pkcs1().decode(), algorithm="RS256", headers={"kid": "new"}))
+    flow = make_offline_flow(realm_keys["old"], token)
+    flow.key_cache = second
+    assert flow.validate_token(public_key=flow.public_key, access_token=token)
+    assert flow.validate_token(public_key=flow.public_key, access_token=token)
+    assert fetches == 2
+
+
+def test_public_key_cache_reads_during_a_fetch(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that cached keys can be read while another thread is fetching from keycloak."""
+
+    public_key, _ = rsa_keys
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def fetch_jwks(keycloak_endpoint: str, logger: Any) -> Any:
+        if fetch_started.is_set():
+            # the second fetch (for the unknown key) is held until the read completes
+            release_fetch.wait(timeout=5)
+        fetch_started.set()
+        return {"old": public_key}
+
+    monkeypatch.setattr("provenaclient.auth.key_cache.retrieve_keycloak_jwks", fetch_jwks)
+    settings = KeyCacheSettings(persist=False, min_refetch_interval=0)
+    cache = PublicKeyCache(keycloak_endpoint="https://auth.example.com", settings=settings, logger=logging.getLogger("test-auth"))
+    assert cache.public_key_for("old") == public_key
+
+    fetching = threading.Thread(target=cache.public_key_for, args=("unknown",))
+    fetching.start()
+    time.sleep(0.1)
+    try:
+        started = time.monotonic()
+        assert cache.public_key_for("old") == public_key
+        assert time.monotonic() - started < 1, "Expected the cached key to be returned without waiting for the fetch."
+    finally:
+        release_fetch.set()
+        fetching.join()
+
+
+@pytest.mark.asyncio
+async def test_async_validate_token_fetches_keys_off_the_event_loop(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that a signing key fetch on the async token path runs in a worker thread, not on the event loop."""
+
+    public_key, private_key = rsa_keys
+    fetch_threads = []
+
+    def fetch_jwks(keycloak_endpoint: str, logger: Any) -> Any:
+        fetch_threads.append(threading.get_ident())
+        return {"key": public_key}
+
+    monkeypatch.setattr("provenaclient.auth.key_cache.retrieve_keycloak_jwks", fetch_jwks)
+    token = sign_token(private_key, expires_in=300)
+    flow = make_offline_flow(public_key, token)
+    flow.key_cache = PublicKeyCache(keycloak_endpoint="https://auth.example.com",
+                                    settings=KeyCacheSettings(persist=False), logger=logging.getLogger("test-auth"))
+
+    assert await flow.async_validate_token(public_key=public_key, access_token=token)
+    assert await flow.async_get_token() == token
+    assert len(fetch_threads) == 1, "Expected the cached keys to be reused."
+    assert fetch_threads[0] != threading.get_ident(), "Expected the keys to be fetched in a worker thread."
+
+
+@pytest.mark.asyncio
+async def test_shared_token_store_refreshes_once(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any, tmp_path: Any) -> None:
+    """Tests that auth managers sharing a file token store exchange the offline token only once between them."""
+
+    public_key, private_key = rsa_keys
+    exchanges = 0
+
+    async def async_refresh(**kwargs: Any) -> Any:
+        nonlocal exchanges
+        exchanges += 1
+        await asyncio.sleep(0.05)
+        return {"access_token": sign_token(private_key, expires_in=300)}
+
+    monkeypatch.setattr("provenaclient.auth.implementations.async_keycloak_refresh_token_request", async_refresh)
+
+    # each flow stands in for a separate worker process with its own (expired) token
+    store_path = str(tmp_path / "tokens.json")
+    workers = []
+    for _ in range(4):
+        flow = make_offline_flow(public_key, sign_token(private_key, expires_in=-10))
+        flow.token_store = FileTokenStore(store_path)
+        flow.token_store_key = "shared"
+        workers.append(flow)
+
+    tokens = await asyncio.gather(*[flow.async_get_token() for flow in workers])
+
+    assert exchanges == 1, "Expected a single offline token exchange across the workers."
+    assert len(set(tokens)) == 1
+    assert os.stat(store_path).st_mode & 0o077 == 0, "Expected the token file to be private to the user."
+    with open(store_path) as file:
+        assert "offline-token" not in file.read()
+
+
+def test_lazy_construction(monkeypatch: pytest.MonkeyPatch, rsa_keys: Any) -> None:
+    """Tests that lazy auth managers and the client make no network calls (or sub clients) until first used."""
+
+    public_key, private_key = rsa_keys
+    calls = []
+
+    def fetch_jwks(keycloak_endpoint: str, logger: Any) -> Any:
+        calls.append("jwks")
+        return {"key": public_key}
+
+    def exchange(**kwargs: Any) -> Any:
+        calls.append("exchange")
+        return {"access_token": sign_token(private_key, expires_in=300)}
+
+    monkeypatch.setattr("provenaclient.auth.key_cache.retrieve_keycloak_jwks", fetch_jwks)
+    monkeypatch.setattr("provenaclient.auth.implementations.keycloak_refresh_token_request", exchange)
+
+    config = Config(domain="example.com", realm_name="test", key_cache_settings=KeyCacheSettings(persist=False))
+    flow = OfflineFlow(config=config, client_id="client", offline_token="offline-token", lazy=True)
+    client = ProvenaClient(auth=flow, config=config)
+
+    assert calls == [], "Expected construction to make no network calls."
+    assert not {"registry", "search", "_registry_client"} & set(vars(client)), "Expected sub clients to be built on first access."
+
+    assert client.search._registry_client is client.registry._registry_client
+    assert "datastore" not in vars(client)
+
+    flow.get_token()
+    flow.get_token()
+    assert calls == ["jwks", "exchange"], "Expected the setup to run once on the first token request."
+
+
+"""Pagination Testing"""
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_without_mutating_request() -> None:
+    """Tests that the paginator prefetches the next page, honours total_limit and leaves the request untouched."""
+
+    pages = [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    requested = []
+
+    async def fetch_page(request: NoFilterSubtypeListRequest) -> Any:
+        index = request.pagination_key["page"] if request.pagination_key else 0
+        requested.append(index)
+        next_key = {"page": index + 1} if index + 1 < len(pages) else None
+        return SimpleNamespace(items=pages[index], pagination_key=next_key)
+
+    def get_items(page: Any) -> List[int]:
+        return list(page.items)
+
+    request = NoFilterSubtypeListRequest(sort_by=None, pagination_key=None, page_size=3)
+
+    consumed = []
+    async for item in paginate(request=request, fetch_page=fetch_page, get_items=get_items, prefetch=2):
+        if item == 1:
+            # give the producer a chance to run ahead while the first page is processed
+            await asyncio.sleep(0.01)
+            assert requested[:2] == [0, 1], "Expected the next page to be prefetched."
+        consumed.append(item)
+
+    assert consumed == list(range(1, 11))
+    assert request.pagination_key is None, "Expected the request not to be mutated."
+
+    requested.clear()
+    limited = [item async for item in paginate(request=request, fetch_page=fetch_page, get_items=get_items, prefetch=0, total_limit=5)]
+    assert limited == [1, 2, 3, 4, 5]
+    assert requested == [0, 1], "Expected no pages to be fetched beyond the limit."
+
+    async def fetch_last_page(request: NoFilterSubtypeListRequest) -> Any:
+        requested.append(request.pagination_key)
+        return SimpleNamespace(items=[1], pagination_key={})
+
+    # an empty pagination key marks the last page, as it did for the original list loops
+    requested.clear()
+    assert [item async for item in paginate(request=request, fetch_page=fetch_last_page, get_items=get_items)] == [1]
+    assert requested == [None]
+
+
+@pytest.mark.asyncio
+async def test_count_registry_items(httpx_mock: HTTPXMock) -> None:
+    """Tests that registry items are counted per subtype from raw pages, with progress reported."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    auth = MockedAuthService()
+    registry = Registry(auth=auth, config=config, registry_client=RegistryClient(auth, config))
+    totals = {ItemSubType.ORGANISATION: 5, ItemSubType.PERSON: 2, ItemSubType.MODEL: 0}
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        subtype = ItemSubType(body["filter_by"]["item_subtype"])
+        start = body["pagination_key"]["offset"] if body.get("pagination_key") else 0
+        end = min(start + body["page_size"], totals[subtype])
+        # items deliberately don't match any registry model - they must never be parsed
+        return httpx.Response(200, json={"status": {"success": True, "details": "OK"},
+                                         "items": [{"n": n} for n in range(start, end)],
+                                         "pagination_key": {"offset": end} if end < totals[subtype] else None})
+
+    httpx_mock.add_callback(respond)
+
+    reports: List[RegistryCountProgress] = []
+    counts = await registry.count_registry_items(item_subtypes=list(totals), page_size=2, progress=reports.append)
+
+    assert counts == totals
+    assert len(httpx_mock.get_requests()) == 3 + 1 + 1
+    assert {report.item_subtype for report in reports if report.complete} == set(totals)
+    assert max(report.total for report in reports) == 7
+
+
+@pytest.mark.asyncio
+async def test_list_registry_items_with_count_unknown(httpx_mock: HTTPXMock) -> None:
+    """Tests that items without a subtype are counted as UNKNOWN by one unfiltered walk, and that failures are raised."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    auth = MockedAuthService()
+    registry = Registry(auth=auth, config=config, registry_client=RegistryClient(auth, config))
+    items = [{"item_subtype": "ORGANISATION"}, {"item_subtype": "PERSON"}, {"item_subtype": "ORGANISATION"}, {"id": "no-subtype"}]
+    pages = [items[:3], items[3:]]
+    failing = False
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert "item_subtype" not in body["filter_by"], "Expected a single unfiltered walk."
+        if failing:
+            return httpx.Response(200, json={"status": {"success": False, "details": "Failed"}})
+        index = body["pagination_key"]["page"] if body.get("pagination_key") else 0
+        return httpx.Response(200, json={"status": {"success": True, "details": "OK"}, "items": pages[index],
+                                         "pagination_key": {"page": index + 1} if index + 1 < len(pages) else None})
+
+    httpx_mock.add_callback(respond)
+
+    assert await registry.list_registry_items_with_count() == {"ORGANISATION": 2, "PERSON": 1, "UNKNOWN": 1}
+    assert len(httpx_mock.get_requests()) == 2
+
+    failing = True
+    with pytest.raises(Exception, match="indicated failure"):
+        await registry.list_registry_items_with_count()
+
+
+@pytest.mark.asyncio
+async def test_registry_mirror_incremental_sync(httpx_mock: HTTPXMock, tmp_path: Any) -> None:
+    """Tests that the registry mirror bulk loads, then only fetches changed items, and that a full sync removes deleted items."""
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    auth = MockedAuthService()
+    registry = Registry(auth=auth, config=config, registry_client=RegistryClient(auth, config))
+    items: Dict[str, Dict[str, Any]] = {
+        f"org-{n}": {"id": f"org-{n}", "item_subtype": "ORGANISATION", "display_name": f"Org {n}",
+                     "owner_username": "alice" if n % 2 else "bob", "created_timestamp": n, "updated_timestamp": 100 + n}
+        for n in range(6)
+    }
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert body["sort_by"]["sort_type"] == "UPDATED_TIME" and not body["sort_by"]["ascending"]
+        ordered = sorted((item for item in items.values() if item["item_subtype"] == body["filter_by"]["item_subtype"]),
+                         key=lambda item: -item["updated_timestamp"])
+        start = body["pagination_key"]["offset"] if body.get("pagination_key") else 0
+        end = min(start + body["page_size"], len(ordered))
+        return httpx.Response(200, json={"status": {"success": True, "details": "OK"}, "items": ordered[start:end],
+                                         "pagination_key": {"offset": end} if end < len(ordered) else None})
+
+    httpx_mock.add_callback(respond)
+    mirror = registry.mirror(path=str(tmp_path / "mirror.sqlite"))
+
+    result = await mirror.sync(item_subtypes=[ItemSubType.ORGANISATION, ItemSubType.PERSON], page_size=2, prefetch=0)
+    assert result.subtypes[ItemSubType.ORGANISATION].full and result.subtypes[ItemSubType.ORGANISATION].written == 6
+    assert mirror.count() == 6 and mirror.count(owner_username="alice") == 3
+    assert mirror.synced_until()[ItemSubType.ORGANISATION] == 105
+    requests_after_load = len(httpx_mock.get_requests())
+
+    # one item changes and another is deleted - the walk stops at the first page older than the last sync
+    items["org-0"] = {**items["org-0"], "display_name": "Renamed", "updated_timestamp": 200}
+    del items["org-3"]
+    result = await mirror.sync(item_subtypes=[ItemSubType.ORGANISATION], page_size=2, prefetch=0)
+    assert not result.subtypes[ItemSubType.ORGANISATION].full
+    assert len(httpx_mock.get_requests()) == requests_after_load + 2
+    assert (mirror.get("org-0") or {})["display_name"] == "Renamed"
+    assert [item["id"] for item in mirror.query(display_name_prefix="Org", limit=2)] == ["org-5", "org-4"]
+    assert mirror.get("org-3") is not None
+
+    result = await mirror.sync(item_subtypes=[ItemSubType.ORGANISATION], full=True, page_size=2)
+    assert result.subtypes[ItemSubType.ORGANISATION].removed == 1
+    assert mirror.get("org-3") is None and mirror.count(item_subtype=ItemSubType.ORGANISATION) == 5
+    mirror.close()
+
+
+def test_s3_transfer_engine_parallel_upload_with_retry(tmp_path: Any) -> None:
+    """Tests that the transfer engine uploads a directory concurrently, in parts above the threshold, retrying failed files."""
+
+    source = tmp_path / "outputs"
+    (source / "nested").mkdir(parents=True)
+    for n in range(8):
+        (source / f"small-{n}.csv").write_text("a,b\n" * n)
+    (source / "nested" / "large.bin").write_bytes(b"x" * 2048)
+
+    class RecordingS3Client:
+        def __init__(self) -> None:
+            self.lock = threading.Lock()
+            self.objects: Dict[str, int] = {}
+            self.multipart: List[str] = []
+            self.attempts: Dict[str, int] = {}
+            self.in_flight = 0
+            self.peak = 0
+
+        def _record(self, key: str, size: int) -> None:
+            with self.lock:
+                self.attempts[key] = self.attempts.get(key, 0) + 1
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                first_attempt = self.attempts[key] == 1
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight -= 1
+            if key.endswith("small-3.csv") and first_attempt:
+                raise ConnectionError("connection reset")
+            self.objects[key] = size
+
+        def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> None:
+            self._record(Key, len(Body.read()))
+
+        def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs: Any = None, Config: Any = None) -> None:
+            assert Config.multipart_chunksize == 512
+            self.multipart.append(Key)
+            self._record(Key, os.path.getsize(Filename))
+
+    client = RecordingS3Client()
+    settings = TransferSettings(workers=4, multipart_threshold=1024, part_size=512, backoff_base=0.0)
+    engine = S3TransferEngine(client=client, bucket="bucket", settings=settings)
+    report = engine.upload(local_upload_transfers(source=str(source), key_prefix="datasets/abc/"))
+
+    assert not report.failed and len(report.transferred) == 9
+    assert client.objects["datasets/abc/nested/large.bin"] == 2048
+    assert client.multipart == ["datasets/abc/nested/large.bin"]
+    assert client.attempts["datasets/abc/small-3.csv"] == 2
+    assert report.bytes_transferred == sum(client.objects.values())
+    assert client.peak > 1
+
+    # a file which keeps failing is reported without stopping the others
+    settings = TransferSettings(workers=4, max_attempts=1)
+    client = RecordingS3Client()
+    report = S3TransferEngine(client=client, bucket="bucket", settings=settings).upload(local_upload_transfers(source=str(source), key_prefix=""))
+    assert [failure.transfer.key for failure in report.failed] == ["small-3.csv"] and len(report.transferred) == 8
+
+
+def test_s3_transfer_engine_lists_once_and_downloads_in_parallel(tmp_path: Any) -> None:
+    """Tests that the transfer engine lists a prefix once (skipping folder markers) and downloads large objects with ranged GETs."""
+
+    contents = {f"datasets/abc/data/part-{n}.csv": f"row {n}\n".encode() for n in range(6)}
+    contents["datasets/abc/model/weights.bin"] = b"w" * 4096
+    # a sibling dataset whose key starts with the same characters
+    contents["datasets/abcd/other.csv"] = b"other"
+
+    class ListingS3Client:
+        def __init__(self) -> None:
+            self.lock = threading.Lock()
+            self.listings = 0
+            self.ranged: List[str] = []
+
+        def get_paginator(self, operation: str) -> Any:
+            assert operation == "list_objects_v2"
+            client = self
+
+            class Paginator:
+                def paginate(self, Bucket: str, Prefix: str) -> Any:
+                    client.listings += 1
+                    keys = sorted(key for key in contents if key.startswith(Prefix)) + ["datasets/abc/empty-folder/"]
+                    for start in range(0, len(keys), 3):
+                        yield {"Contents": [{"Key": key, "Size": len(contents.get(key, b"")), "ETag": '"etag"',
+                                             "LastModified": datetime.fromtimestamp(1000)} for key in keys[start:start + 3]]}
+            return Paginator()
+
+        def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+            body = contents[Key]
+            return {"Body": SimpleNamespace(iter_chunks=lambda size: (body[i:i + size] for i in range(0, len(body), size)))}
+
+        def download_file(self, Bucket: str, Key: str, Filename: str, Config: Any = None) -> None:
+            with self.lock:
+                self.ranged.append(Key)
+            with open(Filename, "wb") as file:
+                file.write(contents[Key])
+
+    client = ListingS3Client()
+    engine = S3TransferEngine(client=client, bucket="bucket", settings=TransferSettings(workers=4, multipart_threshold=1024))
+    objects = engine.list_objects(prefix=folder_key_prefix("datasets/abc"))
+    assert client.listings == 1 and len(objects) == 7 and objects[0].last_modified == 1000
+    with pytest.raises(ValueError):
+        local_download_transfers(objects=engine.list_objects(prefix="datasets/abc"), key_prefix="datasets/abc", destination=str(tmp_path))
+
+    report = engine.download(local_download_transfers(objects=objects, key_prefix="datasets/abc", destination=str(tmp_path)))
+    assert not report.failed and report.bytes_transferred == sum(len(contents[info.key]) for info in objects)
+    assert (tmp_path / "data" / "part-3.csv").read_bytes() == b"row 3\n"
+    assert (tmp_path / "model" / "weights.bin").stat().st_size == 4096
+    assert client.ranged == ["datasets/abc/model/weights.bin"]
+    assert not list(tmp_path.glob("**/*.partial"))
+
+
+@pytest.mark.asyncio
+async def test_sync_up_and_down_transfer_only_changes(tmp_path: Any) -> None:
+    """Tests that dataset syncs compare size/mtime/ETag, only transfer new or changed files, report dry runs and delete extraneous files."""
+
+    class InMemoryS3Client:
+        def __init__(self) -> None:
+            self.objects: Dict[str, Tuple[bytes, datetime]] = {}
+            self.puts: List[str] = []
+
+        def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> None:
+            self.puts.append(Key)
+            self.objects[Key] = (Body.read(), datetime.now())
+
+        def get_paginator(self, operation: str) -> Any:
+            objects = self.objects
+
+            class Paginator:
+                def paginate(self, Bucket: str, Prefix: str) -> Any:
+                    yield {"Contents": [{"Key": key, "Size": len(body), "ETag": f'"{hashlib.md5(body).hexdigest()}"', "LastModified": modified}
+                                        for key, (body, modified) in sorted(objects.items()) if key.startswith(Prefix)]}
+            return Paginator()
+
+        def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+            body = self.objects[Key][0]
+            return {"Body": SimpleNamespace(iter_chunks=lambda size: iter([body]))}
+
+        def delete_objects(self, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+            for entry in Delete["Objects"]:
+                del self.objects[entry["Key"]]
+            return {}
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap")
+    io = IOSubModule(auth=MockedAuthService(), config=config, datastore_client=None)  # type: ignore
+    client = InMemoryS3Client()
+    engine = S3TransferEngine(client=client, bucket="bucket", settings=TransferSettings(workers=2))
+
+    # the dataset key has no trailing slash, and a sibling dataset shares its leading characters
+    access = S3Access(path=S3Path("s3://bucket/datasets/abc", client=S3Client(aws_access_key_id="id", aws_secret_access_key="secret")),
+                      expiry=datetime.now(timezone.utc) + timedelta(hours=1))
+    client.objects["datasets/abcd/keep.txt"] = (b"sibling", datetime.now())
+    io._s3_access_cache[("abc", AccessEnum.READ)] = access
+    io._s3_access_cache[("abc", AccessEnum.WRITE)] = access
+    io._transfer_engine = lambda access, transfer_settings: engine  # type: ignore
+
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        (source / name).write_text(f"content of {name}")
+    past = time.time() - 3600
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        os.utime(source / name, (past, past))
+
+    first = await io.sync_up(source_directory=str(source), dataset_id="abc")
+    assert len(first.planned_transfers) == 3 and len(client.puts) == 3
+
+    # one file changes, one is added and one removed locally
+    (source / "b.txt").write_text("new content of b.txt")
+    (source / "d.txt").write_text("d")
+    (source / "c.txt").unlink()
+    plan = await io.sync_up(source_directory=str(source), dataset_id="abc", delete=True, dry_run=True)
+    assert plan.dry_run and plan.transfer is None and plan.unchanged == 1
+    assert sorted(transfer.key for transfer in plan.planned_transfers) == ["datasets/abc/b.txt", "datasets/abc/d.txt"]
+    assert plan.planned_deletions == ["datasets/abc/c.txt"] and "datasets/abc/c.txt" in client.objects
+
+    synced = await io.sync_up(source_directory=str(source), dataset_id="abc", delete=True, checksum=True)
+    assert synced.unchanged == 1 and synced.deleted == ["datasets/abc/c.txt"]
+    assert sorted(client.objects) == ["datasets/abc/a.txt", "datasets/abc/b.txt", "datasets/abc/d.txt", "datasets/abcd/keep.txt"]
+
+    destination = tmp_path / "destination"
+    (destination / "old").mkdir(parents=True)
+    (destination / "old" / "stale.txt").write_text("stale")
+    down = await io.sync_down(destination_directory=str(destination), dataset_id="abc", delete=True)
+    assert len(down.planned_transfers) == 3 and (destination / "b.txt").read_text() == "new content of b.txt"
+    assert down.deleted == [str(destination / "old" / "stale.txt")]
+
+    again = await io.sync_down(destination_directory=str(destination), dataset_id="abc", checksum=True)
+    assert again.unchanged == 3 and not again.planned_transfers
+
+
+@pytest.mark.asyncio
+async def test_s3_access_cached_per_dataset_and_access_type() -> None:
+    """Tests that dataset locations, credentials and clients are reused across IO calls and credentials renewed before expiry."""
+
+    calls: List[str] = []
+    lifetime = timedelta(hours=1)
+
+    class DatastoreClient:
+        async def fetch_dataset(self, id: str) -> Any:
+            calls.append(f"fetch {id}")
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(item=SimpleNamespace(s3=SimpleNamespace(s3_uri=f"s3://bucket/datasets/{id}/")))
+
+        def _creds(self, kind: str) -> Any:
+            calls.append(kind)
+            return SimpleNamespace(credentials=SimpleNamespace(
+                aws_access_key_id="id", aws_secret_access_key="secret", aws_session_token="token",
+                expiry=datetime.now(timezone.utc) + lifetime,
+                dict=lambda: {"aws_access_key_id": "id", "aws_secret_access_key": "secret", "aws_session_token": "token", "expiry": None}))
+
+        async def generate_read_access_credentials(self, read_access_credentials: Any) -> Any:
+            return self._creds("read")
+
+        async def generate_write_access_credentials(self, write_access_credentials: Any) -> Any:
+            return self._creds("write")
+
+    config = Config(domain="dev.rrap-is.com", realm_name="rrap", transfer_settings=TransferSettings(credential_renewal_margin=300))
+    io = IOSubModule(auth=MockedAuthService(), config=config, datastore_client=DatastoreClient())  # type: ignore
+
+    paths = await asyncio.gather(*[io._create_s3_path(dataset_id="abc", access_type=AccessEnum.READ) for _ in range(5)])
+    assert calls == ["fetch abc", "read"] and all(path.client is paths[0].client for path in paths)
+    write_path = await io._create_s3_path(dataset_id="abc", access_type=AccessEnum.WRITE)
+    assert calls == ["fetch abc", "read", "write"] and write_path.client is not paths[0].client
+
+    access = await io._s3_access(dataset_id="abc", access_type=AccessEnum.READ)
+    assert access.transfer_client(TransferSettings()) is access.transfer_client(TransferSettings())
+
+    # credentials within the renewal margin are renewed - without fetching the dataset again
+    access.expiry = datetime.now(timezone.utc) + timedelta(seconds=60)
+    renewed = await io._create_s3_path(dataset_id="abc", access_type=AccessEnum.READ)
+    assert calls == ["fetch abc", "read", "write", "read"] and renewed.client is not paths[0].client
+
+    # a later event loop (e.g. another asyncio.run) gets its own locks rather than those bound to this loop
+    (await io._s3_access(dataset_id="abc", access_type=AccessEnum.READ)).expiry = datetime.now(timezone.utc)
+
+    async def renew_in_new_loop() -> List[S3Path]:
+        return list(await asyncio.gather(*[io._create_s3_path(dataset_id="abc", access_type=AccessEnum.READ) for _ in range(3)]))
+
+    assert len(await asyncio.to_thread(asyncio.run, renew_in_new_loop())) == 3
+    assert calls[-1] == "read" and calls.count("read") == 3
+
+    io.clear_s3_access_cache(dataset_id="abc")
+    assert not any(key[0] == "abc" for key in io._s3_access_locks)
+    await io._create_s3_path(dataset_id="abc", access_type=AccessEnum.READ)
+    assert calls[-2:] == ["fetch abc", "read"]
+
+
+@pytest.mark.asyncio
+async def test_io_transfers_do_not_block_event_loop(tmp_path: Any) -> None:
+    """Tests that blocking S3 work of the async IO methods runs in the sub module's thread pool while other coroutines progress."""
+
+    threads: List[str] = []
+
+    class SlowS3Client:
+        def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> None:
+            time.sleep(0.2)
+
+    def transfer_engine(access: S3Access, transfer_settings: Any) -> S3TransferEngine:
+        threads.append(threading.current_thread().name)
+        return S3TransferEngine(client=SlowS3Client(), bucket="bucket", settings=TransferSettings(workers=1))
+
+    io = IOSubModule(auth=MockedAuthService(), config=Config(domain="dev.rrap-is.com", realm_name="rrap"), datastore_client=None)  # type: ignore
+    io._s3_access_cache[("abc", AccessEnum.WRITE)] = S3Access(
+        path=S3Path("s3://bucket/datasets/abc/", client=S3Client(aws_access_key_id="id", aws_secret_access_key="secret")),
+        expiry=datetime.now(timezone.utc) + timedelta(hours=1))
+    io._transfer_engine = transfer_engine  # type: ignore
+    (tmp_path / "a.txt").write_text("a")
+
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    report = await io.upload_all_files(source_directory=str(tmp_path), dataset_id="abc")
+    task.cancel()
+
+    assert len(report.transferred) == 1
+    assert ticks >= 5, "The event loop was blocked by the upload."
+    assert threads and threads[0].startswith("provena-io")
+    io.close()
+
+
 """Standard Model Response and Status Response Model Testing"""
 
 # Test successful GET request with standard model
@@ -534,6 +1868,36 @@ async def test_successful_get_request_standard_model(httpx_mock: HTTPXMock, clie
     assert result == response_model, "The response does not match the expected response model."
     assert result != response_model_two, "The response incorrectly matches an unintended response model."
 
+@pytest.mark.asyncio
+async def test_request_uses_client_transport(httpx_mock: HTTPXMock, client_service: MockedClientService) -> None:
+    """Tests that the L2 helpers send requests through the client's shared transport when one is injected.
+
+    Parameters
+    ----------
+    httpx_mock : HTTPXMock
+        The mock for HTTPX requests to simulate server responses.
+    client_service : MockedClientService
+        The mocked client service used to make HTTP requests.
+    """
+
+    url = "http://example.com/api"
+    response_model = MockResponseModel(bar = "example_return_value")
+    transport = HttpTransport()
+    client_service._transport = transport
+
+    httpx_mock.add_response(method="GET", url=url, json=response_model.dict(), status_code=200)
+    httpx_mock.add_response(method="POST", url=url, json=response_model.dict(), status_code=200)
+
+    result = await parsed_get_request(client=client_service, url=url, params=None, model=MockResponseModel, error_message="Error occurred")
+    assert result == response_model
+    pooled_client = transport.get_client()
+
+    result = await parsed_post_request(client=client_service, url=url, params=None, json_body=None, model=MockResponseModel, error_message="Error occurred")
+    assert result == response_model
+    assert transport.get_client() is pooled_client, "Expected the L2 helpers to share the pooled client."
+
+    await transport.aclose()
+
 # Test successful GET request with StatusResponse
 @pytest.mark.asyncio
 async def test_successful_get_request_status_response(httpx_mock: HTTPXMock, client_service: MockedClientService) -> None: